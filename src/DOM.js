@@ -1,4 +1,5 @@
 import * as Logging from './utils/logging.js';
+import LayoutProfiler from './layoutProfiler.js';
 
 export default class DocumentObjectModel {
 
@@ -12,6 +13,16 @@ export default class DocumentObjectModel {
     this._debug = config.debugMode ? { ...config.debugConfig.DOM } : {};
     this._assert = config.consoleAssert ? true : false;
     Object.assign(this, Logging);
+
+    // * Number of child-list writes made through these helpers, per parent
+    // * (see getChildListVersion()).
+    this._childListVersions = new WeakMap();
+    // * Number of child-list writes in the whole document (see getChildListEpoch()).
+    this._childListEpoch = 0;
+
+    // * data-layout-profile="true": reads and writes are counted
+    // * (see layoutProfiler.js); null otherwise.
+    this.profiler = config.layoutProfile ? new LayoutProfiler().instrument(this) : null;
   }
 
   // CREATE ELEMENTS
@@ -36,21 +47,25 @@ export default class DocumentObjectModel {
 
   insertBefore(element, ...payload) {
     const cleanPayload = payload.filter(el => el != null);
+    this._touchChildLists(element.parentNode, cleanPayload);
     element.before(...cleanPayload);
   }
 
   insertAfter(element, ...payload) {
     const cleanPayload = payload.filter(el => el != null);
+    this._touchChildLists(element.parentNode, cleanPayload);
     element.after(...cleanPayload);
   }
 
   insertAtEnd(element, ...payload) {
     const cleanPayload = payload.filter(el => el != null);
+    this._touchChildLists(element, cleanPayload);
     element.append(...cleanPayload);
   }
 
   insertAtStart(element, ...payload) {
     const cleanPayload = payload.filter(el => el != null);
+    this._touchChildLists(element, cleanPayload);
     element.prepend(...cleanPayload);
   }
 
@@ -60,12 +75,16 @@ export default class DocumentObjectModel {
   }
 
   wrap(element, wrapper) {
+    this._touchChildLists(element.parentNode, [wrapper]);
+    this._touchChildLists(wrapper);
     element.before(wrapper);
     wrapper.append(element);
     return wrapper;
   }
 
   moveContent(source, target) {
+    this._touchChildLists(source);
+    this._touchChildLists(target);
     while (source.firstChild) {
       target.append(source.firstChild);
     }
@@ -109,9 +128,32 @@ export default class DocumentObjectModel {
   // REMOVE
 
   removeNode(element) {
+    this._touchChildLists(element.parentNode);
     element.remove();
   }
 
+  // * Child lists changed by html2pdf4doc: a version per parent,
+  // * for the caches of the children (see node/cache/childrenCache.js).
+  getChildListVersion(element) {
+    return this._childListVersions.get(element) || 0;
+  }
+
+  // * Changes with every child-list write made through these helpers,
+  // * for the caches that depend on more than one child list (see node/cache/chainCache.js).
+  getChildListEpoch() {
+    return this._childListEpoch;
+  }
+
+  _touchChildLists(parent, movedNodes = []) {
+    this._childListEpoch += 1;
+    parent && this._childListVersions.set(parent, this.getChildListVersion(parent) + 1);
+    for (const node of movedNodes) {
+      const previousParent = node.parentNode;
+      previousParent && previousParent !== parent
+        && this._childListVersions.set(previousParent, this.getChildListVersion(previousParent) + 1);
+    }
+  }
+
   // GET ELEMENT
 
   getAll(selectors, target = this.document) {
@@ -158,6 +200,15 @@ export default class DocumentObjectModel {
     return item.previousElementSibling
   }
 
+  // Nodes (text nodes included) from `first` up to, but not including, `next`.
+  getSiblingsUntil(first, next) {
+    const nodes = [];
+    for (let item = first; item && item !== next; item = item.nextSibling) {
+      nodes.push(item);
+    }
+    return nodes;
+  }
+
   getParentNode(element) {
     return element.parentElement;
   }
@@ -392,6 +443,7 @@ export default class DocumentObjectModel {
   }
 
   setInnerHTML(selector, html) {
+    typeof selector !== 'string' && this._touchChildLists(selector);
 
     if (typeof selector === 'string') {
       const source = this.document.querySelector(selector);
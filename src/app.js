@@ -8,15 +8,24 @@ import Paper from './paper.js';
 import Preview from './preview.js';
 import Toc from './toc.js';
 import Validator from './validator.js';
+import LayoutReport from './layoutReport.js';
+import PreviewVirtualizer from './previewVirtualizer.js';
+import Style from './style.js';
 import Preloader from './preloader.js';
 import Preprocess from './preprocess/index.js';
+import UserTiming from './userTiming.js';
+import MemorySnapshots from './memorySnapshots.js';
+import Compaction from './compaction.js';
+import Snapshot from './snapshot.js';
 import isTruthy from './utils/isTruthy.js';
 import buildAppConfig from './appConfig.js';
 import { normalizeLegacyConfigParams } from './config.js';
 import { forceLayoutParticipation } from './utils/forceLayoutParticipation.js';
 import { createMutationQueue } from './mutations/queue.js';
+import { BREAK_PLAN_STATUS_ATTR, loadBreakPlan } from './pages/breakPlan.js';
 
 const CONSOLE_CSS_LABEL = `color:Gray;border:1px solid;`
+const PAGE_ESTIMATE_ATTR = 'html2pdf4doc-estimated-pages';
 
 export default class App {
   constructor(params) {
@@ -26,9 +35,104 @@ export default class App {
     this.preloader = params.preloader;
     this.selector = SELECTOR;
     this.config;
+    // * Rendering results kept for getLayoutReport(), set once [success] is set.
+    this._rendered = null;
+    // * data-page-estimate: set before the pagination (see pages/pageEstimate.js).
+    this._pageEstimate = null;
+    // * data-layout-profile (see layoutProfiler.js).
+    this._layoutProfiler = null;
+    // * data-memory-snapshots (see memorySnapshots.js).
+    this._memorySnapshots = null;
+    // * data-compact-dom (see compaction.js).
+    this._compactionStats = null;
   }
 
-  async render() {
+  getMemorySnapshots() {
+    return this._memorySnapshots ? [...this._memorySnapshots.snapshots] : null;
+  }
+
+  getLayoutProfile() {
+    return this._layoutProfiler ? this._layoutProfiler.getSummary() : null;
+  }
+
+  getPageEstimate() {
+    return this._pageEstimate ? { ...this._pageEstimate } : null;
+  }
+
+  getBreakPlan() {
+    return this._rendered ? this._rendered.paginator.breakPlan : null;
+  }
+
+  getPrintConfig() {
+    if (!this.config) {
+      return null;
+    }
+    // * Numbers in CSS px, as the @page rule of the document uses them.
+    const pageBox = new Style(this.config).pageBox();
+    return Object.fromEntries(
+      Object.entries(pageBox).map(([key, value]) => [key, parseFloat(value) || 0])
+    );
+  }
+
+  // * Creates the page chrome of a virtualized preview (data-virtual-preview)
+  // * for all pages, before printing with CDP (see index.js).
+  preparePrint() {
+    this._rendered?.virtualizer?.materializeAll();
+  }
+
+  getLayoutReport() {
+    if (!this._rendered) {
+      return null;
+    }
+    const { DOM, node, layout, pageCount, paginator, validator } = this._rendered;
+    // * The report reads the page chrome of every page.
+    return this._withAllPageChromes(() => new LayoutReport({
+      selector: this.selector,
+      DOM,
+      node,
+      layout,
+      pageCount,
+      validator,
+      paginationStats: {
+        chainCache: paginator.chainCacheStats,
+        preparedChildrenCache: node.getPreparedChildrenCacheStats(),
+        forcedPageBreakIndex: paginator.forcedPageBreakStats,
+        siblingGallop: paginator.gallopStats,
+        inlineMediaGaps: paginator.inlineMediaGapsStats,
+        finalizedContent: paginator.finalizedContentStats,
+        compaction: this._compactionStats,
+      },
+      memorySnapshots: this.getMemorySnapshots(),
+    }).create());
+  }
+
+  getStaticSnapshot() {
+    if (!this._rendered) {
+      return null;
+    }
+    // * The snapshot is printed as is: it needs the page chrome of every page.
+    return this._withAllPageChromes(() => new Snapshot({
+      DOM: this._rendered.DOM,
+      printConfig: this.getPrintConfig(),
+    }).create());
+  }
+
+  // * A virtualized preview (data-virtual-preview) gets the page chrome of every
+  // * page for the callback only, and stays virtualized (see previewVirtualizer.js).
+  _withAllPageChromes(callback) {
+    const { virtualizer } = this._rendered;
+    return virtualizer ? virtualizer.withAllMaterialized(callback) : callback();
+  }
+
+  getOutline() {
+    return this._rendered ? this._rendered.toc.getOutline() : null;
+  }
+
+  async render(params = {}) {
+    // * Parameters passed to init() in manual initialization mode
+    // * override the data-* attributes of the script tag.
+    this.params = { ...this.params, ...params };
+
     console.time("[HTML2PDF4DOC] Total time");
 
     forceLayoutParticipation();
@@ -85,6 +189,20 @@ export default class App {
       DOM: window.document,
       config: this.config,
     });
+    this._layoutProfiler = DOM.profiler;
+    // * data-user-timing (see userTiming.js).
+    const timing = new UserTiming(this.config.userTiming);
+    // * data-memory-snapshots: the snapshots are also marked in the performance timeline.
+    const memory = new MemorySnapshots({
+      DOM,
+      selector: this.selector,
+      isEnabled: this.config.memorySnapshots,
+    });
+    this._memorySnapshots = memory.isEnabled ? memory : null;
+    const takeMemorySnapshot = (stage) => {
+      const snapshot = memory.take(stage);
+      snapshot && timing.mark(`memory:${stage}`, snapshot);
+    };
     this.debugMode && console.timeEnd("⏱️ DOM helpers init time");
 
     this.debugMode && console.time("⏱️ node helpers init time");
@@ -112,6 +230,8 @@ export default class App {
 
     // * prepare layout (DOM manipulation)
 
+    DOM.profiler?.setStage('Layout');
+    timing.setStage('Layout');
     this.debugMode && console.time("⏱️ Layout time");
     this.debugMode && console.groupCollapsed('%c Layout ', CONSOLE_CSS_LABEL);
     const layout = new Layout({
@@ -129,8 +249,11 @@ export default class App {
     } else {
       // this.debugMode && console.log('🚩 layout.success:', layout.success);
     }
+    takeMemorySnapshot('Layout');
 
     // * ensure fonts and external resources are ready for stable layout
+    DOM.profiler?.setStage('Preprocess');
+    timing.setStage('Preprocess');
     this.debugMode && console.time("⏱️ Preprocess time");
     this.debugMode && console.groupCollapsed('%c Preprocess ', CONSOLE_CSS_LABEL);
     await new Preprocess(this.config, DOM).run();
@@ -139,6 +262,8 @@ export default class App {
 
     // * calculate and prepare 'paper'
     this.debugMode && console.info('%c calculate Paper params ', CONSOLE_CSS_LABEL);
+    DOM.profiler?.setStage('Paper');
+    timing.setStage('Paper');
     this.debugMode && console.time("⏱️ Paper time");
     const paper = new Paper({
       config: this.config,
@@ -157,11 +282,14 @@ export default class App {
 
     // * calculate pages (DOM manipulation)
 
+    DOM.profiler?.setStage('Pages');
+    timing.setStage('Pages');
     this.debugMode && console.time("⏱️ Pages time");
     this.debugMode && console.group('%c Pages ', CONSOLE_CSS_LABEL); // Collapsed
     // Defer selected DOM writes from pagination and apply them in Preview stage.
     const mutationQueue = createMutationQueue();
-    const pages = new Pages({
+    const breakPlan = await loadBreakPlan(this.config.breakPlan);
+    const paginator = new Pages({
       config: this.config,
       DOM: DOM,
       selector: this.selector,
@@ -170,14 +298,42 @@ export default class App {
       referenceHeight: paper.bodyHeight,
       referenceWidth: paper.bodyWidth,
       mutationQueue,
-    }).calculate();
+      breakPlan,
+    });
+
+    // * data-page-estimate="only": the page count is estimated
+    // * without the pagination, the preview is not built.
+    if (String(this.config.pageEstimate).toLowerCase() === 'only') {
+      this._pageEstimate = paginator.estimate();
+      this.debugMode && console.groupEnd();
+      this.debugMode && console.timeEnd("⏱️ Pages time");
+      DOM.setAttribute(layout.root, `[${PAGE_ESTIMATE_ATTR}]`, this._pageEstimate.pages);
+      timing.setStage(null);
+      preloader.remove();
+      console.info(`[HTML2PDF4DOC] Estimated page count:`, this._pageEstimate.pages);
+      console.timeEnd("[HTML2PDF4DOC] Total time");
+      return;
+    }
+
+    const pages = paginator.calculate();
+    this._pageEstimate = paginator.pageEstimate;
+    this.debugMode && this._pageEstimate && console.info('📏 estimated page count:', this._pageEstimate);
+    this.debugMode && console.info('🔗 chain cache:', paginator.chainCacheStats);
+    this.debugMode && console.info('📑 forced page break index:', paginator.forcedPageBreakStats);
+    this.debugMode && console.info('🐎 sibling gallop:', paginator.gallopStats);
     this.debugMode && console.groupEnd();
     this.debugMode && console.timeEnd("⏱️ Pages time");
+    takeMemorySnapshot('Pages');
 
     // * render preview (DOM manipulation)
 
+    DOM.profiler?.setStage('Preview');
+    timing.setStage('Preview');
     this.debugMode && console.time("⏱️ Preview time");
     this.debugMode && console.groupCollapsed('%c Preview ', CONSOLE_CSS_LABEL);
+    const virtualizer = this.config.virtualPreview
+      ? new PreviewVirtualizer({ config: this.config, paper })
+      : null;
     const previewValidations = new Preview({
       config: this.config,
       DOM: DOM,
@@ -187,38 +343,51 @@ export default class App {
       paper: paper,
       pages: pages,
       mutationQueue,
+      virtualizer,
+      pageRange: paginator.pageRange,
     }).create();
     this.debugMode && console.groupEnd();
     this.debugMode && console.timeEnd("⏱️ Preview time");
+    takeMemorySnapshot('Preview');
+
+    // * compact the DOM before printing
+
+    if (this.config.compactDom) {
+      DOM.profiler?.setStage('Compaction');
+      timing.setStage('Compaction');
+      this._compactionStats = new Compaction({
+        DOM: DOM,
+        selector: this.selector,
+        node: node,
+        layout: layout,
+      }).run();
+      this.debugMode && console.info('🧹 DOM compaction:', this._compactionStats);
+      takeMemorySnapshot('Compaction');
+    }
 
     // * render TOC page numbers
 
+    DOM.profiler?.setStage('Toc');
+    timing.setStage('Toc');
     this.debugMode && console.time("⏱️ Toc time");
-    new Toc({
+    const toc = new Toc({
       config: this.config,
       DOM: DOM,
       selector: this.selector,
       node: node,
       layout: layout,
-    }).render();
+    });
+    toc.render();
     this.debugMode && console.timeEnd("⏱️ Toc time");
+    takeMemorySnapshot('Toc');
 
     // * perform validations
 
-    this.debugMode && console.time("⏱️ Validator time");
-    // * Force a layout pass before validation by scrolling and waiting 2 frames
-    // * so deferred rendering effects show up in measurements (if not neutralized).
-    // *** Adds ~5-25 milliseconds to total processing time.
-    window.scrollTo(0, document.body.scrollHeight);
-    await new Promise(resolve => {
-      requestAnimationFrame(() => {
-        requestAnimationFrame(() => {
-          window.scrollTo(0, 0);
-          resolve();
-        });
-      });
-    });
-    new Validator({
+    DOM.profiler?.setStage('Validator');
+    timing.setStage('Validator');
+    // * In 'deferred' mode, the validation runs after [success] is set
+    // * and reports through the root attribute and the event.
+    const validator = new Validator({
       config: this.config,
       DOM: DOM,
       selector: this.selector,
@@ -226,12 +395,33 @@ export default class App {
       layout: layout,
       pages: pages,
       previewValidations,
-    }).init();
-    this.debugMode && console.timeEnd("⏱️ Validator time");
+      virtualizer,
+    });
+    if (!validator.isDeferred()) {
+      this.debugMode && console.time("⏱️ Validator time");
+      await validator.run();
+      this.debugMode && console.timeEnd("⏱️ Validator time");
+      takeMemorySnapshot('Validator');
+    }
 
     // * set the attribute that means that rendering is completed successfully
     DOM.setAttribute(layout.root, '[success]');
     DOM.setAttribute(layout.root, '[pages]', pages.length);
+    this._pageEstimate && DOM.setAttribute(layout.root, `[${PAGE_ESTIMATE_ATTR}]`, this._pageEstimate.pages);
+    paginator.breakPlanStatus && DOM.setAttribute(layout.root, `[${BREAK_PLAN_STATUS_ATTR}]`, paginator.breakPlanStatus);
+    // * Rendered document pages, e.g. "3-5", and "3-5+" if the document continues;
+    // * "empty" if the range starts after the last page (the last page is shown).
+    const { pageRange } = paginator;
+    pageRange && DOM.setAttribute(
+      layout.root,
+      '[html2pdf4doc-page-range]',
+      pageRange.isEmpty
+        ? 'empty'
+        : `${pageRange.first}-${pageRange.last}${pageRange.isComplete ? '' : '+'}`
+    );
+    timing.setStage(null);
+    // * Preview has added the frontpage (if any) to the pages.
+    this._rendered = { DOM, node, layout, pageCount: pages.length, paginator, validator, toc, virtualizer };
 
     // ? CONDITION
     // ! preloader.remove();
@@ -240,5 +430,23 @@ export default class App {
 
     console.info(`[HTML2PDF4DOC] Page count:`, pages.length);
     console.timeEnd("[HTML2PDF4DOC] Total time");
+    DOM.profiler?.print();
+
+    if (validator.isDeferred()) {
+      this.debugMode && console.time("⏱️ Deferred Validator time");
+      await validator.run();
+      this.debugMode && console.timeEnd("⏱️ Deferred Validator time");
+      takeMemorySnapshot('Validator');
+    }
+
+    // * data-low-memory: only the page registries read by the TOC
+    // * and the layout report stay after the rendering.
+    if (this.config.lowMemory) {
+      paginator.release();
+      node.releasePaginationState();
+      takeMemorySnapshot('Released');
+    }
+
+    virtualizer?.start();
   }
 }
@@ -0,0 +1,157 @@
+// * DOM compaction after Preview (data-compact-dom="true").
+// *
+// * The pagination leaves service wrappers in the content flow. The inline
+// * ones have no box of their own (display: inline, no padding, margin,
+// * border or background, see style.js), so the compaction can remove them
+// * without changing the print:
+// * - consecutive text lines (Paragraph) with no page break between them
+// *   are merged into the first one;
+// * - neutral, text node and word wrappers without attributes are unwrapped;
+// * - the adjacent text nodes of the content flow are merged.
+// *
+// * Elements in the page registries (page starts and ends, page dividers,
+// * page numbers) are never removed: the TOC, the validator and the layout
+// * report read them. Wrappers with attributes (the scalers of
+// * applyScaleWithWrapper, the neutral blocks, the markers of debug mode)
+// * stay as they are, and so do the block wrappers (text groups, complex
+// * text blocks) and the lines of PRE.
+
+const TEXT_NODE = 3;
+const ELEMENT_NODE = 1;
+
+export default class Compaction {
+  constructor({
+    DOM,
+    selector,
+    node,
+    layout,
+  }) {
+    this._DOM = DOM;
+    this._selector = selector;
+    this._node = node;
+    this._contentFlow = layout.contentFlow;
+
+    this._textLine = selector.textLine;
+    // * The inline wrappers that are unwrapped; the attributes they may keep.
+    this._inlineWrappers = {
+      [selector.neutral]: [],
+      [selector.textNode]: [],
+      [selector.word]: ['data-index'],
+    };
+
+    // * { mergedLines, unwrapped, nodesBefore, nodesAfter, nodesRemoved, ms }
+    this.stats = null;
+  }
+
+  run() {
+    const start = performance.now();
+    const nodesBefore = this._countNodes();
+    this._registered = this._collectRegistered();
+    this._pageEnds = new Set(this._node.getRegisteredPageEnds().values());
+
+    const unwrapped = this._unwrapInlineWrappers();
+    const mergedLines = this._mergeTextLines();
+    // * Text nodes split by the pagination and joined again by the steps above.
+    this._contentFlow.normalize();
+
+    const nodesAfter = this._countNodes();
+    this.stats = {
+      mergedLines,
+      unwrapped,
+      nodesBefore,
+      nodesAfter,
+      nodesRemoved: nodesBefore - nodesAfter,
+      ms: Math.round((performance.now() - start) * 10) / 10,
+    };
+    this._registered = null;
+    this._pageEnds = null;
+    return this.stats;
+  }
+
+  _collectRegistered() {
+    const registered = new Set([
+      ...this._node.getRegisteredPageStarts().values(),
+      ...this._node.getRegisteredPageEnds().values(),
+      ...this._node.getRegisteredPageDividers().values(),
+    ]);
+    for (const bucket of this._node.getRegisteredPageNumbers().values()) {
+      bucket.forEach(element => registered.add(element));
+    }
+    return registered;
+  }
+
+  _unwrapInlineWrappers() {
+    const selector = Object.keys(this._inlineWrappers).join(', ');
+    // * Reverse document order: the inner wrappers first,
+    // * so that the outer ones hold only text when they are checked.
+    const wrappers = [...this._DOM.getAllElements(selector, this._contentFlow)].reverse();
+    let unwrapped = 0;
+    for (const wrapper of wrappers) {
+      if (this._isUnwrappable(wrapper)) {
+        this._DOM.insertInsteadOf(wrapper, ...this._DOM.getChildNodes(wrapper));
+        unwrapped += 1;
+      }
+    }
+    return unwrapped;
+  }
+
+  _isUnwrappable(wrapper) {
+    if (this._registered.has(wrapper)) {
+      return false;
+    }
+    const allowedAttributes = this._inlineWrappers[wrapper.localName];
+    for (const { name } of wrapper.attributes) {
+      if (!allowedAttributes.includes(name)) {
+        return false;
+      }
+    }
+    // * Text only: an inline wrapper around other elements is kept.
+    for (const child of this._DOM.getChildNodes(wrapper)) {
+      if (child.nodeType !== TEXT_NODE) {
+        return false;
+      }
+    }
+    return true;
+  }
+
+  _mergeTextLines() {
+    const lines = [...this._DOM.getAllElements(this._textLine, this._contentFlow)];
+    let merged = 0;
+    for (const line of lines) {
+      // * Already merged into a previous line.
+      if (!line.isConnected || line.attributes.length) {
+        continue;
+      }
+      // * A page end keeps its content: the next page starts after it.
+      if (this._pageEnds.has(line)) {
+        continue;
+      }
+      let next = line.nextSibling;
+      while (next && this._isMergeableLine(next)) {
+        this._DOM.moveContent(next, line);
+        this._DOM.removeNode(next);
+        merged += 1;
+        next = line.nextSibling;
+      }
+    }
+    return merged;
+  }
+
+  // * A page break between two lines is a registered element
+  // * (a page start, or a divider inserted by Preview).
+  _isMergeableLine(element) {
+    return element.nodeType === ELEMENT_NODE
+      && element.localName === this._textLine
+      && !element.attributes.length
+      && !this._registered.has(element);
+  }
+
+  _countNodes() {
+    const walker = this._DOM.document.createTreeWalker(this._contentFlow, NodeFilter.SHOW_ALL);
+    let nodes = 0;
+    while (walker.nextNode()) {
+      nodes += 1;
+    }
+    return nodes;
+  }
+}
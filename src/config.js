@@ -31,6 +31,15 @@ export default function createConfig(params) {
     // * Resource waiting timeout in milliseconds.
     resourceTimeoutMs: 2000,
 
+    // * Layout validation after rendering:
+    // * 'full' | 'sampled' | 'deferred' | 'off' (data-validation-mode).
+    // * 'deferred' runs after [success] and reports through
+    // * the [html2pdf4doc-validation] root attribute
+    // * and the 'html2pdf4doc:validation' event.
+    validationMode: 'full',
+    // * Number of pages checked in 'sampled' mode (data-validation-sample-size).
+    validationSampleSize: 8,
+
     // Register option to print for informational purposes:
     preloader: false,
     preloaderTarget: '',
@@ -73,7 +82,70 @@ export default function createConfig(params) {
     virtualPagesGap: '16px',
 
     // * service elements:
-    splitLabelHeight: '24px'
+    splitLabelHeight: '24px',
+
+    // * break plan (see pages/breakPlan.js):
+    // * data-break-plan-record="true" records how the content flow was paginated,
+    // * HTML2PDF4DOC.getBreakPlan() returns it after rendering;
+    // * data-break-plan (inline JSON or a URL of a JSON file) or init({ breakPlan })
+    // * replays it instead of measuring every top-level element again.
+    breakPlan: '',
+    breakPlanRecord: false,
+
+    // * data-contain-finalized-pages="true": during the pagination, the content
+    // * above the previous page is replaced with a spacer of the same height,
+    // * so the measurements lay out only the active pages (see pages/finalizedContent.js).
+    containFinalizedPages: false,
+
+    // * data-virtual-preview="true": the page chrome (header, footer, page numbers)
+    // * is created only for the pages near the viewport, and for all pages
+    // * before printing (see previewVirtualizer.js).
+    virtualPreview: false,
+
+    // * data-page-range="1-10" | "3" | "5-": render only these pages
+    // * (the frontpage is page 1). The pagination stops after the range,
+    // * the rest of the content is hidden.
+    pageRange: '',
+
+    // * data-page-estimate="true": estimate the page count from the geometry
+    // * of the content before the pagination, and report it next to the real one;
+    // * "only": stop after the estimate, nothing is split and no preview is built
+    // * (see pages/pageEstimate.js and HTML2PDF4DOC.getPageEstimate()).
+    pageEstimate: false,
+
+    // * data-single-pass-slicing="true": slice nodes by split points with one
+    // * walk for all parts instead of one clone of the node per part
+    // * (see cloneSlicesBySplitPoints() in node/modules/slicers.js).
+    // * Opt-in until benchmark-slicing shows the gain.
+    singlePassSlicing: false,
+
+    // * data-gallop-siblings="false": parse every sibling that fits on the page
+    // * one by one instead of skipping the runs of them with a binary search
+    // * on their tops (see Pages._gallopFittingSiblings()).
+    gallopSiblings: true,
+
+    // * data-layout-profile="true": count the layout reads and writes of the DOM
+    // * helpers, and the reads forced after writes, per stage and caller;
+    // * the summary is printed and returned by HTML2PDF4DOC.getLayoutProfile()
+    // * (see layoutProfiler.js). Slows the rendering down.
+    layoutProfile: false,
+    // * data-user-timing="true": performance.measure() entries for the stages,
+    // * the registered pages and the splitter calls, for the performance panel
+    // * and the trace capture (see userTiming.js, test/benchmark/trace_render.py).
+    userTiming: false,
+    // * data-memory-snapshots="true": JS heap, DOM node and service element counts
+    // * after Layout, Pages, Preview, Toc and Validator, returned by
+    // * HTML2PDF4DOC.getMemorySnapshots() and the layout report (see memorySnapshots.js).
+    memorySnapshots: false,
+    // * data-low-memory="true": for long-lived previews. The parts of the split
+    // * tables and grids are not recorded, the marks get no debug symbols, and
+    // * the pagination state (pages, marks, caches) is released after the
+    // * rendering; the page registries for the TOC and the layout report stay.
+    lowMemory: false,
+    // * data-compact-dom="true": after Preview, the adjacent text lines are merged
+    // * and the inline service wrappers (neutral, text node, word) without
+    // * attributes are unwrapped; the print does not change (see compaction.js).
+    compactDom: false,
   }
 
   const A4 = {
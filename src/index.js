@@ -22,6 +22,67 @@ if (!dataset) {
   !isManualInit && app.render();
 }
 
-export function init() {
-  isManualInit && app && app.render();
+// * Manual initialization mode (data-init="manual").
+// * params override the data-* attributes, e.g. init({ breakPlan }).
+export function init(params = {}) {
+  isManualInit && app && app.render(params);
+}
+
+// * Returns a JSON-ready snapshot of the rendered layout (pages, elements
+// * with their page numbers and boxes, validation findings) for test tools,
+// * or null until the rendering is completed.
+export function getLayoutReport() {
+  return app ? app.getLayoutReport() : null;
+}
+
+// * Returns the @page box of the document in CSS px:
+// * { width, height, marginTop, marginRight, marginBottom, marginLeft },
+// * or null until the config is built.
+export function getPrintConfig() {
+  return app ? app.getPrintConfig() : null;
+}
+
+// * Returns the rendered document as a script-free HTML string that prints
+// * with no pagination (see snapshot.js), or null until the rendering is completed.
+export function getStaticSnapshot() {
+  return app ? app.getStaticSnapshot() : null;
+}
+
+// * Returns the outline (bookmarks) of the rendered document:
+// * [{ id, title, level, page }], or null until the rendering is completed.
+export function getOutline() {
+  return app ? app.getOutline() : null;
+}
+
+// * Returns the page count estimate of data-page-estimate="true" | "only"
+// * (see pages/pageEstimate.js): { pages, min, max, ms, actualPages },
+// * where actualPages is the rendered page count (null with "only"), or null.
+export function getPageEstimate() {
+  return app ? app.getPageEstimate() : null;
+}
+
+// * Returns the layout profile of data-layout-profile="true" (see layoutProfiler.js):
+// * reads, writes, forced layouts and time per stage and per caller, or null.
+export function getLayoutProfile() {
+  return app ? app.getLayoutProfile() : null;
+}
+
+// * Returns the memory snapshots of data-memory-snapshots="true" (see memorySnapshots.js):
+// * [{ stage, ms, jsHeapUsed, jsHeapTotal, nodes, elements, textNodes, services }], or null.
+export function getMemorySnapshots() {
+  return app ? app.getMemorySnapshots() : null;
+}
+
+// * Returns the break plan recorded with data-break-plan-record="true"
+// * (see pages/breakPlan.js), or null.
+export function getBreakPlan() {
+  return app ? app.getBreakPlan() : null;
+}
+
+// * Creates the page chrome of every page of a virtualized preview
+// * (data-virtual-preview="true"). Call before printing with the
+// * DevTools protocol (Page.printToPDF); the browser print dialog
+// * is handled by the `beforeprint` event.
+export function preparePrint() {
+  app && app.preparePrint();
 }
@@ -0,0 +1,207 @@
+// * Layout thrash profile (data-layout-profile="true").
+// *
+// * Wraps the read and write helpers of DocumentObjectModel and counts,
+// * per stage (Layout, Pages, Preview, ...) and per caller (the first
+// * function outside DOM.js and node/ on the stack, with the Node helper
+// * it called, e.g. "Pages._parseNode > Node.getTop"):
+// * - the calls and the time spent in them;
+// * - the forced layouts: reads of the layout made after a write,
+// *   which make the browser lay out the document synchronously.
+// *
+// * A write is any change of the tree, attributes, classes or styles made
+// * through the helpers; not every one of them invalidates the layout,
+// * so the forced layouts are an upper estimate. DOM access that does not
+// * go through the helpers is not seen.
+// *
+// * The caller is taken from the stack of every call: the profile
+// * slows the rendering down and is meant for the analysis only.
+
+// * Reads that need an up-to-date layout (or style).
+const READS = [
+  'getElementOffsetParent',
+  'getComputedStyle',
+  'getElementBCR',
+  'getElementOffsetLeft',
+  'getElementOffsetHeight',
+  'getElementOffsetWidth',
+  'getElementOffsetTop',
+  'getElementOffsetBottom',
+];
+
+const WRITES = [
+  'insertBefore',
+  'insertAfter',
+  'insertAtEnd',
+  'insertAtStart',
+  'insertInsteadOf',
+  'wrap',
+  'moveContent',
+  'moveRowContent',
+  'replaceNodeContentsWith',
+  'removeNode',
+  'setAttribute',
+  'setStyles',
+  'setStyle',
+  'addClasses',
+  'removeAttribute',
+  'removeAllAttributes',
+  'removeClasses',
+  'removeAllClasses',
+  'removeAllStyles',
+  'setInnerHTML',
+];
+
+const UNKNOWN_CALLER = '(unknown)';
+// * Node helpers call each other: the caller can be deep in the stack.
+const STACK_DEPTH = 40;
+
+export default class LayoutProfiler {
+  constructor() {
+    this._stage = 'init';
+    this._isLayoutDirty = false;
+    // * Nested helper calls (e.g. insertInsteadOf -> insertBefore) count once.
+    this._depth = 0;
+    // * `${stage}|${caller}|${method}` -> row
+    this._rows = new Map();
+  }
+
+  // * Replaces the helpers of the DOM instance with counting wrappers.
+  instrument(DOM) {
+    READS.forEach(method => this._wrap(DOM, method, 'read'));
+    WRITES.forEach(method => this._wrap(DOM, method, 'write'));
+    return this;
+  }
+
+  setStage(stage) {
+    this._stage = stage;
+  }
+
+  // * Rows sorted by the forced layouts, then by the time:
+  // * [{ stage, caller, method, kind, calls, forcedLayouts, ms }].
+  getRows() {
+    return [...this._rows.values()]
+      .map(row => ({ ...row, ms: Math.round(row.ms * 100) / 100 }))
+      .sort((a, b) => b.forcedLayouts - a.forcedLayouts || b.ms - a.ms);
+  }
+
+  // * Totals per stage and per caller, and all rows:
+  // * { totals, stages: { [stage]: totals }, callers: [{ stage, caller, ...totals }], rows }.
+  getSummary() {
+    const rows = this.getRows();
+    const stages = {};
+    const callers = new Map();
+    const totals = createTotals();
+    for (const row of rows) {
+      addToTotals(totals, row);
+      addToTotals(stages[row.stage] ??= createTotals(), row);
+      const key = `${row.stage}|${row.caller}`;
+      callers.has(key) || callers.set(key, { stage: row.stage, caller: row.caller, ...createTotals() });
+      addToTotals(callers.get(key), row);
+    }
+    return {
+      totals,
+      stages,
+      callers: [...callers.values()].sort((a, b) => b.forcedLayouts - a.forcedLayouts || b.ms - a.ms),
+      rows,
+    };
+  }
+
+  // * Prints the callers that force the layout, and the totals per stage.
+  print(limit = 30) {
+    const { stages, callers } = this.getSummary();
+    console.info('[HTML2PDF4DOC] Layout profile: forced layouts per stage');
+    console.table(stages);
+    console.info(`[HTML2PDF4DOC] Layout profile: top ${limit} callers`);
+    console.table(callers.slice(0, limit));
+  }
+
+  _wrap(DOM, method, kind) {
+    const original = DOM[method];
+    if (typeof original !== 'function') {
+      return;
+    }
+    const profiler = this;
+    DOM[method] = function (...args) {
+      if (profiler._depth > 0) {
+        return original.apply(this, args);
+      }
+      const row = profiler._getRow(method, kind);
+      const isForced = kind === 'read' && profiler._isLayoutDirty;
+      profiler._depth += 1;
+      const start = performance.now();
+      try {
+        return original.apply(this, args);
+      } finally {
+        row.ms += performance.now() - start;
+        profiler._depth -= 1;
+        row.calls += 1;
+        isForced && (row.forcedLayouts += 1);
+        profiler._isLayoutDirty = kind === 'write';
+      }
+    };
+  }
+
+  _getRow(method, kind) {
+    const caller = getCaller();
+    const key = `${this._stage}|${caller}|${method}`;
+    let row = this._rows.get(key);
+    if (!row) {
+      row = { stage: this._stage, caller, method, kind, calls: 0, forcedLayouts: 0, ms: 0 };
+      this._rows.set(key, row);
+    }
+    return row;
+  }
+}
+
+function createTotals() {
+  return { reads: 0, writes: 0, forcedLayouts: 0, ms: 0 };
+}
+
+function addToTotals(totals, row) {
+  totals[row.kind === 'read' ? 'reads' : 'writes'] += row.calls;
+  totals.forcedLayouts += row.forcedLayouts;
+  totals.ms = Math.round((totals.ms + row.ms) * 100) / 100;
+}
+
+// * The first named frame outside DocumentObjectModel, prefixed with the first one
+// * outside Node if it differs: "Pages._parseNode > Node.getTop".
+// * Chrome formats method frames as "at Class.method (url:line:col)"
+// * (the class names are kept in the bundle, see webpack.common.js).
+// * The Node helpers are module functions assigned to the prototype:
+// * their names are mangled in the bundle, and the frame is
+// * "at Node.xY [as getTop] (url:line:col)", so the alias is taken.
+function getCaller() {
+  const stackTraceLimit = Error.stackTraceLimit;
+  Error.stackTraceLimit = STACK_DEPTH;
+  const lines = (new Error().stack || '').split('\n');
+  Error.stackTraceLimit = stackTraceLimit;
+  let helper = null;
+  // * [0] "Error", [1] getCaller, [2] _getRow, [3] the wrapper.
+  for (let i = 4; i < lines.length; i++) {
+    const name = parseFrameName(lines[i]);
+    if (!name || name.startsWith('DocumentObjectModel.')) {
+      continue;
+    }
+    if (name.startsWith('Node.')) {
+      helper ??= name;
+      continue;
+    }
+    return helper ? `${name} > ${helper}` : name;
+  }
+  return helper || UNKNOWN_CALLER;
+}
+
+// * "at Class.method (...)" -> "Class.method";
+// * "at Class.xY [as method] (...)" -> "Class.method".
+function parseFrameName(line) {
+  const match = line.match(/^\s*at (?:async )?(?:new )?([^\s(]+)(?: \[as ([^\]]+)\])? \(/);
+  if (!match) {
+    return null;
+  }
+  const [, name, alias] = match;
+  if (!alias) {
+    return name;
+  }
+  const dot = name.lastIndexOf('.');
+  return dot === -1 ? alias : `${name.slice(0, dot + 1)}${alias}`;
+}
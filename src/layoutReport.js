@@ -0,0 +1,173 @@
+// * The layout report is a plain JSON snapshot of the rendered document
+// * for test tools: one call instead of a WebDriver round-trip per check.
+// * It is built on demand (HTML2PDF4DOC.getLayoutReport()) and is never
+// * computed during the rendering itself.
+
+const ELEMENT_NODE = 1;
+const TEXT_NODE = 3;
+
+export default class LayoutReport {
+  constructor({
+    DOM,
+    selector,
+    node,
+    layout,
+    pageCount,
+    validator,
+    paginationStats = null,
+    memorySnapshots = null,
+  }) {
+    this._DOM = DOM;
+    this._selector = selector;
+    this._node = node;
+    this._root = layout.root;
+    this._contentFlow = layout.contentFlow;
+    this._pageCount = pageCount;
+    this._validator = validator;
+    this._paginationStats = paginationStats;
+    this._memorySnapshots = memorySnapshots;
+
+    // * Element -> index in this._nodes.
+    this._ids = new Map();
+    this._nodes = [];
+  }
+
+  create() {
+    this._scrollY = window.scrollY;
+    this._collectNodes(this._DOM.document.documentElement, -1);
+    this._pageTops = this._collectPageTops();
+
+    const contentFlowId = this._ids.get(this._contentFlow);
+    for (const [element, id] of this._ids.entries()) {
+      this._nodes[id].page = this._getPageNumber(element, id, contentFlowId);
+    }
+
+    return {
+      success: this._DOM.hasAttribute(this._root, 'success'),
+      pageCount: this._pageCount,
+      printArea: this._getPrintArea(),
+      pages: this._collectPages(),
+      nodes: this._nodes,
+      validation: this._getValidation(),
+      paginationStats: this._paginationStats,
+      memorySnapshots: this._memorySnapshots,
+    };
+  }
+
+  _collectNodes(element, parentId) {
+    const id = this._nodes.length;
+    this._ids.set(element, id);
+    const attrs = {};
+    for (const { name, value } of element.attributes) {
+      attrs[name] = value;
+    }
+    const rect = this._DOM.getElementBCR(element);
+    const entry = {
+      tag: element.localName,
+      attrs,
+      parent: parentId,
+      // * Element ids and text strings in document order.
+      content: [],
+      top: rect.top + this._scrollY,
+      left: rect.left + window.scrollX,
+      width: rect.width,
+      height: rect.height,
+      page: null,
+    };
+    this._nodes.push(entry);
+
+    for (const child of element.childNodes) {
+      if (child.nodeType === ELEMENT_NODE) {
+        entry.content.push(this._collectNodes(child, id));
+      } else if (child.nodeType === TEXT_NODE) {
+        entry.content.push(child.nodeValue);
+      }
+    }
+    return id;
+  }
+
+  _collectPageTops() {
+    // * Same anchors as the page dividers are read by the tests:
+    // * the divider itself for the first page, its paper gap for the others.
+    const tops = [];
+    const dividers = this._node.getRegisteredPageDividers();
+    for (const [page, divider] of dividers.entries()) {
+      const gap = page > 1 && this._DOM.getElement(this._selector.virtualPaperGap, divider);
+      const anchor = gap || divider;
+      tops[page] = Math.round(this._DOM.getElementBCR(anchor).top + this._scrollY);
+    }
+    return tops;
+  }
+
+  _getPageNumber(element, id, contentFlowId) {
+    const registered = this._node.getRegisteredPageNumberForElement(element);
+    if (registered !== undefined) {
+      return registered;
+    }
+    if (!this._isInside(id, contentFlowId)) {
+      return null;
+    }
+    // * The last page whose anchor is above the element.
+    const top = Math.round(this._nodes[id].top);
+    let page = null;
+    for (let index = 1; index < this._pageTops.length; index += 1) {
+      const pageTop = this._pageTops[index];
+      if (pageTop === undefined) continue;
+      if (pageTop >= top) break;
+      page = index;
+    }
+    return page;
+  }
+
+  _isInside(id, ancestorId) {
+    if (ancestorId === undefined) return false;
+    for (let current = this._nodes[id].parent; current !== -1; current = this._nodes[current].parent) {
+      if (current === ancestorId) return true;
+    }
+    return false;
+  }
+
+  _collectPages() {
+    const starts = this._node.getRegisteredPageStarts();
+    const ends = this._node.getRegisteredPageEnds();
+    const dividers = this._node.getRegisteredPageDividers();
+    const pages = [];
+    for (let page = 1; page <= this._pageCount; page += 1) {
+      pages.push({
+        page,
+        top: this._pageTops[page] ?? null,
+        start: this._getId(starts.get(page)),
+        end: this._getId(ends.get(page)),
+        divider: this._getId(dividers.get(page)),
+      });
+    }
+    return pages;
+  }
+
+  _getPrintArea() {
+    const body = this._DOM.getElement(`${this._selector.pageChrome} ${this._selector.pageBodySpacer}`);
+    if (!body) return null;
+    const rect = this._DOM.getElementBCR(body);
+    return { width: rect.width, height: rect.height };
+  }
+
+  _getValidation() {
+    const result = this._validator?.result;
+    if (!result) {
+      return this._validator ? { mode: this._validator.mode, status: null } : null;
+    }
+    // * Elements are replaced by their ids in the report.
+    const assertions = {};
+    for (const [page, data] of Object.entries(result.assertions)) {
+      assertions[page] = {};
+      for (const [key, value] of Object.entries(data)) {
+        assertions[page][key] = this._ids.has(value) ? this._ids.get(value) : value;
+      }
+    }
+    return { ...result, assertions };
+  }
+
+  _getId(element) {
+    return element && this._ids.has(element) ? this._ids.get(element) : null;
+  }
+}
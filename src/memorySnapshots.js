@@ -0,0 +1,85 @@
+// * Memory snapshots per stage (data-memory-snapshots="true").
+// *
+// * After Layout, Pages, Preview, Toc and Validator (and after the compaction
+// * with data-compact-dom, and the release of the pagination state with
+// * data-low-memory), App takes a snapshot of:
+// * - the JS heap (performance.memory, Chrome only; coarse unless Chrome runs
+// *   with --enable-precise-memory-info);
+// * - the DOM nodes of the document (all nodes, elements and text nodes);
+// * - the service elements that the pagination creates: word wrappers,
+// *   text nodes and lines, complex text blocks, cut parts of the split
+// *   elements, page chromes and virtual papers.
+// * The event listeners are not visible from the page: Python reads them
+// * with CDP (Memory.getDOMCounters), see test/benchmark/memory_benchmark.py.
+// *
+// * Counting walks the whole document: for the analysis only.
+
+const SERVICE_TAGS = {
+  words: 'word',
+  textNodes: 'textNode',
+  textLines: 'textLine',
+  textGroups: 'textGroup',
+  complexTextBlocks: 'complexTextBlock',
+  pageChromes: 'pageChrome',
+  virtualPapers: 'virtualPaper',
+};
+
+export default class MemorySnapshots {
+  constructor({
+    DOM,
+    selector,
+    isEnabled,
+  }) {
+    this._DOM = DOM;
+    this._selector = selector;
+    this.isEnabled = Boolean(isEnabled);
+    // * [{ stage, ms, jsHeapUsed, jsHeapTotal, nodes, elements, textNodes, services }]
+    this.snapshots = [];
+  }
+
+  take(stage) {
+    if (!this.isEnabled) {
+      return null;
+    }
+    const document = this._DOM.document;
+    const memory = performance.memory;
+    const snapshot = {
+      stage,
+      ms: Math.round(performance.now()),
+      jsHeapUsed: memory ? memory.usedJSHeapSize : null,
+      jsHeapTotal: memory ? memory.totalJSHeapSize : null,
+      ...this._countNodes(document),
+      services: this._countServiceElements(document),
+    };
+    this.snapshots.push(snapshot);
+    return snapshot;
+  }
+
+  _countNodes(document) {
+    let nodes = 0;
+    let textNodes = 0;
+    const walker = document.createTreeWalker(document, NodeFilter.SHOW_ALL);
+    while (walker.nextNode()) {
+      nodes += 1;
+      walker.currentNode.nodeType === Node.TEXT_NODE && (textNodes += 1);
+    }
+    return {
+      nodes,
+      elements: document.getElementsByTagName('*').length,
+      textNodes,
+    };
+  }
+
+  _countServiceElements(document) {
+    const services = {};
+    for (const [key, selectorKey] of Object.entries(SERVICE_TAGS)) {
+      services[key] = document.getElementsByTagName(this._selector[selectorKey]).length;
+    }
+    // * The parts of the split elements (tables, grids, PRE, ...) except the first one
+    // * have the top cut class, the parts except the last one have the bottom cut class.
+    services.cutParts = document.querySelectorAll(
+      `${this._selector.topCutPart}, ${this._selector.bottomCutPart}`
+    ).length;
+    return services;
+  }
+}
@@ -16,6 +16,11 @@ export function createMutationQueue() {
       pendingMutations.push(mutationFn);
     },
 
+    // Number of pending mutations.
+    get size() {
+      return pendingMutations.length;
+    },
+
     // Apply all queued mutations in registration order and clear the queue.
     flush() {
       for (const mutationFn of pendingMutations) {
@@ -1,14 +1,27 @@
 import MeasureCache from './measureCache.js';
+import ChainCache from './chainCache.js';
+import ChildrenCache from './childrenCache.js';
 
 // Central per-Node cache state:
 // - measure: short-lived caches for layout reads (BCR/computed styles), reset manually
+// - chains: ancestor/sibling walks, enabled during the pagination (see chainCache.js)
+// - children: getPreparedChildren() results, valid while the child list is unchanged
 
 export default class CacheState {
-  constructor() {
+  constructor({ DOM }) {
     this.measure = new MeasureCache();
+    this.chains = new ChainCache(() => DOM.getChildListEpoch());
+    this.children = new ChildrenCache();
   }
 
   resetMeasureCache() {
     this.measure.reset();
   }
+
+  // * Drops all entries; the counters stay.
+  release() {
+    this.measure.reset();
+    this.chains.stop();
+    this.children.reset();
+  }
 }
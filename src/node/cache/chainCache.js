@@ -0,0 +1,109 @@
+// Per-pagination memo for ancestor/sibling chain walks
+// (first-child parents, last-child parents, no-hanging predecessors).
+//
+// The walks only read the DOM, so their results stay valid until the
+// DOM or the page-start marks change. The cache is cleared:
+// - on every child-list write (insert, wrap, move, remove, split clones):
+//   the entries are dropped when the child-list epoch of the DOM helpers
+//   has changed since they were stored (see DOM.getChildListEpoch());
+// - when a page start is marked or unmarked;
+// - when getSplitPoints() changes the positioning of its root.
+// It is enabled by Pages for the time of the pagination only.
+
+export default class ChainCache {
+  constructor(getChildListEpoch = () => 0) {
+    this._isEnabled = false;
+    this._stores = new Map();
+    this._getChildListEpoch = getChildListEpoch;
+    this._epoch = 0;
+    this.stats = createStats();
+  }
+
+  get isEnabled() {
+    return this._isEnabled;
+  }
+
+  start() {
+    this._isEnabled = true;
+    this._stores = new Map();
+    this._epoch = this._getChildListEpoch();
+    this.stats = createStats();
+  }
+
+  stop() {
+    this._isEnabled = false;
+    this._stores = new Map();
+    return { ...this.stats };
+  }
+
+  invalidate() {
+    if (!this._isEnabled || !this._stores.size) return;
+    this._stores = new Map();
+    this.stats.invalidations += 1;
+  }
+
+  // * One step of a walk (a parent, child or sibling lookup).
+  countStep() {
+    this._isEnabled && (this.stats.steps += 1);
+  }
+
+  // * kind: the walk; element, root and key (e.g. the top limit) identify the result.
+  get(kind, element, root, key, walk) {
+    if (!this._isEnabled || !element || !root) {
+      return walk();
+    }
+    this.stats.lookups += 1;
+    this._checkEpoch();
+    const bucket = this._getBucket(kind, element, root);
+    const entry = bucket.get(key);
+    if (entry) {
+      this.stats.hits += 1;
+      this.stats.savedSteps += entry.steps;
+      return entry.value;
+    }
+    const steps = this.stats.steps;
+    const value = walk();
+    this.stats.walks += 1;
+    this._getBucket(kind, element, root).set(key, { value, steps: this.stats.steps - steps });
+    return value;
+  }
+
+  // * The chains point to the elements that a split or a wrap has replaced.
+  _checkEpoch() {
+    const epoch = this._getChildListEpoch();
+    if (epoch !== this._epoch) {
+      this._epoch = epoch;
+      this.invalidate();
+    }
+  }
+
+  _getBucket(kind, element, root) {
+    let byRoot = this._stores.get(kind);
+    if (!byRoot) {
+      byRoot = new WeakMap();
+      this._stores.set(kind, byRoot);
+    }
+    let byElement = byRoot.get(root);
+    if (!byElement) {
+      byElement = new WeakMap();
+      byRoot.set(root, byElement);
+    }
+    let bucket = byElement.get(element);
+    if (!bucket) {
+      bucket = new Map();
+      byElement.set(element, bucket);
+    }
+    return bucket;
+  }
+}
+
+function createStats() {
+  return {
+    lookups: 0,
+    hits: 0,
+    walks: 0,
+    steps: 0,
+    savedSteps: 0,
+    invalidations: 0,
+  };
+}
@@ -0,0 +1,57 @@
+// Prepared children (getPreparedChildren) per element.
+//
+// An entry stays valid while the child list of the element is unchanged:
+// the DOM helpers count the child-list writes per parent
+// (DOM.getChildListVersion), and the length and the first and last child
+// nodes are compared as well, for the writes made without the helpers.
+// Both checks are O(1).
+
+export default class ChildrenCache {
+  constructor() {
+    this._entries = new WeakMap();
+    this.stats = { hits: 0, misses: 0 };
+  }
+
+  get(element, DOM) {
+    const entry = this._entries.get(element);
+    if (entry && this._isSameChildList(entry, element, DOM)) {
+      this.stats.hits += 1;
+      return entry.children;
+    }
+    this.stats.misses += 1;
+    return null;
+  }
+
+  set(element, children, DOM) {
+    this._entries.set(element, {
+      children,
+      ...this._getChildListSnapshot(element, DOM),
+    });
+  }
+
+  delete(element) {
+    element && this._entries.delete(element);
+  }
+
+  reset() {
+    this._entries = new WeakMap();
+  }
+
+  _isSameChildList(entry, element, DOM) {
+    const snapshot = this._getChildListSnapshot(element, DOM);
+    return entry.version === snapshot.version
+      && entry.length === snapshot.length
+      && entry.first === snapshot.first
+      && entry.last === snapshot.last;
+  }
+
+  _getChildListSnapshot(element, DOM) {
+    const childNodes = DOM.getChildNodes(element);
+    return {
+      version: DOM.getChildListVersion(element),
+      length: childNodes.length,
+      first: childNodes[0],
+      last: childNodes[childNodes.length - 1],
+    };
+  }
+}
@@ -36,6 +36,8 @@ export default class Grid {
     // * From config:
     // - if null is set - the element is not created in createSignpost().
     this._signpostHeight = parseFloat(config.splitLabelHeight) || 0;
+    // * data-low-memory: the created parts are not recorded.
+    this._recordParts = !config.lowMemory;
 
   }
 
@@ -198,8 +200,10 @@ export default class Grid {
     this._currentGridFullPartHeight = fullPagePartHeight;
     this._currentGridSplitLog = [];
     this._currentGridEntries = PartsRecorder.createEntries({ owner: gridNode, currentRows });
-    this._currentGridRecordedParts = this._currentGridEntries;
-    this._currentGridNode.__html2pdf4docRecordedParts = this._currentGridRecordedParts; // Expose for DevTools and external diagnostics
+    if (this._recordParts) {
+      this._currentGridRecordedParts = this._currentGridEntries;
+      this._currentGridNode.__html2pdf4docRecordedParts = this._currentGridRecordedParts; // Expose for DevTools and external diagnostics
+    }
     this._currentGridShellCache = new WeakMap();
 
     // ** If there are enough rows for the split to be readable,
@@ -263,11 +263,12 @@ export default class Paragraph {
     });
     const splitters = this._findNewLineStarts(linedChildren, node);
 
-    const parts = splitters.map((splitter, i) => {
-      const startElement = linedChildren[splitter];
-      const endElement = linedChildren[splitters[i + 1]];
-      return this._node.cloneAndCleanOutsideRange(node, startElement, endElement);
-    });
+    // * One part per line: [line start .. next line start).
+    // * The content before the first line start is not a part.
+    const parts = this._node.cloneSlicesBySplitPoints(
+      node,
+      splitters.map(splitter => linedChildren[splitter])
+    ).slice(1);
     this._DOM.insertInsteadOf(node, ...parts);
 
     this.logGroupEnd('Nested Inline parts');
@@ -24,6 +24,8 @@ export default class Table {
     this._node = node;
 
     this._splitLabelHeightFromConfig = config.splitLabelHeight;
+    // * data-low-memory: the created parts are not recorded.
+    this._recordParts = !config.lowMemory;
 
     // Table splitting constraints and constants
     this._initConstants();
@@ -113,11 +115,13 @@ export default class Table {
     this._lockCurrentTableWidths();
     this._collectCurrentTableEntries();
     this._updateCurrentTableDistributedRows();
-    this._currentTableRecordedParts = PartsRecorder.createEntries({ owner: this._currentTable, currentRows: this._currentTableDistributedRows });
-    if (this._currentTableEntries) {
-      this._currentTableEntries.recordedParts = this._currentTableRecordedParts;
+    if (this._recordParts) {
+      this._currentTableRecordedParts = PartsRecorder.createEntries({ owner: this._currentTable, currentRows: this._currentTableDistributedRows });
+      if (this._currentTableEntries) {
+        this._currentTableEntries.recordedParts = this._currentTableRecordedParts;
+      }
+      this._currentTable.__html2pdf4docRecordedParts = this._currentTableRecordedParts; // Expose for DevTools and external diagnostics
     }
-    this._currentTable.__html2pdf4docRecordedParts = this._currentTableRecordedParts; // Expose for DevTools and external diagnostics
     // Run structural guards (non-fatal): detect spans/inconsistencies and log.
     // TODO(table): consider early fallback (no split + scaling) on irregular tables.
     this._analyzeCurrentTableStructure();
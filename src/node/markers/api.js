@@ -176,6 +176,45 @@ export function _unregisterMark(element, key) {
   }
 }
 
+/**
+ * Drops the marks that only the pagination reads (data-low-memory).
+ * The registries keep their connected elements, and their structural
+ * marks (pageStart, pageEnd, pageNumber) are set again.
+ *
+ * @this {Node}
+ */
+export function releaseMarks() {
+  const registry = this._markers.registry;
+  for (const map of [registry.pageStart, registry.pageEnd, registry.pageDividerByPage]) {
+    for (const [page, element] of map) {
+      element.isConnected || map.delete(page);
+    }
+  }
+  for (const [page, bucket] of registry.pageNumberByPage) {
+    for (const element of bucket) {
+      if (!element.isConnected) {
+        bucket.delete(element);
+        registry.pageNumberByElement.delete(element);
+      }
+    }
+    bucket.size || registry.pageNumberByPage.delete(page);
+  }
+
+  this._marks.reset();
+  registry.pageStart.forEach((element, page) => this._marks.set(element, 'pageStart', page));
+  registry.pageEnd.forEach((element, page) => this._marks.set(element, 'pageEnd', page));
+  registry.pageNumberByPage.forEach((bucket, page) => {
+    bucket.forEach(element => this._marks.set(element, 'pageNumber', page));
+  });
+}
+
+/**
+ * @this {Node}
+ */
+export function getRegisteredPageStarts() {
+  return this._markers.registry.pageStart;
+}
+
 /**
  * @this {Node}
  */
@@ -56,6 +56,11 @@ export default class MarkStore {
     this._removeAttributeMarker(element, options);
   }
 
+  // * Drops all marks; the attributes stay in the DOM.
+  reset() {
+    this._marks = new WeakMap();
+  }
+
   _getEntry(element) {
     let entry = this._marks.get(element);
     if (!entry) {
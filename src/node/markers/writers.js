@@ -37,6 +37,8 @@ export function markSlice(element) {
  */
 export function markPageStart(element, pageNum) {
   this.setMark(element, 'pageStart', pageNum);
+  // * Walks stop at page starts: the memoized chains are outdated.
+  this.invalidateChainCache();
 }
 
 /**
@@ -44,6 +46,7 @@ export function markPageStart(element, pageNum) {
  */
 export function unmarkPageStart(element) {
   this.clearMark(element, 'pageStart');
+  this.invalidateChainCache();
 }
 
 /**
@@ -60,6 +63,13 @@ export function markPageNumber(element, pageNum) {
   this.setMark(element, 'pageNumber', pageNum);
 }
 
+/**
+ * @this {Node}
+ */
+export function unmarkPageNumber(element) {
+  this.clearMark(element, 'pageNumber');
+}
+
 /**
  * @this {Node}
  */
@@ -21,3 +21,60 @@ export function getComputedStyleCached(element, key, getter) {
 export function resetMeasureCache() {
   this._cache.resetMeasureCache();
 }
+
+/**
+ * @this {Node}
+ */
+export function getChainCached(kind, element, root, key, walk) {
+  return this._cache.chains.get(kind, element, root, key, walk);
+}
+
+/**
+ * @this {Node}
+ */
+export function countChainStep() {
+  this._cache.chains.countStep();
+}
+
+/**
+ * @this {Node}
+ */
+export function invalidateChainCache() {
+  this._cache.chains.invalidate();
+}
+
+/**
+ * @this {Node}
+ */
+export function startChainCache() {
+  this._cache.chains.start();
+}
+
+/**
+ * Disables the chain cache and returns its counters.
+ *
+ * @this {Node}
+ */
+export function stopChainCache() {
+  return this._cache.chains.stop();
+}
+
+/**
+ * Releases the pagination state after the rendering (data-low-memory):
+ * the caches and the marks that only the pagination reads.
+ *
+ * @this {Node}
+ */
+export function releasePaginationState() {
+  this._cache.release();
+  this.releaseMarks();
+}
+
+/**
+ * Counters of the getPreparedChildren() cache: { hits, misses }.
+ *
+ * @this {Node}
+ */
+export function getPreparedChildrenCacheStats() {
+  return { ...this._cache.children.stats };
+}
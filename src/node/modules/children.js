@@ -26,6 +26,22 @@ const _isDebug = debugFor('children');
  * @this {Node}
  */
 export function getPreparedChildren(element) {
+  // * Cached until the child list of the element is changed:
+  // * repeated calls do not filter, measure or wrap the children again.
+  const cached = this._cache.children.get(element, this._DOM);
+  if (cached) {
+    _isDebug(this) && console.info('🚸 getPreparedChildren: cached', element, cached);
+    return [...cached];
+  }
+  const state = { isCacheable: true };
+  const children = prepareChildren.call(this, element, state);
+  // * Children of flowless containers (display: contents) are not tracked
+  // * by the child list of the element.
+  state.isCacheable && this._cache.children.set(element, children, this._DOM);
+  return [...children];
+}
+
+function prepareChildren(element, state) {
   _isDebug(this) && console.groupCollapsed(`🚸 getPreparedChildren of`, element); // Collapsed
   let children = [];
 
@@ -68,6 +84,8 @@ export function getPreparedChildren(element) {
           // * wrap text node, use element.nodeType
           if (this.isSignificantTextNode(item)) {
             const textNodeWrapper = this.createTextNodeWrapper();
+            // * The wrapper may become a new first/last child:
+            // * the write clears the chain cache (see chainCache.js).
             this._DOM.wrap(item, textNodeWrapper);
             acc.push(textNodeWrapper);
             _isDebug(this) && console.info('🚸 (getPreparedChildren) wrap and return TEXT NODE', [item]);
@@ -86,6 +104,7 @@ export function getPreparedChildren(element) {
               // Recursively unwrap its children into the current context.
               const ch = this.getPreparedChildren(item);
               ch.length > 0 && acc.push(...ch);
+              state.isCacheable = false;
               _isDebug(this) && console.info('%c🚸 (getPreparedChildren) * no offset parent — unwrapped', 'color:green', ch, [item]);
               return acc;
             }
@@ -215,12 +234,12 @@ export function getSplitChildren(node, firstPageBottom, fullPageHeight, root) {
 
   } else if (this.isComplexTextBlock(node)) {
     _isDebug(this) && console.info('💚 ComplexTextBlock', node);
-    return children = this._paragraph.split(node) || [];
+    return children = this._timing.time('split:Paragraph', () => this._paragraph.split(node)) || [];
 
   } else if (this.isWrappedTextNode(node)) {
     _isDebug(this) && console.info('💚 TextNode', node);
 
-    return children = this._paragraph.split(node) || [];
+    return children = this._timing.time('split:Paragraph', () => this._paragraph.split(node)) || [];
 
   }
 
@@ -238,33 +257,33 @@ export function getSplitChildren(node, firstPageBottom, fullPageHeight, root) {
   // FIXME the order of checks
   if (this.isTableNode(node, nodeComputedStyle)) {
     _isDebug(this) && console.info('💚 TABLE', node);
-    children = this._table.split(
+    children = this._timing.time('split:Table', () => this._table.split(
       node,
       firstPageBottom,
       fullPageHeight,
       root,
       nodeComputedStyle,
-    ) || [];
+    )) || [];
 
   } else if (this.isTableLikeNode(node, nodeComputedStyle)) {
     _isDebug(this) && console.info('💚 TABLE like', node);
-    children = this._tableLike.split(
+    children = this._timing.time('split:TableLike', () => this._tableLike.split(
       node,
       firstPageBottom,
       fullPageHeight,
       root,
       nodeComputedStyle,
-    ) || [];
+    )) || [];
 
   } else if (this.isPRE(node, nodeComputedStyle)) {
     _isDebug(this) && console.info('💚 PRE', node);
-    children = this._pre.split(
+    children = this._timing.time('split:Pre', () => this._pre.split(
       node,
       firstPageBottom,
       fullPageHeight,
       root,
       nodeComputedStyle,
-    ) || [];
+    )) || [];
 
   } else if (this.isFlexRow(node, nodeComputedStyle)) {
     _isDebug(this) && console.info('🩷 Flex ROW', node);
@@ -280,12 +299,12 @@ export function getSplitChildren(node, firstPageBottom, fullPageHeight, root) {
     // ***** it is expected that the current element is either block or actually
     // ***** behaves as a block element in the flow thanks to its content.
     _isDebug(this) && console.info('💜 GRID');
-    children = this._grid.split(
+    children = this._timing.time('split:Grid', () => this._grid.split(
       node,
       firstPageBottom,
       fullPageHeight,
       root,
-    ) || [];
+    )) || [];
 
 
     // TODO LI: если в LI есть UL, маркер может оставаться на прежней странице - см. скрин в телеге.
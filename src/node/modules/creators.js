@@ -129,6 +129,18 @@ export function createForcedPageBreak() {
   return this.create(this._selector.printForcedPageBreak);
 }
 
+/**
+ * @this {Node}
+ */
+export function createFinalizedContentSpacer() {
+  // Takes the place of the finalized content during the pagination
+  // (see pages/finalizedContent.js); the height is set by the caller.
+  const element = this.create(this._selector.finalizedContentSpacer);
+  element.style.display = 'block';
+  element.style.overflow = 'hidden';
+  return element;
+}
+
 /**
  * @this {Node}
  */
@@ -76,7 +76,9 @@ export function findBetterPageStart(pageStart, lastPageStart, root) {
 
   // * Y-threshold: nothing above (smaller than) this coordinate can be returned;
   // * limited to the element from which the last registered page starts:
-  const topLimit = lastPageStart ? this.getTop(lastPageStart, root) : 0;
+  const topLimit = lastPageStart
+    ? this.getChainCached('top', lastPageStart, root, null, () => this.getTop(lastPageStart, root))
+    : 0;
 
   _isDebug(this) && console.log(
     "Start calculations:",
@@ -265,6 +267,11 @@ export function findBetterPageStart(pageStart, lastPageStart, root) {
  * @returns {Element|null|undefined}
  */
 export function findFirstChildParentFromPage(element, topLimit, root) {
+  return this.getChainCached('firstChildParentFromPage', element, root, topLimit,
+    () => walkFirstChildParentFromPage.call(this, element, topLimit, root));
+}
+
+function walkFirstChildParentFromPage(element, topLimit, root) {
   _isDebug(this) && console.group('⬆ findFirstChildParentFromPage');
   _isDebug(this) && console.log({element, topLimit, root});
 
@@ -359,6 +366,11 @@ export function findFirstChildParentFromPage(element, topLimit, root) {
  * @returns {Element|null|undefined}
  */
 export function findPreviousNonHangingsFromPage(element, topLimit, root) {
+  return this.getChainCached('previousNonHangingsFromPage', element, root, topLimit,
+    () => walkPreviousNonHangingsFromPage.call(this, element, topLimit, root));
+}
+
+function walkPreviousNonHangingsFromPage(element, topLimit, root) {
   _isDebug(this) && console.group('⬅ findPreviousNonHangingsFromPage');
 
   let suitableSibling = null;
@@ -436,6 +448,11 @@ export function findPreviousNonHangingsFromPage(element, topLimit, root) {
  * @returns {Element|null} - Highest such parent, or null if none.
  */
 export function findFirstChildParent(element, rootElement) {
+  return this.getChainCached('firstChildParent', element, rootElement, null,
+    () => walkFirstChildParent.call(this, element, rootElement));
+}
+
+function walkFirstChildParent(element, rootElement) {
   let parent = getFlowParent.call(this, element, 'findFirstChildParent:parent');
   let firstSuitableParent = null;
 
@@ -481,6 +498,11 @@ export function findFirstChildParent(element, rootElement) {
  * @returns {Element|null} - Highest such parent, or null if none.
  */
 export function findLastChildParent(element, rootElement) {
+  return this.getChainCached('lastChildParent', element, rootElement, null,
+    () => walkLastChildParent.call(this, element, rootElement));
+}
+
+function walkLastChildParent(element, rootElement) {
   let parent = getFlowParent.call(this, element, 'findLastChildParent:parent');
   let lastSuitableParent = null;
 
@@ -526,6 +548,7 @@ export function findAllForcedPageBreakInside(element) {
 }
 
 function getFlowParent(element, context) {
+  this.countChainStep();
   let parent = this._DOM.getParentNode(element);
   while (parent && this.shouldSkipFlowElement(parent, { context })) {
     // ⚗️ skip non-flow parents while moving upward
@@ -535,6 +558,7 @@ function getFlowParent(element, context) {
 }
 
 function getFlowFirstChild(parent, context) {
+  this.countChainStep();
   let child = this._DOM.getFirstElementChild(parent);
   while (child && this.shouldSkipFlowElement(child, { context })) {
     // ⚗️ advance to the first child that participates in the flow
@@ -544,6 +568,7 @@ function getFlowFirstChild(parent, context) {
 }
 
 function getFlowLastChild(parent, context) {
+  this.countChainStep();
   let child = this._DOM.getLastElementChild(parent);
   while (child && this.shouldSkipFlowElement(child, { context })) {
     // ⚗️ shift left until the last child contributes to layout
@@ -553,6 +578,7 @@ function getFlowLastChild(parent, context) {
 }
 
 function getFlowLeftNeighbor(element, context) {
+  this.countChainStep();
   let sibling = this._DOM.getLeftNeighbor(element);
   while (sibling && this.shouldSkipFlowElement(sibling, { context })) {
     // ⚗️ filter out hidden wrappers on the left side
@@ -345,6 +345,21 @@ export function isGridAutoFlowRow(element, style) {
   return res1 && res2;
 }
 
+/**
+ * @this {Node}
+ */
+export function isOrderedBlockFlow(element, style) {
+  // * The children are stacked top to bottom in document order:
+  // * a block container, not flex, grid or multi-column.
+  if (!(element instanceof HTMLElement)) {
+    return false
+  }
+  const computedStyle = style || this._DOM.getComputedStyle(element);
+  return ['block', 'flow-root', 'list-item'].includes(computedStyle.display)
+    && computedStyle.columnCount === 'auto'
+    && computedStyle.columnWidth === 'auto';
+}
+
 /**
  * @this {Node}
  */
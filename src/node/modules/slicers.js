@@ -126,6 +126,8 @@ export function getSplitPoints({
   // * (2)
   // * We need to take row tops from top to bottom, so we need a vertical alignment.
   this.setInitStyle (true, rootNode, _rootComputedStyle);
+  // * The tops are measured against the repositioned rootNode now.
+  this.invalidateChainCache();
 
   // 🤖 Guarantee cleanup for temporary layout mutations even on early exits.
   let finalized = false;
@@ -137,6 +139,7 @@ export function getSplitPoints({
     _isDebug(this) && console.groupEnd(`walking through ${children.length} children`);
     // *** need to revert back to the original positioning & vertical align of the rootNode:
     this.setInitStyle (false, rootNode, rootComputedStyle);
+    this.invalidateChainCache();
     _isDebug(this) && console.groupEnd(`getSplitPoints`);
     return points;
   };
@@ -647,11 +650,13 @@ export function sliceNodeBySplitPoints({ index, rootNode, splitPoints }) {
     'sliceNodeBySplitPoints: split point is not an Element within rootNode'
   );
 
+  const clones = this.cloneSlicesBySplitPoints(rootNode, splitPoints);
+
   for (let i = 0; i <= splitPoints.length; i++) {
     const startElement = splitPoints[i - 1] ?? null;
     const endElement = splitPoints[i] ?? null;
 
-    const slice = this.cloneAndCleanOutsideRange(rootNode, startElement, endElement);
+    const slice = clones[i];
     // * Range is [startElement .. endElement) — end is exclusive.
 
     this.normalizeContentCuts({
@@ -718,12 +723,10 @@ export function sliceNodeContentBySplitPoints({ index, rootNode, splitPoints })
 
   const slices = [];
 
-  for (let i = 0; i <= splitPoints.length; i++) {
-    const startElement = splitPoints[i - 1] ?? null;
-    const endElement = splitPoints[i] ?? null;
+  // * Clones of rootNode with the content of [startElement, endElement) each.
+  const clones = this.cloneSlicesBySplitPoints(rootNode, splitPoints);
 
-    // * Clone rootNode and remove content outside [startElement, endElement)
-    const slice = this.cloneAndCleanOutsideRange(rootNode, startElement, endElement);
+  for (const slice of clones) {
     _isDebug(this) && console.log({slice});
 
     // * Create a neutral wrapper for extracted content
@@ -754,6 +757,107 @@ export function isFirstSliceEmpty(points) {
   return points.length > 0 && points[0] === null;
 }
 
+/**
+ * Clones the root once per slice: [root start .. p0), [p0 .. p1), ..., [pk .. root end).
+ *
+ * The subtree is walked once (data-single-pass-slicing="true", opt-in):
+ * every element that contains no split point is deep-cloned into the slice
+ * it belongs to, the ancestors of the split points are cloned as empty shells
+ * into every slice they span. The result is the same as
+ * cloneAndCleanOutsideRange() for each range: elements outside the range
+ * are dropped, text and comment nodes of the shells are kept in every slice.
+ * This costs O(n) clones instead of O(k·n) clones and removals.
+ * The equivalence is checked in test/unit/slicers.test.js.
+ *
+ * Falls back to cloneAndCleanOutsideRange() for each range if the points
+ * are not distinct descendants of root in document order.
+ *
+ * @this {Node}
+ * @param {Element} root - Node to slice (stays unchanged).
+ * @param {Element[]} splitPoints - Elements that start the slices after the first one.
+ * @returns {Element[]} - splitPoints.length + 1 clones of root.
+ */
+export function cloneSlicesBySplitPoints(root, splitPoints) {
+  if (!this._config.singlePassSlicing || !_areOrderedDescendants(root, splitPoints)) {
+    const clones = [];
+    for (let i = 0; i <= splitPoints.length; i++) {
+      clones.push(this.cloneAndCleanOutsideRange(root, splitPoints[i - 1] ?? null, splitPoints[i] ?? null));
+    }
+    return clones;
+  }
+
+  // * Slice index that starts at each split point.
+  const sliceIndexByPoint = new Map(splitPoints.map((point, i) => [point, i + 1]));
+  // * Elements that contain split points.
+  const shellElements = new Set();
+  for (const point of splitPoints) {
+    for (let element = point.parentElement; element && element !== root && !shellElements.has(element); element = element.parentElement) {
+      shellElements.add(element);
+    }
+  }
+
+  const clones = [];
+  let currentSlice = 0;
+
+  // * frame: an element being walked, with its shells ({ slice, shell })
+  // * and its non-element children seen so far (for the shells created later).
+  const getShell = (frame) => {
+    const last = frame.shells.at(-1);
+    if (last && last.slice === currentSlice) {
+      return last.shell;
+    }
+    const shell = frame.element.cloneNode(false);
+    frame.texts.forEach(text => shell.appendChild(text.cloneNode(true)));
+    frame.shells.push({ slice: currentSlice, shell });
+    if (frame.parent) {
+      getShell(frame.parent).appendChild(shell);
+    } else {
+      clones[currentSlice] = shell;
+    }
+    return shell;
+  };
+
+  const walk = (frame) => {
+    for (const child of this._DOM.getChildNodes(frame.element)) {
+      if (!this._DOM.isElementNode(child)) {
+        frame.texts.push(child);
+        frame.shells.forEach(({ shell }) => shell.appendChild(child.cloneNode(true)));
+        continue;
+      }
+      if (sliceIndexByPoint.has(child)) {
+        currentSlice = sliceIndexByPoint.get(child);
+      }
+      if (shellElements.has(child)) {
+        const childFrame = { element: child, parent: frame, shells: [], texts: [] };
+        getShell(childFrame);
+        walk(childFrame);
+      } else {
+        getShell(frame).appendChild(child.cloneNode(true));
+      }
+    }
+  };
+
+  const rootFrame = { element: root, parent: null, shells: [], texts: [] };
+  getShell(rootFrame);
+  walk(rootFrame);
+
+  // * Every slice exists: slice 0 starts with the root, slice i with splitPoints[i - 1].
+  return clones;
+}
+
+function _areOrderedDescendants(root, points) {
+  for (let i = 0; i < points.length; i++) {
+    const point = points[i];
+    if (!point || point === root || !root.contains(point)) {
+      return false;
+    }
+    if (i > 0 && !(points[i - 1].compareDocumentPosition(point) & Node.DOCUMENT_POSITION_FOLLOWING)) {
+      return false;
+    }
+  }
+  return true;
+}
+
 /**
  * @this {Node}
  *
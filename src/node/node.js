@@ -33,6 +33,7 @@ import Table from './elements/table.js';
 import TableLike from './elements/tableLike.js';
 import Grid from './elements/grid.js';
 import Pre from './elements/pre.js';
+import UserTiming from '../userTiming.js';
 
 
 export default class Node {
@@ -49,13 +50,16 @@ export default class Node {
     this._assert = config.consoleAssert ? true : false;
     this._markupDebugMode = this._config.markupDebugMode;
     this._markers = new MarkersState({
-      debugMode: this._config.debugMode,
+      // * data-low-memory: no debug symbols on the elements.
+      debugMode: this._config.debugMode && !this._config.lowMemory,
       markupDebugMode: this._config.markupDebugMode,
       setAttribute: this._DOM.setAttribute.bind(this._DOM),
       removeAttribute: this._DOM.removeAttribute.bind(this._DOM),
     });
     this._marks = this._markers.marks;
-    this._cache = new CacheState();
+    this._cache = new CacheState({ DOM: this._DOM });
+    // * The splitter calls are measured with data-user-timing (see getSplitChildren).
+    this._timing = new UserTiming(config.userTiming);
 
     Object.assign(this, Logging);
 
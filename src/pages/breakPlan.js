@@ -0,0 +1,112 @@
+import { VERSION } from '../version.js';
+import { MARK_DEFS } from '../node/markers/defs.js';
+
+// * Break plan: a compact record of how the top-level children of the
+// * content flow were paginated, to skip re-measurement on the next load
+// * of the same document with the same config.
+// *
+// * {
+// *   version, configHash, contentHash, pageCount,
+// *   entries: one per top-level child (getPreparedChildren(contentFlow)):
+// *     0 — fits on the current page, nothing changed (skipped on replay);
+// *     1 — split, scaled or otherwise changed the DOM (parsed again on replay);
+// *     [[childIndex, pageTop], ...] — pages that start at top-level children.
+// * }
+// *
+// * Splits of paragraphs/tables/grids/pre are not replayed from offsets:
+// * their children are produced by the splitters again (entry 1),
+// * everything else is applied from the plan and verified by page tops.
+
+export const BREAK_PLAN_VERSION = 1;
+export const BREAK_PLAN_STATUS_ATTR = 'html2pdf4doc-break-plan';
+
+export const BREAK_PLAN_FIT = 0;
+export const BREAK_PLAN_PARSE = 1;
+
+// * Allowed difference between the recorded and the replayed page top.
+export const BREAK_PLAN_TOP_TOLERANCE = 1;
+
+// * FNV-1a, 32 bit.
+export function hashString(string) {
+  let hash = 0x811c9dc5;
+  for (let i = 0; i < string.length; i += 1) {
+    hash ^= string.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193);
+  }
+  return (hash >>> 0).toString(16).padStart(8, '0');
+}
+
+export function computeConfigHash(params) {
+  return hashString(JSON.stringify({ version: VERSION, ...params }));
+}
+
+export function computeContentHash(DOM, contentFlow, content) {
+  const tags = content.map(element => DOM.getElementTagName(element) || '#').join(',');
+  return hashString(`${content.length}|${tags}|${contentFlow.textContent}`);
+}
+
+// * Accepts a plan object, a JSON string or a URL of a JSON file.
+export async function loadBreakPlan(value) {
+  if (!value) {
+    return null;
+  }
+  if (typeof value === 'object') {
+    return value;
+  }
+  const text = String(value).trim();
+  if (text.startsWith('{')) {
+    return parseBreakPlan(text);
+  }
+  try {
+    const response = await fetch(text);
+    return response.ok ? parseBreakPlan(await response.text()) : null;
+  } catch (error) {
+    return null;
+  }
+}
+
+function parseBreakPlan(text) {
+  try {
+    return JSON.parse(text);
+  } catch (error) {
+    return null;
+  }
+}
+
+// * Tells whether parsing a top-level child changed the DOM,
+// * ignoring the marker attributes (they are written in debug/test mode only
+// * and do not affect the layout).
+export class BreakPlanRecorder {
+  constructor({ selector, contentFlow }) {
+    this._contentFlow = contentFlow;
+    this._ignoredAttributes = new Set(
+      Object.values(MARK_DEFS)
+        .filter(def => def.kind !== 'style')
+        .map(def => selector[def.selectorKey])
+        .filter(Boolean)
+        .map(attributeSelector => attributeSelector.replace(/^\[|\]$/g, ''))
+    );
+    this._observer = null;
+  }
+
+  start() {
+    this._observer = new MutationObserver(() => {});
+    this._observer.observe(this._contentFlow, {
+      subtree: true,
+      childList: true,
+      attributes: true,
+      characterData: true,
+    });
+  }
+
+  takeMutations() {
+    return this._observer.takeRecords().some(
+      record => record.type !== 'attributes' || !this._ignoredAttributes.has(record.attributeName)
+    );
+  }
+
+  stop() {
+    this._observer.disconnect();
+    this._observer = null;
+  }
+}
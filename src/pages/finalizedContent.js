@@ -0,0 +1,134 @@
+// * Finalized-page containment (data-contain-finalized-pages="true").
+// *
+// * Splitting and scaling write to the DOM while Pages measures it,
+// * and the next measurement lays out the whole content flow again,
+// * so the cost of the pagination grows with the length of the document.
+// *
+// * The top-level content that lies entirely above the previous page
+// * is not read by the parser anymore. It is moved out of the document
+// * into a fragment and replaced with a spacer of the same height,
+// * so that every following measurement lays out only the active pages.
+// * The content is put back with release() before the page ends are resolved.
+// *
+// * Only the top-level children of the content flow are detached.
+// * A document whose content is in one wrapper (e.g. a StrictDoc document)
+// * has nothing to detach until its end, and is laid out as without the
+// * containment; the 0010 test_02 case shows this.
+// *
+// * The spacer is checked by the top of the first remaining element:
+// * if the geometry cannot be kept (e.g. margins that no longer collapse),
+// * the content is put back and the containment is turned off.
+
+// * Number of top-level nodes moved at once: every move costs a relayout.
+const BATCH_SIZE = 32;
+const TOP_TOLERANCE = 0.5;
+
+export default class FinalizedContent {
+  constructor({
+    DOM,
+    node,
+    selector,
+    root,
+    contentFlow,
+    debug = {},
+  }) {
+    this._DOM = DOM;
+    this._node = node;
+    this._selector = selector;
+    this._root = root;
+    this._contentFlow = contentFlow;
+    this._debug = debug;
+
+    this._fragment = null;
+    this._spacer = null;
+    this._spacerHeight = 0;
+    this._isDisabled = false;
+
+    // * { detachedNodes, batches, disabled }: the nodes moved out of the document,
+    // * the moves, and whether the containment was turned off.
+    this.stats = { detachedNodes: 0, batches: 0, disabled: false };
+  }
+
+  // * Called after each top-level child of the content flow is parsed.
+  contain(current, pages) {
+    if (this._isDisabled || pages.length < 3) {
+      return;
+    }
+    // * Everything above the previous page is final.
+    const boundary = pages.at(-2).pageTop;
+    const first = this._DOM.getRightNeighbor(
+      this._spacer || this._DOM.getElement(this._selector.contentFlowStart, this._contentFlow)
+    );
+
+    // * Only HTML elements are measured: SVG and text nodes between them
+    // * are moved together with their neighbours.
+    let next = null;
+    let count = 0;
+    for (
+      let item = first;
+      item && item !== current && count < BATCH_SIZE;
+      item = this._DOM.getRightNeighbor(item)
+    ) {
+      if (!(item instanceof HTMLElement)) {
+        continue;
+      }
+      if (this._node.isContentFlowEnd(item) || !(this._node.getBottom(item, this._root) < boundary)) {
+        break;
+      }
+      count += 1;
+      next = this._DOM.getRightNeighbor(item);
+    }
+
+    if (count < BATCH_SIZE) {
+      return;
+    }
+    this._detach(first, next);
+  }
+
+  _detach(first, next) {
+    const nextTop = this._node.getTop(next, this._root);
+    const startTop = this._node.getTop(this._spacer || first, this._root);
+    const nodes = this._spacer
+      ? this._DOM.getSiblingsUntil(this._spacer, next).slice(1)
+      : this._DOM.getSiblingsUntil(first, next);
+
+    if (!this._spacer) {
+      this._fragment = this._DOM.createDocumentFragment();
+      this._spacer = this._node.createFinalizedContentSpacer();
+      this._DOM.insertBefore(first, this._spacer);
+    }
+    this._DOM.insertAtEnd(this._fragment, ...nodes);
+    this.stats.detachedNodes += nodes.length;
+    this.stats.batches += 1;
+
+    // * The first estimate ignores the collapsed margins,
+    // * the second one corrects it by the measured shift.
+    this._setSpacerHeight(nextTop - startTop);
+    this._setSpacerHeight(this._spacerHeight + nextTop - this._node.getTop(next, this._root));
+
+    if (Math.abs(this._node.getTop(next, this._root) - nextTop) > TOP_TOLERANCE) {
+      this._debug._ && console.warn('📦 finalized content cannot keep the geometry, containment is off', next);
+      this.release();
+      this._isDisabled = true;
+      this.stats.disabled = true;
+      return;
+    }
+    this._debug._ && console.log('📦 finalized content detached:', nodes.length, 'total:', this.stats.detachedNodes);
+  }
+
+  _setSpacerHeight(height) {
+    this._spacerHeight = Math.max(0, height);
+    this._DOM.setStyle(this._spacer, 'height', `${this._spacerHeight}px`);
+  }
+
+  // * Puts the content back in place of the spacer.
+  release() {
+    if (!this._spacer) {
+      return;
+    }
+    this._DOM.insertInsteadOf(this._spacer, this._fragment);
+    this._spacer = null;
+    this._fragment = null;
+    this._spacerHeight = 0;
+  }
+}
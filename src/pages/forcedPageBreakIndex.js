@@ -0,0 +1,105 @@
+// * Forced page breaks in document order.
+// *
+// * The markers are inserted by Pages._prepareForcedPageBreakElements()
+// * before the pagination. Instead of querying the subtree of every element
+// * that fits on the page, Pages takes the markers inside it from this index:
+// * the elements are parsed in document order, so a cursor that only moves
+// * forward skips the markers above the element, and the markers inside it
+// * follow the cursor.
+// *
+// * The index is built again from the content flow if a marker at the cursor
+// * has left the document (e.g. its container was sliced into clones,
+// * or moved out by the finalized-page containment).
+
+import { withLegacySelector } from '../selector.js';
+
+export default class ForcedPageBreakIndex {
+  constructor({
+    DOM,
+    selector,
+    contentFlow,
+    debug = {},
+  }) {
+    this._DOM = DOM;
+    this._selector = selector;
+    this._contentFlow = contentFlow;
+    this._debug = debug;
+
+    this._markers = [];
+    this._cursor = 0;
+
+    // * { markers, lookups, steps, rebuilds }
+    this.stats = {
+      markers: 0,
+      lookups: 0,
+      steps: 0,
+      rebuilds: 0,
+    };
+  }
+
+  build() {
+    // * One query for the current and the legacy marker: document order.
+    this._markers = [...this._DOM.getAllElements(
+      withLegacySelector(this._selector.printForcedPageBreak),
+      this._contentFlow
+    )];
+    this._cursor = 0;
+    this.stats.markers = this._markers.length;
+    return this;
+  }
+
+  // * Returns the markers inside the element (not the element itself),
+  // * in document order.
+  getInside(element) {
+    this.stats.lookups += 1;
+    const inside = [];
+    for (let i = this._seek(element); i < this._markers.length; i++) {
+      const marker = this._markers[i];
+      if (marker === element || !element.contains(marker)) {
+        break;
+      }
+      inside.push(marker);
+      this.stats.steps += 1;
+    }
+    return inside;
+  }
+
+  // * Returns the first marker inside or after the element, or null.
+  getNext(element) {
+    this.stats.lookups += 1;
+    return this._markers[this._seek(element)] || null;
+  }
+
+  // * Moves the cursor to the first marker that is not above the element.
+  _seek(element) {
+    // * Step back if the element is above the cursor (not expected during the walk).
+    while (this._cursor > 0 && !this._isAbove(this._markers[this._cursor - 1], element)) {
+      this._cursor -= 1;
+      this.stats.steps += 1;
+    }
+
+    // * Skip the markers above the element.
+    while (this._cursor < this._markers.length && this._isAbove(this._markers[this._cursor], element)) {
+      this._cursor += 1;
+      this.stats.steps += 1;
+    }
+
+    const marker = this._markers[this._cursor];
+    if (marker && !marker.isConnected) {
+      this.stats.rebuilds += 1;
+      this._debug._ && console.log('📑 forced page break index is rebuilt at', element);
+      this.build();
+      return this._seek(element);
+    }
+    return this._cursor;
+  }
+
+  _isAbove(marker, element) {
+    if (!marker.isConnected) {
+      return false;
+    }
+    const position = element.compareDocumentPosition(marker);
+    return Boolean(position & Node.DOCUMENT_POSITION_PRECEDING)
+      && !(position & Node.DOCUMENT_POSITION_CONTAINS);
+  }
+}
@@ -0,0 +1,31 @@
+// * Gap below inline media, per line parent.
+// *
+// * An image in a line box sits on the baseline: the descender and the
+// * half-leading of the line parent push its bottom below the image.
+// * Node.estimateInlineImgGapBelow() measures that gap from the font
+// * metrics of the parent, which do not change during the pagination,
+// * so the estimate is kept per parent and measured once.
+
+export default class InlineMediaGaps {
+  constructor() {
+    this._gaps = new WeakMap();
+    this.stats = {
+      gapEstimates: 0,
+      gapHits: 0,
+    };
+  }
+
+  getGapBelow(parent, estimate) {
+    if (!parent) {
+      this.stats.gapEstimates += 1;
+      return estimate();
+    }
+    if (this._gaps.has(parent)) {
+      this.stats.gapHits += 1;
+    } else {
+      this.stats.gapEstimates += 1;
+      this._gaps.set(parent, estimate());
+    }
+    return this._gaps.get(parent);
+  }
+}
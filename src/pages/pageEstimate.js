@@ -0,0 +1,137 @@
+// * Page count estimate (data-page-estimate="true" | "only").
+// *
+// * Predicts the page count (the [pages] attribute of the root) from the
+// * geometry of the top-level children of the content flow, without
+// * splitting anything: the content flow is measured once, while the layout
+// * is still clean, and the pagination is simulated on the measured boxes.
+// *
+// * - Forced page breaks start new pages at their tops.
+// * - Unbreakable blocks (no-break, replaced elements, short blocks)
+// *   that do not fit are moved to the next page; taller ones are scaled
+// *   to a page of their own.
+// * - Breakable blocks continue on the next pages; every split loses
+// *   some space: the rest of the last line, the lines moved by the
+// *   orphan/widow limits, the split labels of tables.
+// *
+// * The simulation runs with no loss (min), the expected loss (pages)
+// * and the maximal loss (max): the real count is expected within [min, max].
+
+export default class PageEstimate {
+  constructor({
+    DOM,
+    node,
+    selector,
+    root,
+    contentFlow,
+    referenceHeight,
+    commonLineHeight,
+    minBreakableLines,
+    signpostHeight,
+    debug = {},
+  }) {
+    this._DOM = DOM;
+    this._node = node;
+    this._selector = selector;
+    this._root = root;
+    this._contentFlow = contentFlow;
+    this._referenceHeight = referenceHeight;
+    this._commonLineHeight = commonLineHeight;
+    this._minBreakableLines = minBreakableLines;
+    this._signpostHeight = signpostHeight;
+    this._debug = debug;
+  }
+
+  // * Returns { pages, min, max, ms }.
+  estimate() {
+    const start = performance.now();
+
+    const contentFlowStart = this._DOM.getElement(this._selector.contentFlowStart, this._contentFlow);
+    const contentTop = this._node.getTop(contentFlowStart, this._root);
+    const breaks = this._node.findAllForcedPageBreakInside(this._contentFlow)
+      .map(element => this._node.getTop(element, this._root))
+      // * A break at the start of the content does not add a page.
+      .filter(top => top > contentTop)
+      .sort((a, b) => a - b);
+    const blocks = this._measureBlocks();
+
+    const result = {
+      pages: this._simulate(contentTop, blocks, breaks, 'expectedLoss'),
+      min: this._simulate(contentTop, blocks, breaks, null),
+      max: this._simulate(contentTop, blocks, breaks, 'maxLoss'),
+      ms: 0,
+    };
+    result.ms = Math.round((performance.now() - start) * 10) / 10;
+
+    this._debug._ && console.log('📏 page estimate:', result, { blocks: blocks.length, breaks: breaks.length });
+    return result;
+  }
+
+  _measureBlocks() {
+    const minimumBreakableHeight = this._commonLineHeight * this._minBreakableLines;
+    return this._node.getPreparedChildren(this._contentFlow)
+      .filter(element => element instanceof HTMLElement
+        && !this._node.isContentFlowStart(element)
+        && !this._node.isContentFlowEnd(element)
+        && !this._node.isForcedPageBreak(element))
+      .map(element => {
+        const top = this._node.getTop(element, this._root);
+        const bottom = this._node.getBottom(element, this._root);
+        const isBreakable = bottom - top >= minimumBreakableHeight
+          && !this._node.isNotBreakable(element)
+          && !this._node.resolveReplacedElement(element);
+        // * Tables and table-like blocks get split labels on both sides
+        // * and lose up to a row on every split.
+        const labels = isBreakable && this._node.isSliced(element) ? 2 * this._signpostHeight : 0;
+        return {
+          top,
+          bottom,
+          isBreakable,
+          expectedLoss: labels + this._commonLineHeight / 2,
+          maxLoss: labels + minimumBreakableHeight,
+        };
+      });
+  }
+
+  _simulate(contentTop, blocks, breaks, lossKey) {
+    const height = this._referenceHeight;
+    let pages = 1;
+    let pageTop = contentTop;
+    let breakIndex = 0;
+
+    const fill = (block, bottom) => {
+      if (bottom - pageTop <= height) {
+        return;
+      }
+      if (!block.isBreakable) {
+        pages += 1;
+        pageTop = Math.max(pageTop, block.top);
+        // * A block taller than the page is scaled to fit it.
+        pageTop = Math.max(pageTop, bottom - height);
+        return;
+      }
+      const step = Math.max(height - (lossKey ? block[lossKey] : 0), this._commonLineHeight);
+      while (bottom - pageTop > height) {
+        pages += 1;
+        pageTop += step;
+      }
+    };
+
+    for (const block of blocks) {
+      while (breakIndex < breaks.length && breaks[breakIndex] <= block.top) {
+        pages += 1;
+        pageTop = breaks[breakIndex];
+        breakIndex += 1;
+      }
+      // * Forced page breaks nested in the block.
+      while (breakIndex < breaks.length && breaks[breakIndex] < block.bottom) {
+        fill(block, breaks[breakIndex]);
+        pages += 1;
+        pageTop = breaks[breakIndex];
+        breakIndex += 1;
+      }
+      fill(block, block.bottom);
+    }
+    // * Forced page breaks after the last block.
+    return pages + breaks.length - breakIndex;
+  }
+}
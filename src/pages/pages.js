@@ -1,6 +1,21 @@
 import arrayFromString from './arrayFromString.js';
 import * as Logging from '../utils/logging.js';
 import { createHideIgnorableSpacerParagraphMutation } from '../mutations/commands.js';
+import {
+  BREAK_PLAN_VERSION,
+  BREAK_PLAN_FIT,
+  BREAK_PLAN_PARSE,
+  BREAK_PLAN_TOP_TOLERANCE,
+  BreakPlanRecorder,
+  computeConfigHash,
+  computeContentHash,
+} from './breakPlan.js';
+import FinalizedContent from './finalizedContent.js';
+import InlineMediaGaps from './inlineMediaGaps.js';
+import ForcedPageBreakIndex from './forcedPageBreakIndex.js';
+import PageEstimate from './pageEstimate.js';
+import { parsePageRange } from '../utils/pageRange.js';
+import UserTiming from '../userTiming.js';
 
 const CONSOLE_CSS_COLOR_PAGES = '#66CC00';
 const CONSOLE_CSS_PRIMARY_PAGES = `color: ${CONSOLE_CSS_COLOR_PAGES};font-weight:bold`;
@@ -10,6 +25,9 @@ const CONSOLE_CSS_LABEL_PAGES = `border:1px solid ${CONSOLE_CSS_COLOR_PAGES};`
 
 const CONSOLE_CSS_END_LABEL = `background:#999;color:#FFF;padding: 0 4px;`;
 
+// * Shorter runs of fitting siblings are parsed one by one.
+const GALLOP_MIN_RUN = 4;
+
 export default class Pages {
 
   constructor({
@@ -21,6 +39,7 @@ export default class Pages {
     referenceWidth,
     referenceHeight,
     mutationQueue,
+    breakPlan,
   }) {
 
     Object.assign(this, Logging);
@@ -81,25 +100,164 @@ export default class Pages {
     this._commonLineHeight = this._node.getLineHeight(this._root);
     this._minimumBreakableHeight = this._commonLineHeight * this._minBreakableLines;
 
+    // * Break plan (see breakPlan.js):
+    // * - breakPlan: a plan to replay (data-break-plan or init({ breakPlan }));
+    // * - breakPlanRecord: record a plan during the calculation (data-break-plan-record).
+    this._breakPlanToReplay = breakPlan || null;
+    this._breakPlanRecord = Boolean(config.breakPlanRecord);
+    this._configHash = computeConfigHash({
+      referenceWidth: this._referenceWidth,
+      referenceHeight: this._referenceHeight,
+      commonLineHeight: this._commonLineHeight,
+      signpostHeight: this._signpostHeight,
+      selectors: this._configSelectors,
+    });
+
+    // * Finalized-page containment (data-contain-finalized-pages, see finalizedContent.js).
+    this._finalizedContent = config.containFinalizedPages
+      ? new FinalizedContent({
+        DOM,
+        node,
+        selector,
+        root: this._root,
+        contentFlow: this._contentFlow,
+        debug: this._debug,
+      })
+      : null;
+
+    // * Page range (data-page-range): document page numbers,
+    // * the frontpage (if any) is page 1 and is not paginated here.
+    // * The pagination stops as soon as the page after the range is registered.
+    this._requestedPageRange = parsePageRange(config.pageRange);
+    this._frontpageOffset = layout.frontpageTemplate ? 1 : 0;
+    this._rangeFirstIndex = this._requestedPageRange
+      ? Math.max(0, this._requestedPageRange.first - 1 - this._frontpageOffset)
+      : 0;
+    this._rangeLastPage = this._requestedPageRange
+      ? Math.max(1, this._requestedPageRange.last - this._frontpageOffset)
+      : Infinity;
+    // * The range is not recorded into a break plan.
+    this._requestedPageRange && (this._breakPlanRecord = false);
+
+    // * Page count estimate (data-page-estimate, see pageEstimate.js).
+    this._pageEstimate = config.pageEstimate;
+
+    // * Gaps below inline media, per line parent (see inlineMediaGaps.js).
+    this._inlineMediaGaps = new InlineMediaGaps();
+
+    // * Galloping over the siblings that fit (data-gallop-siblings, see _gallopFittingSiblings).
+    this._gallopSiblings = config.gallopSiblings;
+    // * Parent element -> its children are stacked in document order (see _isGallopParent).
+    this._gallopParents = new WeakMap();
+
+    // * The time per registered page (data-user-timing, see userTiming.js).
+    this._timing = new UserTiming(config.userTiming);
+    this._pageTimingStart = 0;
+
     // * ***
     this._contentFlowEnd;
     this._contentFlowLastChild;
     // * Public
 
     this.pages = [];
+    // * The rendered range in document page numbers: { first, last, isComplete, isEmpty },
+    // * where isComplete is false if the document continues after the range,
+    // * and isEmpty is true if the range starts after the last page;
+    // * null if the whole document is rendered.
+    this.pageRange = null;
+    // * The recorded plan (breakPlanRecord) and the replay result:
+    // * 'replayed' | 'fallback' | 'rejected' | null (no plan was given).
+    this.breakPlan = null;
+    this.breakPlanStatus = null;
+    // * { pages, min, max, ms, actualPages }, see pageEstimate.js;
+    // * actualPages is set by calculate() if the whole document is paginated.
+    this.pageEstimate = null;
+    // * Counters of the chain cache: { lookups, hits, walks, steps, savedSteps, invalidations }.
+    this.chainCacheStats = null;
+    // * Counters of the forced page break index: { markers, lookups, steps, rebuilds }.
+    this.forcedPageBreakStats = null;
+    // * Counters of the galloping over fitting siblings: { runs, skipped, probes, unordered },
+    // * where unordered counts the runs dropped because the tops went up.
+    this.gallopStats = { runs: 0, skipped: 0, probes: 0, unordered: 0 };
+    // * Counters of the gaps below inline media: { gapEstimates, gapHits }.
+    this.inlineMediaGapsStats = null;
+    // * Counters of the finalized-page containment: { detachedNodes, batches, disabled },
+    // * null without data-contain-finalized-pages.
+    this.finalizedContentStats = null;
   }
 
   calculate() {
     this._removeGarbageElements();
     this._prepareConfigSelectorConstraints();
+    this._pageEstimate && this._estimatePageCount();
+    // * Memoized chain walks of findBetterPageStart() and others
+    // * (see node/cache/chainCache.js), for the time of the pagination.
+    this._node.startChainCache();
+    // * Forced page breaks inside the parsed elements (see forcedPageBreakIndex.js).
+    this._forcedPageBreaks = new ForcedPageBreakIndex({
+      DOM: this._DOM,
+      selector: this._selector,
+      contentFlow: this._contentFlow,
+      debug: this._debug,
+    }).build();
+    this._pageTimingStart = performance.now();
     this._calculatePageStarts();
+    this.chainCacheStats = this._node.stopChainCache();
+    this.forcedPageBreakStats = { ...this._forcedPageBreaks.stats };
+    this.inlineMediaGapsStats = { ...this._inlineMediaGaps.stats };
+    this.finalizedContentStats = this._finalizedContent ? { ...this._finalizedContent.stats } : null;
     this._resolvePageEnds();
+    this._applyPageRange();
+    if (this.breakPlan) {
+      this.breakPlan.pageCount = this.pages.length;
+    }
+    if (this.pageEstimate && !this.pageRange) {
+      this.pageEstimate.actualPages = this.pages.length;
+    }
 
     this._debug._ && console.log('%c ✔ Pages.calculate()', CONSOLE_CSS_LABEL_PAGES, this.pages);
 
     return this.pages;
   }
 
+  // * data-low-memory: drops the pagination state once the preview is built.
+  // * The counters, the page range and the break plan stay.
+  release() {
+    this.pages = [];
+    this._forcedPageBreaks = null;
+    this._finalizedContent = null;
+    this._mutationQueue = null;
+    this._inlineMediaGaps = new InlineMediaGaps();
+    this._contentFlowEnd = null;
+    this._contentFlowLastChild = null;
+  }
+
+  // * Estimates the page count without paginating (data-page-estimate="only").
+  estimate() {
+    this._removeGarbageElements();
+    this._prepareConfigSelectorConstraints();
+    return this._estimatePageCount();
+  }
+
+  _estimatePageCount() {
+    this.pageEstimate = {
+      ...new PageEstimate({
+        DOM: this._DOM,
+        node: this._node,
+        selector: this._selector,
+        root: this._root,
+        contentFlow: this._contentFlow,
+        referenceHeight: this._referenceHeight,
+        commonLineHeight: this._commonLineHeight,
+        minBreakableLines: this._minBreakableLines,
+        signpostHeight: this._signpostHeight,
+        debug: this._debug,
+      }).estimate(),
+      actualPages: null,
+    };
+    return this.pageEstimate;
+  }
+
   _removeGarbageElements() {
     const _garbageSelectors = arrayFromString(this._configSelectors.garbage);
     if (_garbageSelectors.length) {
@@ -238,7 +396,7 @@ export default class Pages {
   }
 
   _resolveForcedPBInsideContentFlow() {
-    this._node.findAllForcedPageBreakInside(this._contentFlow).forEach(
+    this._forcedPageBreaks.getInside(this._contentFlow).forEach(
       element => this._registerPageStart({ element, context: 'All Forced Page Break Inside _contentFlow' })
     );
   }
@@ -269,9 +427,239 @@ export default class Pages {
     this._debug._ && console.log(content);
     this._debug._ && console.groupEnd('%c🚸 children(contentFlow)', CONSOLE_CSS_LABEL_PAGES);
 
-    this._parseNodes({
-      array: content
+    this._parseContentFlow(content);
+  }
+
+  _isPageRangeComplete() {
+    return this.pages.length > this._rangeLastPage;
+  }
+
+  _applyPageRange() {
+    const range = this._requestedPageRange;
+    if (!range) {
+      return;
+    }
+    const hasMorePages = this.pages.length > this._rangeLastPage;
+    // * The range starts after the end of the document: the last page is kept
+    // * for the preview, and the range is reported as empty.
+    const isEmpty = this._rangeFirstIndex > this.pages.length - 1;
+    if (isEmpty) {
+      const documentPages = this.pages.length + this._frontpageOffset;
+      console.warn(
+        `[HTML2PDF4DOC] The page range starts at page ${range.first}, `
+        + `but the document has ${documentPages} pages. Only the last page is rendered.`
+      );
+      this.strictAssert(false, 'The page range is empty:', range, 'pages:', documentPages);
+    }
+    const firstIndex = Math.min(this._rangeFirstIndex, this.pages.length - 1);
+    const lastIndex = Math.min(this._rangeLastPage, this.pages.length) - 1;
+
+    // * The content after the range and before it is hidden
+    // * on screen and in print.
+    hasMorePages && this._hideContentOutsideRange(this.pages[lastIndex + 1].pageStart, 'after');
+    firstIndex > 0 && this._hideContentOutsideRange(this.pages[firstIndex].pageStart, 'before');
+
+    // * Pages are renumbered from 1.
+    this.pages.forEach(page => this._node.unmarkPageStart(page.pageStart));
+    this.pages = this.pages.slice(firstIndex, lastIndex + 1);
+    this.pages.forEach((page, index) => this._node.markPageStart(page.pageStart, index + 1));
+
+    if (hasMorePages) {
+      this.pages.at(-1).toResetBottom = undefined;
+    }
+
+    // * Document page numbers: the frontpage is added by Preview if the range starts with it.
+    this.pageRange = {
+      first: (this._frontpageOffset && range.first === 1) ? 1 : firstIndex + 1 + this._frontpageOffset,
+      last: lastIndex + 1 + this._frontpageOffset,
+      isComplete: !hasMorePages,
+      isEmpty,
+    };
+    this._debug._ && console.log('📑 page range', range, this.pageRange);
+  }
+
+  _hideContentOutsideRange(boundary, side) {
+    // * 'after': the boundary element and everything after it;
+    // * 'before': everything before the boundary element.
+    const hide = element => {
+      if (!this._node.isContentFlowStart(element) && !this._node.isContentFlowEnd(element)) {
+        this._DOM.setStyles(element, { display: ['none', 'important'] });
+      }
+    };
+    side === 'after' && hide(boundary);
+    for (
+      let current = boundary;
+      current && current !== this._contentFlow;
+      current = this._DOM.getParentNode(current)
+    ) {
+      for (
+        let sibling = side === 'after' ? this._DOM.getRightNeighbor(current) : this._DOM.getLeftNeighbor(current);
+        sibling;
+        sibling = side === 'after' ? this._DOM.getRightNeighbor(sibling) : this._DOM.getLeftNeighbor(sibling)
+      ) {
+        hide(sibling);
+      }
+    }
+  }
+
+  _parseContentFlow(content) {
+    const plan = this._acceptBreakPlan(content);
+    if (plan) {
+      this._replayBreakPlan(content, plan);
+    } else if (this._breakPlanRecord) {
+      this._recordBreakPlan(content);
+    } else if (this._finalizedContent) {
+      for (let i = 0; i < content.length; i++) {
+        this._parseNodeAt(content, i);
+        this._containFinalizedContent(content[i]);
+      }
+    } else {
+      this._parseNodes({
+        array: content
+      });
+    }
+    // * Page ends are resolved on the complete content flow.
+    this._finalizedContent?.release();
+  }
+
+  _containFinalizedContent(current) {
+    this._finalizedContent?.contain(current, this.pages);
+  }
+
+  _acceptBreakPlan(content) {
+    const plan = this._breakPlanToReplay;
+    if (!plan) {
+      return null;
+    }
+    const isValid = plan.version === BREAK_PLAN_VERSION
+      && plan.configHash === this._configHash
+      && plan.contentHash === computeContentHash(this._DOM, this._contentFlow, content)
+      && Array.isArray(plan.entries)
+      && plan.entries.length === content.length;
+    this._debug._ && console.log('🗺️ break plan', isValid ? 'accepted' : 'rejected', plan);
+    if (!isValid) {
+      this.breakPlanStatus = 'rejected';
+      return null;
+    }
+    return plan;
+  }
+
+  _recordBreakPlan(content) {
+    const indexByElement = new Map(content.map((element, index) => [element, index]));
+    const recorder = new BreakPlanRecorder({
+      selector: this._selector,
+      contentFlow: this._contentFlow,
     });
+    const entries = [];
+
+    recorder.start();
+    for (let i = 0; i < content.length; i++) {
+      const pagesBefore = this.pages.length;
+      const queuedBefore = this._mutationQueue?.size;
+      this._parseNodeAt(content, i);
+      const isChanged = recorder.takeMutations() || this._mutationQueue?.size !== queuedBefore;
+      const newPages = this.pages.slice(pagesBefore);
+
+      if (isChanged || !newPages.every(page => indexByElement.has(page.pageStart))) {
+        entries.push(BREAK_PLAN_PARSE);
+      } else if (!newPages.length) {
+        entries.push(BREAK_PLAN_FIT);
+      } else {
+        entries.push(newPages.map(page => [indexByElement.get(page.pageStart), Math.round(page.pageTop)]));
+      }
+      this._containFinalizedContent(content[i]);
+      // * Moving the finalized content is not a change of the next child.
+      recorder.takeMutations();
+    }
+    recorder.stop();
+
+    this.breakPlan = {
+      version: BREAK_PLAN_VERSION,
+      configHash: this._configHash,
+      contentHash: computeContentHash(this._DOM, this._contentFlow, content),
+      pageCount: null,
+      entries,
+    };
+  }
+
+  _replayBreakPlan(content, plan) {
+    // * Index from which the content has to be parsed again if the plan
+    // * turns out to be wrong: everything before it is verified.
+    let resumeIndex = 0;
+
+    for (let i = 0; i < content.length; i++) {
+      if (this._isPageRangeComplete()) {
+        this.breakPlanStatus = 'replayed';
+        return;
+      }
+      const entry = plan.entries[i];
+      if (entry === BREAK_PLAN_FIT) {
+        continue;
+      }
+      if (entry === BREAK_PLAN_PARSE) {
+        this._parseNodeAt(content, i);
+      } else if (!this._replayPageStarts(content, plan, entry)) {
+        this._fallbackFromBreakPlan(content, resumeIndex);
+        return;
+      }
+      this._containFinalizedContent(content[i]);
+      resumeIndex = i + 1;
+    }
+
+    // * The last fitting children must fit on the last page.
+    const lastIndex = content.length - 2;
+    if (lastIndex >= resumeIndex && !this._isFittingChild(content, plan, lastIndex)) {
+      this._fallbackFromBreakPlan(content, resumeIndex);
+      return;
+    }
+
+    this.breakPlanStatus = 'replayed';
+  }
+
+  _replayPageStarts(content, plan, pageStarts) {
+    const pagesBefore = this.pages.length;
+    for (const [index, pageTop] of pageStarts) {
+      const isVerified = this._isFittingChild(content, plan, index - 1)
+        && this._registerReplayedPageStart(content[index], pageTop);
+      if (!isVerified) {
+        while (this.pages.length > pagesBefore) {
+          this._node.unmarkPageStart(this.pages.pop().pageStart);
+        }
+        return false;
+      }
+    }
+    return true;
+  }
+
+  _registerReplayedPageStart(element, pageTop) {
+    const pagesBefore = this.pages.length;
+    this._registerPageStart({ element, context: 'replay break plan' });
+    if (this.pages.length !== pagesBefore + 1) {
+      return false;
+    }
+    if (Math.abs(this.pages.at(-1).pageTop - pageTop) > BREAK_PLAN_TOP_TOLERANCE) {
+      this._node.unmarkPageStart(this.pages.pop().pageStart);
+      return false;
+    }
+    return true;
+  }
+
+  _isFittingChild(content, plan, index) {
+    // * Only skipped children are checked: the parsed ones were verified by the parser.
+    if (index < 0 || plan.entries[index] !== BREAK_PLAN_FIT) {
+      return true;
+    }
+    const bottom = this._node.getBottom(content[index], this._root);
+    return bottom <= this.pages.at(-1).pageBottom + BREAK_PLAN_TOP_TOLERANCE;
+  }
+
+  _fallbackFromBreakPlan(content, resumeIndex) {
+    this._debug._ && console.warn('🗺️ break plan does not match the layout, parsing from', resumeIndex);
+    this.breakPlanStatus = 'fallback';
+    for (let i = resumeIndex; i < content.length; i++) {
+      this._parseNodeAt(content, i);
+      this._containFinalizedContent(content[i]);
+    }
   }
 
   _resolvePageEnds() {
@@ -354,6 +742,8 @@ export default class Pages {
       prevPageEnd: prevPageEnd,
     });
     this._node.markPageStart(pageStart, this.pages.length);
+    this._timing.measure(`page:${this.pages.length}`, this._pageTimingStart, { context });
+    this._pageTimingStart = performance.now();
     this._debug._registerPageStart && console.log(
       `%c📍register page ${this.pages.length}`, "background:yellow;font-weight:bold",
       '\n  improved result:', improveResult,
@@ -374,25 +764,155 @@ export default class Pages {
     this._debug._parseNodes && console.log('🔵 _parseNodes', {array, arrayTopParent, arrayBottomParent});
 
     for (let i = 0; i < array.length; i++) {
-      const currentElement = array[i];
-      const isFirstChild = i === 0;
-      const isLastChild = i === array.length - 1;
+      const skipped = this._gallopFittingSiblings(array, i);
+      if (skipped) {
+        i += skipped - 1;
+        continue;
+      }
+      this._parseNodeAt(array, i, { previous, next, arrayTopParent, arrayBottomParent });
+    }
+  }
 
-      // * First and last children inherit the parent as the page anchor when possible
-      // *** Here we throw from above or reset for non-edge ones.
-      const _topParent = isFirstChild ? arrayTopParent : undefined;
-      const _bottomParent = (isLastChild && arrayBottomParent) ? arrayBottomParent : undefined;
+  // * Galloping over the siblings that fit (data-gallop-siblings).
+  // * A run of children whose next sibling starts above the page bottom
+  // * would each be parsed as "fits" and only marked as processed.
+  // * The end of the run is found by an exponential, then a binary search
+  // * on the tops of the siblings, so a long run costs O(log n) measurements
+  // * instead of 3n. The search needs tops that do not go up, so only
+  // * the in-flow children of a block container are candidates (not flex,
+  // * grid or multi-column, not floats or positioned elements), and a run
+  // * whose probed tops are out of order is dropped and parsed one by one.
+  // * The run stops before any child that _parseNode treats differently:
+  // * a registered page start, a no-hanging element, a forced page break
+  // * or an element that contains the next one, a non-HTML element,
+  // * and the last child (its parent bottom matters).
+  // * Returns the number of skipped children.
+  _gallopFittingSiblings(array, i) {
+    if (!this._gallopSiblings || this._isPageRangeComplete()) {
+      return 0;
+    }
+    const nextForcedPageBreak = this._forcedPageBreaks.getNext(array[i]);
+    // * Candidates [i, limit) are checked as far as the search goes.
+    let limit = i;
+    const extendLimit = (k) => {
+      while (limit <= k && limit < array.length - 1 && this._isGallopCandidate(array[limit], nextForcedPageBreak)) {
+        limit += 1;
+      }
+      return limit;
+    };
+    if (extendLimit(i + GALLOP_MIN_RUN - 1) - i < GALLOP_MIN_RUN) {
+      return 0;
+    }
 
-      this._parseNode({
-        previousElement: array[i - 1] || previous,
-        currentElement,
-        nextElement: array[i + 1] || next,
-        isFirstChild,
-        isLastChild,
-        arrayTopParent: _topParent, // provided only for boundary children where the wrapper matters
-        arrayBottomParent: _bottomParent, // provided only for boundary children where the wrapper matters
-      });
+    // * The child at k fits if the next one starts above the page bottom.
+    const pageBottom = this.pages.at(-1).pageBottom;
+    // * Probed tops by index: a top above the top of an earlier sibling
+    // * means the search cannot be trusted.
+    const tops = new Map();
+    let isOrdered = true;
+    const fits = (k) => {
+      this.gallopStats.probes += 1;
+      const top = this._node.getTop(array[k + 1], this._root);
+      for (const [index, probedTop] of tops) {
+        if ((index < k + 1 && probedTop > top) || (index > k + 1 && probedTop < top)) {
+          isOrdered = false;
+        }
+      }
+      tops.set(k + 1, top);
+      return isOrdered && top < pageBottom;
+    };
+    if (!fits(i)) {
+      return 0;
+    }
+    let last = i; // * fits
+    let over; // * does not fit, or is not a candidate
+    for (let step = 1; over === undefined; step *= 2) {
+      const k = last + step;
+      if (extendLimit(k) <= k) {
+        over = limit;
+      } else if (fits(k)) {
+        last = k;
+      } else {
+        over = k;
+      }
+    }
+    while (isOrdered && over - last > 1) {
+      const middle = (last + over) >> 1;
+      fits(middle) ? (last = middle) : (over = middle);
+    }
+    if (!isOrdered) {
+      this.gallopStats.unordered += 1;
+      this._debug._parseNodes && console.log('🐎 gallop: the tops go up, parse one by one', array.slice(i, over + 1));
+      return 0;
+    }
+
+    for (let k = i; k <= last; k++) {
+      this._node.markProcessed(array[k], 'node fits (gallop)');
+    }
+    this.gallopStats.runs += 1;
+    this.gallopStats.skipped += last - i + 1;
+    this._debug._parseNodes && console.log('🐎 gallop: skipped', last - i + 1, 'fitting siblings', array.slice(i, last + 1));
+    return last - i + 1;
+  }
+
+  _isGallopCandidate(element, nextForcedPageBreak) {
+    if (!(element instanceof HTMLElement)
+      || this._node.isPageStart(element)
+      || this._node.isNoHanging(element)
+      || this._node.isForcedPageBreak(element)
+      || !this._isGallopParent(element.parentElement)) {
+      return false;
+    }
+    const style = this._DOM.getComputedStyle(element);
+    if (style.float !== 'none' || style.position === 'absolute' || style.position === 'fixed') {
+      return false;
     }
+    if (!nextForcedPageBreak) {
+      return true;
+    }
+    // * Markers are in document order: only the elements before the next one are skipped.
+    return !element.contains(nextForcedPageBreak)
+      && Boolean(element.compareDocumentPosition(nextForcedPageBreak) & Node.DOCUMENT_POSITION_FOLLOWING);
+  }
+
+  _isGallopParent(parent) {
+    if (!parent) {
+      return false;
+    }
+    if (!this._gallopParents.has(parent)) {
+      this._gallopParents.set(parent, this._node.isOrderedBlockFlow(parent));
+    }
+    return this._gallopParents.get(parent);
+  }
+
+  _parseNodeAt(array, i, {
+    previous,
+    next,
+    arrayTopParent,
+    arrayBottomParent,
+  } = {}) {
+    // * Early termination: the page range is complete.
+    if (this._isPageRangeComplete()) {
+      return;
+    }
+    const currentElement = array[i];
+    const isFirstChild = i === 0;
+    const isLastChild = i === array.length - 1;
+
+    // * First and last children inherit the parent as the page anchor when possible
+    // *** Here we throw from above or reset for non-edge ones.
+    const _topParent = isFirstChild ? arrayTopParent : undefined;
+    const _bottomParent = (isLastChild && arrayBottomParent) ? arrayBottomParent : undefined;
+
+    this._parseNode({
+      previousElement: array[i - 1] || previous,
+      currentElement,
+      nextElement: array[i + 1] || next,
+      isFirstChild,
+      isLastChild,
+      arrayTopParent: _topParent, // provided only for boundary children where the wrapper matters
+      arrayBottomParent: _bottomParent, // provided only for boundary children where the wrapper matters
+    });
   }
 
   // 📍
@@ -687,7 +1207,7 @@ export default class Pages {
 
       // ** Check for page break markers inside.
       // ** If there are - register new page starts.
-      this._node.findAllForcedPageBreakInside(currentElement).forEach(
+      this._forcedPageBreaks.getInside(currentElement).forEach(
         element => {
           this._node.markProcessed(element, 'node is ForcedPageBreak (inside a node that fits)');
           this._registerPageStart({ element, context: 'All Forced Page Break Inside currentElement' });
@@ -790,8 +1310,13 @@ export default class Pages {
           ? this._node.createSignpost(mediaElement)
           : mediaElement;
 
+        // * The size comes from the rendered box (CSS may give it other proportions
+        // * than the natural ones: width/height, object-fit, SVG viewBox).
+        // * Top, bottom and width are read one after another, in the same layout.
         const currentImageTop = this._node.getTop(currentImage, this._root);
         const currentImageBottom = this._node.getBottom(currentImage, this._root);
+        const currentImageHeight = currentImageBottom - currentImageTop;
+        const currentImageWidth = this._DOM.getElementOffsetWidth(currentImage);
         const parentTopForImage = (isFirstChild && arrayTopParent)
           ? this._node.getTop(arrayTopParent, this._root)
           : undefined;
@@ -806,7 +1331,10 @@ export default class Pages {
         // * display:contents parents still provide inherited line-height/fonts via getComputedStyle,
         // * so the estimate stays valid even when they don’t create boxes.
         const _imageParent = arrayTopParent || this._DOM.getParentNode(currentImage);
-        const imgGapBelow = this._node.estimateInlineImgGapBelow(_imageParent);
+        const imgGapBelow = this._inlineMediaGaps.getGapBelow(
+          _imageParent,
+          () => this._node.estimateInlineImgGapBelow(_imageParent)
+        );
 
         // include the wrapper's top margin only for the first child; otherwise
         // measure from the current image top.
@@ -832,9 +1360,6 @@ export default class Pages {
         // TODO: replace this._referenceWidth  with an padding/margin-dependent value
 
 
-        const currentImageHeight = this._DOM.getElementOffsetHeight(currentImage);
-        const currentImageWidth = this._DOM.getElementOffsetWidth(currentImage);
-
         this._debug._parseNode && console.log(
           '🖼️🖼️🖼️🖼️🖼️🖼️ (if mediaElement)', mediaElement,
           {
@@ -903,6 +1428,16 @@ export default class Pages {
         // *** 'true':
         // *** add the possibility of moving it with the wrap tag
         // *** if it's the first child
+        // * Rebuild the lower boundary for wrappers where the image stays the last child.
+        // * arrayParentBottomEdge only exists when the current element is the last child in the loop.
+        // * Measured before the page start is marked, in the same layout as the image.
+        const tailParent = arrayParentBottomEdge
+          ? null
+          : this._node.findLastChildParent(currentElement, this._contentFlow);
+        const tailBottomEdge = arrayParentBottomEdge
+          ? arrayParentBottomEdge
+          : this._node.getBottom((tailParent || currentElement), this._root);
+
         this._node.markProcessed(currentElement, `IMG starts on next`);
         const pageStartElement = isSvgMedia ? currentImage : mediaElement;
         this._registerPageStart({
@@ -919,14 +1454,6 @@ export default class Pages {
         // * because it is likely that a semantic improvement was made when the new page was registered,
         // * and the page starts somewhere above the image itself.
         let fullPageImageNodeSpace = this.pages.at(-1).pageBottom - currentImageTop - imgGapBelow;
-        // * Rebuild the lower boundary for wrappers where the image stays the last child.
-        // * arrayParentBottomEdge only exists when the current element is the last child in the loop.
-        const tailParent = arrayParentBottomEdge
-          ? null
-          : this._node.findLastChildParent(currentElement, this._contentFlow);
-        const tailBottomEdge = arrayParentBottomEdge
-          ? arrayParentBottomEdge
-          : this._node.getBottom((tailParent || currentElement), this._root);
         if (tailBottomEdge > currentImageBottom) {
           fullPageImageNodeSpace -= (tailBottomEdge - currentImageBottom);
         }
@@ -59,10 +59,10 @@ export default class Paper {
     this._calculatePaperParams();
   }
 
-  createPageChrome({ pageNumber, pageCount }) {
+  createPageChrome({ pageNumber, pageCount, displayedPageNumber }) {
     const wrapper = this._node.create(this._pageChromeSelector);
     this._node.markPageNumber(wrapper, pageNumber);
-    const pageElements = this._composePageElements({ pageNumber, pageCount });
+    const pageElements = this._composePageElements({ pageNumber, pageCount, displayedPageNumber });
     this._DOM.insertAtEnd(
       wrapper,
       pageElements
@@ -71,7 +71,36 @@ export default class Paper {
     return wrapper;
   }
 
-  _composePageElements({ pageNumber, pageCount }) {
+  createPageChromePlaceholder({ pageNumber }) {
+    // An empty page chrome with the height of the paper:
+    // its content is created with fillPageChrome() when the page
+    // is close to the viewport (see previewVirtualizer.js).
+    const wrapper = this._node.create(this._pageChromeSelector);
+    this._node.markPageNumber(wrapper, pageNumber);
+    this._DOM.setStyles(wrapper, { height: this._paperHeight + 'px' });
+    return wrapper;
+  }
+
+  fillPageChrome(wrapper, { pageNumber, pageCount, displayedPageNumber }) {
+    this._DOM.replaceNodeContentsWith(
+      wrapper,
+      this._composePageElements({ pageNumber, pageCount, displayedPageNumber })
+    );
+  }
+
+  emptyPageChrome(wrapper) {
+    const body = this._DOM.getElement(this._pageBodySpacerSelector, wrapper);
+    body && this._node.unmarkPageNumber(body);
+    this._DOM.setInnerHTML(wrapper, '');
+  }
+
+  _composePageElements({
+    pageNumber,
+    pageCount,
+    // * The number printed in the header and footer (see data-page-range),
+    // * pageCount is empty if the total is not known.
+    displayedPageNumber = pageNumber,
+  }) {
     const fragment = this._DOM.createDocumentFragment();
 
     const body = this._createPageBodySpacer(this.bodyHeight);
@@ -88,9 +117,9 @@ export default class Paper {
       this.createVirtualBottomMargin(),
     );
 
-    if (pageNumber && pageCount) {
-      this._setPageNumber(header, pageNumber, pageCount);
-      this._setPageNumber(footer, pageNumber, pageCount);
+    if (pageNumber && (pageCount || pageCount === '')) {
+      this._setPageNumber(header, displayedPageNumber, pageCount);
+      this._setPageNumber(footer, displayedPageNumber, pageCount);
     }
 
     return fragment;
@@ -15,13 +15,16 @@ export default class Preprocess {
     return this._resourceIssues;
   }
 
-  async _awaitResources() {
-    const timeoutMs = this._config.resourceTimeout ?? this._config.resourceTimeoutMs ?? 2000;
+  _getRootElement() {
     const rootSelector = this._config.initialRoot;
-    const rootElement = rootSelector
+    return rootSelector
       ? this._DOM.document.querySelector(rootSelector) || this._DOM.body
       : this._DOM.body;
-    const rootScope = rootElement ? [rootElement, ...rootElement.querySelectorAll('*')] : [];
+  }
+
+  async _awaitResources() {
+    const timeoutMs = this._config.resourceTimeout ?? this._config.resourceTimeoutMs ?? 2000;
+    const rootElement = this._getRootElement();
 
     // Fonts affect text metrics; wait for them before measuring layout.
     if (this._DOM.document.fonts?.ready) {
@@ -42,8 +45,9 @@ export default class Preprocess {
       return this._preloadUrl(href, img, timeoutMs);
     });
 
-    // Background images: collect URLs from computed styles.
-    const backgroundPromises = rootScope.flatMap((element) => {
+    // Background images: collect URLs from computed styles,
+    // but only for elements that can have a background image (see _collectBackgroundCandidates).
+    const backgroundPromises = this._collectBackgroundCandidates(rootElement).flatMap((element) => {
       const style = window.getComputedStyle(element);
       const urls = extractCssUrls(style.backgroundImage);
       return urls.map((url) => this._preloadUrl(url, element, timeoutMs));
@@ -76,6 +80,37 @@ export default class Preprocess {
     ]);
   }
 
+  _collectBackgroundCandidates(rootElement) {
+    // Resolving computed styles for every element is a full style recalculation
+    // of the document. Instead, find the style rules and inline styles that can set
+    // a background image, and resolve computed styles only for the matched elements.
+    if (!rootElement) {
+      return [];
+    }
+    const selectors = collectBackgroundRuleSelectors(this._DOM.document.styleSheets);
+    if (!selectors) {
+      // Some stylesheet rules are not readable (e.g. cross-origin): fall back to the full scan.
+      this._debugMode && console.log('[HTML2PDF4DOC] Background images: full scan (unreadable stylesheet)');
+      return [rootElement, ...rootElement.querySelectorAll('*')];
+    }
+
+    const candidates = new Set();
+    const addMatches = (selector) => {
+      try {
+        rootElement.matches(selector) && candidates.add(rootElement);
+        rootElement.querySelectorAll(selector).forEach((element) => candidates.add(element));
+      } catch (error) {
+        // Selectors that are not supported by querySelectorAll are ignored.
+        this._debugMode && console.log('[HTML2PDF4DOC] Background images: invalid selector', selector);
+      }
+    };
+    selectors.forEach(addMatches);
+    INLINE_BACKGROUND_SELECTORS.forEach(addMatches);
+
+    this._debugMode && console.log('[HTML2PDF4DOC] Background images: candidates', candidates.size, { selectors });
+    return [...candidates];
+  }
+
   _waitForImageElement(img, timeoutMs) {
     // If loading already ended with a broken image, mark it as error.
     if (img.complete && img.naturalWidth === 0) {
@@ -180,6 +215,62 @@ function withTimeout(promise, timeoutMs, onTimeout) {
   });
 }
 
+// Inline styles that can set a background image.
+const INLINE_BACKGROUND_SELECTORS = ['[style*="url(" i]', '[style*="var(" i]'];
+
+// Returns the selectors of the style rules that can set a background image,
+// or null when the rules of some stylesheet cannot be read.
+function collectBackgroundRuleSelectors(styleSheets) {
+  const selectors = new Set();
+  const visitRules = (rules) => {
+    for (const rule of rules) {
+      if (rule.styleSheet) {
+        // @import
+        if (!visitSheet(rule.styleSheet)) return false;
+        continue;
+      }
+      if (rule.style && rule.selectorText && canSetBackgroundImageInRule(rule.style)) {
+        selectors.add(stripPseudoElements(rule.selectorText));
+      }
+      // @media, @supports, @layer, nested rules
+      if (rule.cssRules && !visitRules(rule.cssRules)) return false;
+    }
+    return true;
+  };
+  const visitSheet = (sheet) => {
+    let rules;
+    try {
+      rules = sheet.cssRules;
+    } catch (error) {
+      return false;
+    }
+    return rules ? visitRules(rules) : true;
+  };
+  for (const sheet of styleSheets || []) {
+    if (!visitSheet(sheet)) return null;
+  }
+  return [...selectors].filter(Boolean);
+}
+
+function canSetBackgroundImageInRule(style) {
+  // With var() in the `background` shorthand, the longhands stay empty
+  // until the variable is substituted: the shorthand is checked too.
+  return canSetBackgroundImage(style.backgroundImage)
+    || canSetBackgroundImage(style.getPropertyValue('background'));
+}
+
+function canSetBackgroundImage(value) {
+  // A custom property can carry the URL, so `var()` values are also candidates.
+  const lowerCaseValue = (value || '').toLowerCase();
+  return lowerCaseValue.includes('url(') || lowerCaseValue.includes('var(');
+}
+
+function stripPseudoElements(selectorText) {
+  // Pseudo-element backgrounds are not visible in the element's computed style,
+  // so match the originating element instead.
+  return selectorText.replace(/::?(before|after|marker|placeholder|selection|first-line|first-letter|backdrop)\b/gi, '');
+}
+
 function extractCssUrls(value) {
   if (!value || value === 'none') {
     return [];
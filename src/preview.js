@@ -15,6 +15,8 @@ export default class Preview {
     layout,
     paper,
     mutationQueue,
+    virtualizer,
+    pageRange,
   }) {
 
     // * From config:
@@ -48,8 +50,15 @@ export default class Preview {
     this._overlayFlow = layout.overlayFlow;
     this._paper = paper;
     this._mutationQueue = mutationQueue;
+    // * Virtualized preview (data-virtual-preview, see previewVirtualizer.js).
+    this._virtualizer = virtualizer || null;
 
-    this._hasFrontPage = !!layout.frontpageTemplate;
+    // * Page range (data-page-range): the pages are numbered from 1 in the preview,
+    // * the headers and footers show the document page numbers.
+    this._pageRange = pageRange || null;
+    this._pageNumberOffset = this._pageRange ? this._pageRange.first - 1 : 0;
+
+    this._hasFrontPage = !!layout.frontpageTemplate && this._pageNumberOffset === 0;
 
   }
 
@@ -203,10 +212,15 @@ export default class Preview {
     // ADD VIRTUAL PAGE into Paper Flow,
     // with corresponding page number and pre-filled or blank,
     // with or without pre-separator.
-    const page = this._paper.createPageChrome({
+    const chromeParams = {
       pageNumber: index + 1,
-      pageCount: this._pages.length
-    });
+      pageCount: this._getDisplayedPageCount(),
+      displayedPageNumber: index + 1 + this._pageNumberOffset,
+    };
+    const page = this._virtualizer
+      ? this._paper.createPageChromePlaceholder(chromeParams)
+      : this._paper.createPageChrome(chromeParams);
+    this._virtualizer?.register(page, chromeParams);
     const pageSeparator = index ? this._createVirtualPaperGap() : undefined;
     this._insertPaper(
       this._overlayFlow,
@@ -216,6 +230,14 @@ export default class Preview {
     return pageSeparator
   }
 
+  _getDisplayedPageCount() {
+    // * The total is not known if the pagination stopped after the page range.
+    if (this._pageRange && !this._pageRange.isComplete) {
+      return '';
+    }
+    return this._pages.length + this._pageNumberOffset;
+  }
+
   _insertIntoContentFlow(pageIndex, pageSeparator, paperSeparator) {
     const element = this._pages[pageIndex].pageStart;
     // ADD FOOTER and HEADER into Content Flow (as page break),
@@ -0,0 +1,136 @@
+// * Virtualized preview (data-virtual-preview="true").
+// *
+// * In a long document most of the DOM of the preview is the page chrome:
+// * header and footer templates, page numbers, body spacers, for every page.
+// * In this mode Preview inserts empty page chromes of the paper height,
+// * and the chrome content is created only for the pages near the viewport
+// * (IntersectionObserver) and removed again when they are scrolled away.
+// * The geometry of the preview does not change: the placeholders keep
+// * the height of the paper, so the footer balancing and the paper flow
+// * stay as they are.
+// *
+// * Everything is created before printing: on `beforeprint`,
+// * and with HTML2PDF4DOC.preparePrint() before Page.printToPDF,
+// * which does not always dispatch print events.
+// * The reads of the whole preview (the layout report, the static snapshot)
+// * create it only for their duration, see withAllMaterialized();
+// * the validator creates it in batches of pages, see withMaterialized().
+
+// * Pages within this distance from the viewport are kept materialized.
+const VIEWPORT_MARGIN = '100% 0px';
+
+export default class PreviewVirtualizer {
+  constructor({
+    config,
+    paper,
+  }) {
+    this._debug = config.debugMode ? { ...config.debugConfig.preview } : {};
+    this._paper = paper;
+
+    // * pageNumber -> page chrome; pageChrome -> pageNumber.
+    this._chromes = new Map();
+    this._pageNumbers = new WeakMap();
+    // * pageNumber -> params of Paper.fillPageChrome().
+    this._chromeParams = new Map();
+    this._materialized = new Set();
+
+    this._observer = null;
+    this._isStopped = false;
+    this._onBeforePrint = () => this.materializeAll();
+  }
+
+  register(chrome, chromeParams) {
+    const { pageNumber } = chromeParams;
+    this._chromes.set(pageNumber, chrome);
+    this._pageNumbers.set(chrome, pageNumber);
+    this._chromeParams.set(pageNumber, chromeParams);
+    // * The first page is shown before the observer reports anything.
+    pageNumber === 1 && this._materialize(pageNumber);
+  }
+
+  // * Creates the chrome content of the given pages (all pages if `null`),
+  // * e.g. for the validator.
+  materialize(pageNumbers) {
+    const pages = pageNumbers || this._chromes.keys();
+    for (const pageNumber of pages) {
+      this._materialize(pageNumber);
+    }
+  }
+
+  // * Creates the chrome content of every page and stops the virtualization:
+  // * the document is ready to be printed.
+  materializeAll() {
+    this.stop();
+    this.materialize(null);
+  }
+
+  // * Creates the chrome content of every page for the callback (a read of the
+  // * whole preview, e.g. the layout report) and removes the content it added
+  // * afterwards: unlike materializeAll(), the virtualization goes on.
+  withAllMaterialized(callback) {
+    return this.withMaterialized(null, callback);
+  }
+
+  // * The same for the given pages (all pages if `null`).
+  withMaterialized(pageNumbers, callback) {
+    const added = [...(pageNumbers || this._chromes.keys())]
+      .filter(pageNumber => this._chromes.has(pageNumber) && !this._materialized.has(pageNumber));
+    this.materialize(added);
+    try {
+      return callback();
+    } finally {
+      added.forEach(pageNumber => this._dematerialize(pageNumber));
+    }
+  }
+
+  start() {
+    if (this._isStopped || this._observer) {
+      return;
+    }
+    window.addEventListener('beforeprint', this._onBeforePrint);
+    this._observer = new IntersectionObserver(
+      (entries) => this._update(entries),
+      { rootMargin: VIEWPORT_MARGIN }
+    );
+    for (const chrome of this._chromes.values()) {
+      this._observer.observe(chrome);
+    }
+    this._debug._ && console.log('🪟 preview virtualization started:', this._chromes.size, 'pages');
+  }
+
+  stop() {
+    this._isStopped = true;
+    window.removeEventListener('beforeprint', this._onBeforePrint);
+    this._observer?.disconnect();
+    this._observer = null;
+  }
+
+  _update(entries) {
+    for (const entry of entries) {
+      const pageNumber = this._pageNumbers.get(entry.target);
+      if (entry.isIntersecting) {
+        this._materialize(pageNumber);
+      } else {
+        this._dematerialize(pageNumber);
+      }
+    }
+    this._debug._ && console.log('🪟 materialized pages:', this._materialized.size);
+  }
+
+  _materialize(pageNumber) {
+    const chrome = this._chromes.get(pageNumber);
+    if (!chrome || this._materialized.has(pageNumber)) {
+      return;
+    }
+    this._paper.fillPageChrome(chrome, this._chromeParams.get(pageNumber));
+    this._materialized.add(pageNumber);
+  }
+
+  _dematerialize(pageNumber) {
+    if (!this._materialized.has(pageNumber)) {
+      return;
+    }
+    this._paper.emptyPageChrome(this._chromes.get(pageNumber));
+    this._materialized.delete(pageNumber);
+  }
+}
@@ -100,6 +100,7 @@ const SELECTOR = {
   textGroup: 'html2pdf4doc-text-group',
   complexTextBlock: 'html2pdf4doc-complex-text-block',
   printForcedPageBreak: 'html2pdf4doc-print-forced-page-break',
+  finalizedContentSpacer: 'html2pdf4doc-finalized-content',
   // * Service marks (are created in the process):
   split: '[html2pdf4doc-split]',
   processed: '[html2pdf4doc-processed]',
@@ -0,0 +1,141 @@
+import { VERSION } from './version.js';
+
+// * Static snapshot of the rendered document (HTML2PDF4DOC.getStaticSnapshot()).
+// *
+// * Serializes the paginated document (root, paper flow, overlay flow,
+// * content flow, the inserted print styles and the mask CSS) into an HTML
+// * string without scripts: it is printed as is, with no pagination.
+// * - The scripts, the inline event handlers and the preloader are removed.
+// * - The stylesheets that the page can read (same origin) are inlined;
+// *   the others stay as links.
+// * - The URLs of the resources (images, stylesheets, CSS url()) are made
+// *   absolute, so the snapshot can be saved anywhere. The fragment links
+// *   (href="#id") stay as they are.
+// * - The @page box (getPrintConfig()) is saved in a meta tag for the printing
+// *   with the DevTools protocol, see test/end2end/helpers/static_snapshot.py.
+// *
+// * The state that is not in the DOM (canvas pixels, form values set by
+// * scripts) is not kept.
+
+export const SNAPSHOT_META = 'html2pdf4doc-snapshot';
+export const PRINT_CONFIG_META = 'html2pdf4doc-print-config';
+
+// * The preloader fades out after the rendering (see preloader.js).
+const EXCLUDED_SELECTOR = 'script, .lds-dual-ring, style[data-preloader-style]';
+const STYLESHEET_SELECTOR = 'link[rel~="stylesheet"]';
+const URL_ATTRIBUTES = ['src', 'poster', 'href'];
+const CSS_URL = /url\(\s*(['"]?)(.*?)\1\s*\)/gi;
+
+export default class Snapshot {
+  constructor({
+    DOM,
+    printConfig,
+  }) {
+    this._document = DOM.document;
+    this._printConfig = printConfig;
+  }
+
+  create() {
+    const document = this._document;
+    const baseURI = document.baseURI;
+    const clone = document.documentElement.cloneNode(true);
+
+    // * The clone has the same links in the same order.
+    this._inlineStylesheets(
+      [...document.querySelectorAll(STYLESHEET_SELECTOR)],
+      [...clone.querySelectorAll(STYLESHEET_SELECTOR)],
+      baseURI,
+    );
+    clone.querySelectorAll(EXCLUDED_SELECTOR).forEach(element => element.remove());
+    clone.querySelectorAll('*').forEach(element => this._cleanElement(element, baseURI));
+    this._addMeta(clone);
+
+    const doctype = document.doctype ? new XMLSerializer().serializeToString(document.doctype) + '\n' : '';
+    return doctype + clone.outerHTML;
+  }
+
+  _inlineStylesheets(links, clonedLinks, baseURI) {
+    links.forEach((link, index) => {
+      const clonedLink = clonedLinks[index];
+      const css = this._readStylesheet(link.sheet);
+      if (css === null) {
+        // * Not readable (another origin, file:// in Chrome): linked by the absolute URL.
+        link.href && clonedLink.setAttribute('href', link.href);
+        return;
+      }
+      const style = this._document.createElement('style');
+      const media = link.getAttribute('media');
+      media && style.setAttribute('media', media);
+      style.textContent = this._resolveCSSUrls(css, link.sheet.href || baseURI);
+      clonedLink.replaceWith(style);
+    });
+  }
+
+  _readStylesheet(sheet) {
+    if (!sheet) {
+      return null;
+    }
+    try {
+      return [...sheet.cssRules].map(rule => rule.cssText).join('\n');
+    } catch (error) {
+      return null;
+    }
+  }
+
+  _cleanElement(element, baseURI) {
+    for (const { name, value } of [...element.attributes]) {
+      if (name.startsWith('on')) {
+        element.removeAttribute(name);
+      } else if (URL_ATTRIBUTES.includes(name)) {
+        this._setAbsoluteUrl(element, name, value, baseURI);
+      } else if (name === 'srcset') {
+        element.setAttribute(name, value.split(',').map(candidate => {
+          const [url, ...descriptor] = candidate.trim().split(/\s+/);
+          return [this._resolveUrl(url, baseURI), ...descriptor].join(' ');
+        }).join(', '));
+      } else if (name === 'style' && value.includes('url(')) {
+        element.setAttribute(name, this._resolveCSSUrls(value, baseURI));
+      }
+    }
+    if (element.localName === 'style') {
+      element.textContent = this._resolveCSSUrls(element.textContent, baseURI);
+    }
+  }
+
+  _setAbsoluteUrl(element, name, value, baseURI) {
+    if (value.trim().toLowerCase().startsWith('javascript:')) {
+      element.removeAttribute(name);
+      return;
+    }
+    element.setAttribute(name, this._resolveUrl(value, baseURI));
+  }
+
+  _resolveUrl(url, baseURI) {
+    if (!url || url.startsWith('#') || url.startsWith('data:')) {
+      return url;
+    }
+    try {
+      return new URL(url, baseURI).href;
+    } catch (error) {
+      return url;
+    }
+  }
+
+  _resolveCSSUrls(css, baseURI) {
+    return css.replace(CSS_URL, (match, quote, url) => `url("${this._resolveUrl(url, baseURI)}")`);
+  }
+
+  _addMeta(clone) {
+    const head = clone.querySelector('head');
+    if (!head) {
+      return;
+    }
+    const snapshotMeta = this._document.createElement('meta');
+    snapshotMeta.setAttribute('name', SNAPSHOT_META);
+    snapshotMeta.setAttribute('content', VERSION);
+    const printConfigMeta = this._document.createElement('meta');
+    printConfigMeta.setAttribute('name', PRINT_CONFIG_META);
+    printConfigMeta.setAttribute('content', JSON.stringify(this._printConfig));
+    head.prepend(snapshotMeta, printConfigMeta);
+  }
+}
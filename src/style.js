@@ -51,25 +51,39 @@ export default class Style {
     // * When creating the config, they are reduced by up to 1 pixel for safety
     // * reasons, rounded down during conversion.
 
-    // * 2 values: width then height
-    const _size = `${this.config.paperWidth} ${this.config.paperHeight}`;
+    const pageBox = this.pageBox();
 
-    // * In this way we allow content to be theoretically printed on the bottom margin.
-    // * And we leave it up to the printer to decide whether to print there or not.
-    // * And in this way we avoid extra blank pages when some pixel
-    // * of the invisible lower margin does not "fit" in the area to be printed.
-    const _marginBottom = 0; // *** instead of this.config.printBottomMargin
+    // * 2 values: width then height
+    const _size = `${pageBox.width} ${pageBox.height}`;
 
     return `@page {
   size: A4;
   size: ${_size};
-  margin-left: ${this.config.printLeftMargin};
-  margin-right: ${this.config.printRightMargin};
-  margin-top: ${this.config.printTopMargin};
-  margin-bottom: ${_marginBottom};
+  margin-left: ${pageBox.marginLeft};
+  margin-right: ${pageBox.marginRight};
+  margin-top: ${pageBox.marginTop};
+  margin-bottom: ${pageBox.marginBottom};
 }`;
   }
 
+  // * The @page box: paper size and print margins (config values are in px).
+  // * Also used by external print tools (HTML2PDF4DOC.getPrintConfig()),
+  // * so that they print with the same page box as the @page rule.
+  pageBox() {
+    return {
+      width: this.config.paperWidth,
+      height: this.config.paperHeight,
+      marginTop: this.config.printTopMargin,
+      marginRight: this.config.printRightMargin,
+      // * In this way we allow content to be theoretically printed on the bottom margin.
+      // * And we leave it up to the printer to decide whether to print there or not.
+      // * And in this way we avoid extra blank pages when some pixel
+      // * of the invisible lower margin does not "fit" in the area to be printed.
+      marginBottom: 0, // *** instead of this.config.printBottomMargin
+      marginLeft: this.config.printLeftMargin,
+    };
+  }
+
   _layoutStyles() {
 
     const _rootDisplay = 'flow-root'; // * protection against unpredictability of margins
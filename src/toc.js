@@ -19,6 +19,9 @@ export default class Toc {
     this._root = layout.root;
     this._contentFlow = layout.contentFlow;
     this._pageDividerSelector = selector.pageDivider;
+
+    // * TOC targets with their page numbers, filled in by render().
+    this._tocEntries = [];
   }
 
   render() {
@@ -115,6 +118,51 @@ tocPageNumberSelector:
 
     this._debug._ && console.log('📑 tocObject', tocObject);
 
+    this._tocEntries = Object.values(dataFromTOC);
+
     this._globalDebugMode && console.timeEnd("Processing TOC");
   }
+
+  // * Outline (bookmarks) data for PDF post-processing:
+  // * [{ id, title, level, page }] in document order.
+  // * TOC targets are used if the document has a TOC,
+  // * otherwise the headings of the content flow.
+  getOutline() {
+    const targets = this._tocEntries.length
+      ? this._tocEntries
+        .map(({ id, page }) => ({ target: this._DOM.getElementById(id), page: Number(page) }))
+        .filter(({ target }) => target)
+      : this._getHeadingTargets();
+
+    return targets.map(({ target, page }) => {
+      const tag = this._DOM.getElementTagName(target);
+      const headingLevel = /^H([1-6])$/i.exec(tag || '');
+      return {
+        id: target.id || null,
+        title: (target.textContent || '').replace(/\s+/g, ' ').trim(),
+        level: headingLevel ? Number(headingLevel[1]) : 1,
+        page,
+      };
+    });
+  }
+
+  _getHeadingTargets() {
+    // * Page of a heading: the last page divider above it (as in render()).
+    const pageDividerRegistry = this._node.getRegisteredPageDividers?.();
+    const pageTops = pageDividerRegistry
+      ? [...pageDividerRegistry.entries()]
+        .map(([pageNum, marker]) => [this._node.getTop(marker, this._root) - 1, Number(pageNum)])
+        .sort((a, b) => a[0] - b[0])
+      : [];
+
+    return [...this._DOM.getAllElements('h1, h2, h3', this._contentFlow)].map(target => {
+      const targetTop = this._node.getTop(target, this._root);
+      let page = 1;
+      for (const [pageTop, pageNum] of pageTops) {
+        if (pageTop > targetTop) break;
+        page = pageNum;
+      }
+      return { target, page };
+    });
+  }
 }
@@ -0,0 +1,60 @@
+// * User Timing entries (data-user-timing="true").
+// *
+// * Adds performance.measure() entries, shown in the Timings track of the
+// * Chrome performance panel and in performance.getEntriesByType('measure'):
+// * - "html2pdf4doc:Layout", "html2pdf4doc:Pages", ...: the stages of App.render();
+// * - "html2pdf4doc:page:N": from the registration of the page N-1
+// *   (or the start of the pagination) to the registration of the page N;
+// * - "html2pdf4doc:split:Table", "...:TableLike", "...:Grid", "...:Pre",
+// *   "...:Paragraph": every call of the splitter of an element.
+// * With data-memory-snapshots, the snapshots are marks: "html2pdf4doc:memory:Pages".
+// *
+// * Without the option every method returns at once.
+
+export const USER_TIMING_PREFIX = 'html2pdf4doc:';
+
+export default class UserTiming {
+  constructor(isEnabled) {
+    this.isEnabled = Boolean(isEnabled) && typeof performance?.measure === 'function';
+    this._stage = null;
+    this._stageStart = 0;
+  }
+
+  // * Ends the measure of the current stage and starts the next one;
+  // * setStage(null) ends the last stage.
+  setStage(stage) {
+    if (!this.isEnabled) {
+      return;
+    }
+    this._stage && this.measure(this._stage, this._stageStart);
+    this._stage = stage;
+    this._stageStart = performance.now();
+  }
+
+  // * Calls the callback and measures the call.
+  time(name, callback, detail = null) {
+    if (!this.isEnabled) {
+      return callback();
+    }
+    const start = performance.now();
+    try {
+      return callback();
+    } finally {
+      this.measure(name, start, detail);
+    }
+  }
+
+  // * A point in the timeline, e.g. "html2pdf4doc:memory:Pages" (see memorySnapshots.js).
+  mark(name, detail = null) {
+    this.isEnabled && performance.mark(USER_TIMING_PREFIX + name, { detail });
+  }
+
+  // * From start (performance.now()) to now. The detail must be cloneable.
+  measure(name, start, detail = null) {
+    this.isEnabled && performance.measure(USER_TIMING_PREFIX + name, {
+      start,
+      end: performance.now(),
+      detail,
+    });
+  }
+}
@@ -0,0 +1,23 @@
+// * Parses the page range of data-page-range:
+// * "3" — one page, "1-10" — pages 1 to 10, "5-" — from page 5 to the end.
+// * Returns { first, last } (last is Infinity for an open range)
+// * or null for the whole document.
+export function parsePageRange(value) {
+  // * The config turns "1" into `true` and "0"/"" into `false`.
+  if (value === true) {
+    return { first: 1, last: 1 };
+  }
+  if (value === false || value === undefined || value === null) {
+    return null;
+  }
+  const match = String(value).trim().match(/^(\d+)\s*(?:-\s*(\d*))?$/);
+  const first = match ? Math.max(1, parseInt(match[1])) : NaN;
+  const last = !match || match[2] === undefined
+    ? first
+    : (match[2] === '' ? Infinity : parseInt(match[2]));
+  if (Number.isNaN(first) || !(last >= first)) {
+    console.warn(`[HTML2PDF4DOC] Invalid page range "${value}". The whole document is rendered.`);
+    return null;
+  }
+  return { first, last };
+}
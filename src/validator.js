@@ -1,5 +1,21 @@
 import * as Logging from './utils/logging.js';
 
+const VALIDATION_STATUS_ATTR = 'html2pdf4doc-validation';
+const VALIDATION_EVENT = 'html2pdf4doc:validation';
+
+// * Validation modes (data-validation-mode):
+// * - 'full': every page is checked before [success] is set (default);
+// * - 'sampled': only `validationSampleSize` pages are checked before [success];
+// * - 'deferred': every page is checked after [success], the result is reported
+// *   through the root attribute and the event only;
+// * - 'off': no validation.
+const VALIDATION_MODES = ['off', 'sampled', 'full', 'deferred'];
+const DEFAULT_VALIDATION_MODE = 'full';
+
+// * With the virtualized preview, the page chromes are created
+// * for this many pages at a time (see _measureBodySpacers).
+const CHROME_BATCH_SIZE = 50;
+
 export default class Validator {
   constructor({
     config,
@@ -9,6 +25,7 @@ export default class Validator {
     layout,
     pages,
     previewValidations,
+    virtualizer = null,
   }) {
     this._config = config;
     this._selector = selector;
@@ -19,14 +36,92 @@ export default class Validator {
 
     this._pageCount = pages.length;
     this._accumulatedAssertions = previewValidations;
+    // * The virtualized preview (data-virtual-preview): the page chromes
+    // * that are read are created only for the time of the measurement.
+    this._virtualizer = virtualizer;
+
+    this._mode = normalizeValidationMode(config.validationMode);
+    this._sampleSize = normalizeSampleSize(config.validationSampleSize);
+    // * Page numbers to check; `null` means all pages.
+    this._pagesToCheck = this._mode === 'sampled'
+      ? this._selectSamplePages(this._pageCount, this._sampleSize)
+      : null;
+    // * The detail of the last report (see `_report`), `null` until validated.
+    this._result = null;
 
     this._assert = config.consoleAssert ? true : false;
     Object.assign(this, Logging);
   }
 
-  init() {
-    this._config.debugMode && console.log('🐙 i am Validator!');
+  get mode() {
+    return this._mode;
+  }
+
+  get result() {
+    return this._result;
+  }
+
+  isDeferred() {
+    return this._mode === 'deferred';
+  }
+
+  async run() {
+    if (this._mode === 'off') {
+      this._config.debugMode && console.log('🐙 Validator is off');
+      return;
+    }
+    this._config.debugMode && console.log('🐙 i am Validator!', this._mode, this._pagesToCheck || 'all pages');
+    await this._awaitLayoutPass();
     this._validateLayout();
+    this._report();
+  }
+
+  async _awaitLayoutPass() {
+    // * Force a layout pass before validation by scrolling and waiting 2 frames
+    // * so deferred rendering effects show up in measurements (if not neutralized).
+    // *** Adds ~5-25 milliseconds to total processing time.
+    window.scrollTo(0, document.body.scrollHeight);
+    await new Promise(resolve => {
+      requestAnimationFrame(() => {
+        requestAnimationFrame(() => {
+          window.scrollTo(0, 0);
+          resolve();
+        });
+      });
+    });
+  }
+
+  _report() {
+    const pageNumbers = Object.keys(this._accumulatedAssertions).map(Number);
+    const detail = {
+      mode: this._mode,
+      status: pageNumbers.length ? 'failed' : 'passed',
+      pageCount: this._pageCount,
+      sampledPages: this._pagesToCheck ? [...this._pagesToCheck].sort((a, b) => a - b) : null,
+      pagesWithOverflow: pageNumbers,
+      assertions: this._accumulatedAssertions,
+    };
+    this._result = detail;
+    this._DOM.setAttribute(this._root, `[${VALIDATION_STATUS_ATTR}]`, detail.status);
+    this._DOM.document.dispatchEvent(new CustomEvent(VALIDATION_EVENT, { detail }));
+  }
+
+  _selectSamplePages(pageCount, sampleSize) {
+    // * Evenly spread sample over the document, always including the first and the last page
+    // * (only the first one for a sample of one page).
+    if (sampleSize <= 0 || sampleSize >= pageCount) {
+      return null;
+    }
+    const pagesToCheck = new Set(sampleSize === 1 ? [1] : [1, pageCount]);
+    const step = (pageCount - 1) / Math.max(1, sampleSize - 1);
+    for (let index = 1; pagesToCheck.size < sampleSize; index += 1) {
+      pagesToCheck.add(Math.round(1 + index * step));
+    }
+    return pagesToCheck;
+  }
+
+  _shouldCheckPage(pageNumber) {
+    return !this._pagesToCheck || this._pagesToCheck.has(pageNumber);
   }
 
   _validateLayout() {
@@ -62,14 +157,18 @@ export default class Validator {
         pageGapElements,
       }
     );
-    const paperGapTops = paperGapElements.map(paperGap => this._node.getTop(paperGap, this._root));
-    const pageGapTops = pageGapElements.map(pageGap => this._node.getTop(pageGap, this._root));
-    for (let index = 0; index < paperGapTops.length; index += 1) {
-      const paperGapTop = paperGapTops[index];
-      const pageGapTop = pageGapTops[index];
+    // * Here is an array of elements collected in sequence, with indices from zero without skips.
+    // * Therefore, the page number is the 'index + 1'.
+    const gapIndexes = paperGapElements
+      .map((_, index) => index)
+      .filter(index => this._shouldCheckPage(index + 1));
+    const paperGapTops = gapIndexes.map(index => this._node.getTop(paperGapElements[index], this._root));
+    const pageGapTops = gapIndexes.map(index => pageGapElements[index] && this._node.getTop(pageGapElements[index], this._root));
+    for (let i = 0; i < gapIndexes.length; i += 1) {
+      const index = gapIndexes[i];
+      const paperGapTop = paperGapTops[i];
+      const pageGapTop = pageGapTops[i];
       if (paperGapTop !== pageGapTop) {
-        // * Here is an array of elements collected in sequence, with indices from zero without skips.
-        // * Therefore, the page number is the 'index + 1'.
         const problemPageNumber = index + 1;
         (pagesWithOverflow[problemPageNumber] ??= {}).pageNumber = problemPageNumber;
         (pagesWithOverflow[problemPageNumber] ??= {}).paperGap = paperGapElements[index];
@@ -80,23 +179,21 @@ export default class Validator {
     // * Page ends and page bodies/
     // * - there can be different numbers for bodySpacerElements / pageEndElements,
     // * because the end of the page is not always possible for beginners' tails
-    const _bodySpacersByPageNum = [];
-    const bodySpacerElements = [...this._DOM.getAllElements(bodySpacerSelector)];
-    for (const el of bodySpacerElements) {
-      const page = this._node.getRegisteredPageNumberForElement?.(el);
-      this.strictAssert(!Number.isNaN(page), 'bodySpacer has no valid page marker', el);
-      _bodySpacersByPageNum[page] = el;
-    }
+    const {
+      spacers: _bodySpacersByPageNum,
+      bottoms: bodyBottoms,
+    } = this._measureBodySpacers(bodySpacerSelector);
 
     const _pageEndByPage = [];
     const pageEndRegistry = this._node.getRegisteredPageEnds?.();
     if (pageEndRegistry && pageEndRegistry.size) {
       for (const [page, el] of pageEndRegistry.entries()) {
-        _pageEndByPage[page] = el;
+        if (this._shouldCheckPage(page)) {
+          _pageEndByPage[page] = el;
+        }
       }
     }
 
-    const bodyBottoms = _bodySpacersByPageNum.map(body => body ? this._node.getBottom(body, this._root) : undefined);
     const pageEndBottoms = _pageEndByPage.map(el => el ? this._node.getBottom(el, this._root) : undefined);
     for (let index = 0; index < bodyBottoms.length; index += 1) {
       const bodyBottom = bodyBottoms[index];
@@ -113,6 +210,41 @@ export default class Validator {
     return pagesWithOverflow
   }
 
+  // * The body spacers of the pages to check and their bottoms, by page number.
+  // * With the virtualized preview, the page chromes are created in batches
+  // * and removed after each batch is measured, so the whole preview
+  // * is never created at once.
+  _measureBodySpacers(bodySpacerSelector) {
+    const spacers = [];
+    const bottoms = [];
+    const measure = () => {
+      const found = [];
+      for (const el of this._DOM.getAllElements(bodySpacerSelector)) {
+        const page = this._node.getRegisteredPageNumberForElement?.(el);
+        this.strictAssert(!Number.isNaN(page), 'bodySpacer has no valid page marker', el);
+        if (this._shouldCheckPage(page) && !spacers[page]) {
+          spacers[page] = el;
+          found.push(page);
+        }
+      }
+      found.forEach(page => {
+        bottoms[page] = this._node.getBottom(spacers[page], this._root);
+      });
+    };
+
+    if (!this._virtualizer) {
+      measure();
+      return { spacers, bottoms };
+    }
+    const pageNumbers = this._pagesToCheck
+      ? [...this._pagesToCheck].sort((a, b) => a - b)
+      : Array.from({ length: this._pageCount }, (_, index) => index + 1);
+    for (let index = 0; index < pageNumbers.length; index += CHROME_BATCH_SIZE) {
+      this._virtualizer.withMaterialized(pageNumbers.slice(index, index + CHROME_BATCH_SIZE), measure);
+    }
+    return { spacers, bottoms };
+  }
+
   _assertElementsCount(expected, elementsMap) {
     const details = [];
 
@@ -135,3 +267,30 @@ export default class Validator {
     );
   }
 }
+
+function normalizeSampleSize(size) {
+  // * `data-validation-sample-size="1"` and `"0"` are converted to booleans by the config.
+  if (size === true) {
+    return 1;
+  }
+  if (size === false) {
+    return 0;
+  }
+  return parseInt(size) || 0;
+}
+
+function normalizeValidationMode(mode) {
+  // * `data-validation-mode="false"` is converted to boolean by the config.
+  if (mode === false) {
+    return 'off';
+  }
+  if (mode === true || mode === undefined || mode === null) {
+    return DEFAULT_VALIDATION_MODE;
+  }
+  const normalized = String(mode).trim().toLowerCase();
+  if (VALIDATION_MODES.includes(normalized)) {
+    return normalized;
+  }
+  console.warn(`[HTML2PDF4DOC] Unknown validation mode "${mode}". Falling back to "${DEFAULT_VALIDATION_MODE}".`);
+  return DEFAULT_VALIDATION_MODE;
+}
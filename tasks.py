@@ -91,6 +91,7 @@ def test_end2end(
     focus=None,
     exit_first=False,
     parallelize=False,
+    processes="auto",
     long_timeouts=False,
     silent=False,
     q=False,
@@ -110,12 +111,13 @@ def test_end2end(
 
     parallelize_argument = ""
     if parallelize:
-        print(  # noqa: T201
-            "warning: "
-            "Running parallelized end-2-end tests is supported "
-            "but is not stable."
+        # One browser profile and one HTTP server per xdist worker (see
+        # test/end2end/conftest.py). Tests are handed out longest-first
+        # according to the durations recorded by the previous runs.
+        parallelize_argument = (
+            f"--numprocesses={processes} --dist=load "
+            "--strictdoc-parallelize --e2e-http-server"
         )
-        parallelize_argument = "--numprocesses=2 --strictdoc-parallelize"
 
     focus_argument = f"-k {focus}" if focus is not None else ""
     exit_first_argument = "--exitfirst" if exit_first else ""
@@ -164,6 +166,7 @@ def test_end2end_random(
     focus=None,
     exit_first=False,
     parallelize=False,
+    processes="auto",
     long_timeouts=False,
     silent=False,
     q=False,
@@ -177,12 +180,7 @@ def test_end2end_random(
 
     parallelize_argument = ""
     if parallelize:
-        print(  # noqa: T201
-            "warning: "
-            "Running parallelized end-2-end tests is supported "
-            "but is not stable."
-        )
-        parallelize_argument = "--numprocesses=2 --strictdoc-parallelize"
+        parallelize_argument = f"--numprocesses={processes} --dist=load"
 
     focus_argument = f"-k {focus}" if focus is not None else ""
     exit_first_argument = "--exitfirst" if exit_first else ""
@@ -219,6 +217,92 @@ def test_end2end_random(
     run_invoke(context, test_command)
 
 
+@task(build)
+def benchmark(context, pages="100,1000", runs=3, headed=False):
+    # Pagination time with and without data-contain-finalized-pages,
+    # see test/benchmark/pagination_benchmark.py.
+    pages_argument = " ".join(pages.split(","))
+    headed_argument = "--headed" if headed else ""
+    run_invoke(context, f"""
+        PYTHONPATH=.
+        python test/benchmark/pagination_benchmark.py
+            --pages {pages_argument}
+            --runs {runs}
+            {headed_argument}
+    """)
+
+
+@task(build)
+def benchmark_slicing(context, pages="20,100", runs=3, headed=False):
+    # Slicing of a long table cell with and without data-single-pass-slicing,
+    # see test/benchmark/slicing_benchmark.py.
+    pages_argument = " ".join(pages.split(","))
+    headed_argument = "--headed" if headed else ""
+    run_invoke(context, f"""
+        python test/benchmark/slicing_benchmark.py
+            --pages {pages_argument}
+            --runs {runs}
+            {headed_argument}
+    """)
+
+
+@task(build)
+def benchmark_memory(context, sections="100,1000", headed=False):
+    # JS heap, DOM nodes and service elements per stage,
+    # see test/benchmark/memory_benchmark.py.
+    sections_argument = " ".join(sections.split(","))
+    headed_argument = "--headed" if headed else ""
+    run_invoke(context, f"""
+        python test/benchmark/memory_benchmark.py
+            --sections {sections_argument}
+            {headed_argument}
+    """)
+
+
+@task(build)
+def benchmark_print(context, sections="100,1000", runs=3, headed=False):
+    # DOM size and print time with and without data-compact-dom,
+    # see test/benchmark/print_benchmark.py.
+    sections_argument = " ".join(sections.split(","))
+    headed_argument = "--headed" if headed else ""
+    run_invoke(context, f"""
+        PYTHONPATH=.
+        python test/benchmark/print_benchmark.py
+            --sections {sections_argument}
+            --runs {runs}
+            {headed_argument}
+    """)
+
+
+@task(build)
+def trace_render(context, sections=100, html=None, headed=False):
+    # CDP trace of a rendering with data-user-timing and a summary
+    # of the measures, see test/benchmark/trace_render.py.
+    html_argument = f"--html {html}" if html else ""
+    headed_argument = "--headed" if headed else ""
+    run_invoke(context, f"""
+        python test/benchmark/trace_render.py
+            --sections {sections}
+            {html_argument}
+            {headed_argument}
+    """)
+
+
+@task(build)
+def cpu_profile(context, sections=100, html=None, top=25, headed=False):
+    # CPU profile of a rendering, attributed to the src/ modules
+    # through the source map, see test/benchmark/cpu_profile.py.
+    html_argument = f"--html {html}" if html else ""
+    headed_argument = "--headed" if headed else ""
+    run_invoke(context, f"""
+        python test/benchmark/cpu_profile.py
+            --sections {sections}
+            --top {top}
+            {html_argument}
+            {headed_argument}
+    """)
+
+
 @task(aliases=["t"])
 def test(context):
     test_unit(context)
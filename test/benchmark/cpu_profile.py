@@ -0,0 +1,265 @@
+import argparse
+import bisect
+import json
+import os
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from pagination_benchmark import PATH_TO_BUNDLE, PATH_TO_CSS, REPO_ROOT, generate_section
+from seleniumbase import SB
+
+# CPU profile: records a sampling profile (CDP Profiler) of App.render()
+# and attributes the samples to the src/ modules and functions through
+# the source map of the bundle (dist/bundle.js.map, `invoke build`).
+# Prints the self and total time per module and the hottest functions,
+# and saves the profile (opens in the Performance panel of Chrome DevTools).
+#
+# The document is loaded with data-init="manual" and the rendering is
+# started by HTML2PDF4DOC.init() after the profiler, so the profile holds
+# the rendering only.
+#
+#   invoke cpu-profile
+#   python test/benchmark/cpu_profile.py --sections 200 --top 40
+#   python test/benchmark/cpu_profile.py --html path/to/document.html
+#
+# A document given with --html must load the bundle with data-init="manual".
+
+PATH_TO_SOURCE_MAP = PATH_TO_BUNDLE + ".map"
+
+BASE64 = {char: index for index, char in enumerate(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+)}
+
+# The name of the function declared on the original line:
+# "export function getTop(", "  _parseNode({", "  async render(", "const f = (".
+FUNCTION_NAME = re.compile(
+    r"(?:function\*?\s+([\w$]+)\s*\()"
+    r"|(?:^\s*(?:static\s+)?(?:async\s+)?(?:get\s+|set\s+)?([\w$]+)\s*\([^)]*\)?\s*\{?)"
+    r"|(?:([\w$]+)\s*=\s*(?:async\s+)?(?:function\b|\([^)]*\)\s*=>|[\w$]+\s*=>))"
+)
+NOT_FUNCTION_NAMES = {"if", "for", "while", "switch", "catch", "return", "function"}
+
+
+def decode_vlq(segment: str) -> List[int]:
+    values = []
+    value = 0
+    shift = 0
+    for char in segment:
+        digit = BASE64[char]
+        value += (digit & 31) << shift
+        if digit & 32:
+            shift += 5
+        else:
+            values.append(-(value >> 1) if value & 1 else value >> 1)
+            value = 0
+            shift = 0
+    return values
+
+
+class SourceMap:
+    def __init__(self, data: Dict):
+        self.sources = [normalize_source(source) for source in data["sources"]]
+        self.sources_content = data.get("sourcesContent") or [None] * len(self.sources)
+        self.names = data.get("names", [])
+        # Per generated line: sorted generated columns and the mapped
+        # (source, line, column, name) tuples.
+        self.columns: List[List[int]] = []
+        self.mappings: List[List[Tuple[int, int, int, Optional[int]]]] = []
+        source = original_line = original_column = name = 0
+        for line in data["mappings"].split(";"):
+            columns = []
+            mappings = []
+            generated_column = 0
+            for segment in filter(None, line.split(",")):
+                fields = decode_vlq(segment)
+                generated_column += fields[0]
+                if len(fields) < 4:
+                    continue
+                source += fields[1]
+                original_line += fields[2]
+                original_column += fields[3]
+                segment_name = None
+                if len(fields) > 4:
+                    name += fields[4]
+                    segment_name = name
+                columns.append(generated_column)
+                mappings.append((source, original_line, original_column, segment_name))
+            self.columns.append(columns)
+            self.mappings.append(mappings)
+        self._lines: Dict[int, List[str]] = {}
+
+    @classmethod
+    def load(cls, path: str) -> "SourceMap":
+        with open(path, encoding="utf-8") as file:
+            return cls(json.load(file))
+
+    # Zero-based line and column of the bundle -> (source, line, column, name) or None.
+    def lookup(self, line: int, column: int) -> Optional[Tuple[int, int, int, Optional[int]]]:
+        if line >= len(self.columns):
+            return None
+        index = bisect.bisect_right(self.columns[line], column) - 1
+        return self.mappings[line][index] if index >= 0 else None
+
+    def get_source_line(self, source: int, line: int) -> str:
+        if source not in self._lines:
+            content = self.sources_content[source] if source < len(self.sources_content) else None
+            self._lines[source] = (content or "").split("\n")
+        lines = self._lines[source]
+        return lines[line] if line < len(lines) else ""
+
+
+def normalize_source(source: str) -> str:
+    # "webpack://HTML2PDF4DOC/./src/pages/pages.js" -> "src/pages/pages.js"
+    source = re.sub(r"^webpack://[^/]*/", "", source)
+    return source[2:] if source.startswith("./") else source
+
+
+class Resolver:
+    def __init__(self, source_map: Optional[SourceMap]):
+        self.source_map = source_map
+        self._frames: Dict[Tuple, Tuple[str, str]] = {}
+
+    # CDP call frame -> (module, function).
+    def resolve(self, call_frame: Dict) -> Tuple[str, str]:
+        key = (call_frame["url"], call_frame["lineNumber"], call_frame["columnNumber"], call_frame["functionName"])
+        if key not in self._frames:
+            self._frames[key] = self._resolve(call_frame)
+        return self._frames[key]
+
+    def _resolve(self, call_frame: Dict) -> Tuple[str, str]:
+        url = call_frame["url"]
+        function = call_frame["functionName"]
+        if not url:
+            # "(program)", "(idle)", "(garbage collector)", native functions.
+            return (function if function.startswith("(") else "(native)"), function or "(anonymous)"
+        if not url.endswith("/bundle.js") or self.source_map is None:
+            return url.rsplit("/", 1)[-1] or url, function or "(anonymous)"
+        mapping = self.source_map.lookup(call_frame["lineNumber"], call_frame["columnNumber"])
+        if mapping is None:
+            return "bundle.js", function or "(anonymous)"
+        source, line, _column, name = mapping
+        original = self._find_function_name(self.source_map.get_source_line(source, line))
+        if original is None and name is not None:
+            original = self.source_map.names[name]
+        return self.source_map.sources[source], original or function or "(anonymous)"
+
+    @staticmethod
+    def _find_function_name(line: str) -> Optional[str]:
+        for match in FUNCTION_NAME.finditer(line):
+            name = next(group for group in match.groups() if group)
+            if name not in NOT_FUNCTION_NAMES:
+                return name
+        return None
+
+
+def attribute(profile: Dict, resolver: Resolver) -> Tuple[Dict, Dict]:
+    # Self and total ms per module and per "module:function".
+    # The time of a sample is the delta to the next sample;
+    # a module or function counts once per sample in the total time.
+    nodes = {node["id"]: node for node in profile["nodes"]}
+    parents = {}
+    for node in profile["nodes"]:
+        for child in node.get("children", []):
+            parents[child] = node["id"]
+
+    modules: Dict[str, Dict[str, float]] = defaultdict(lambda: {"self": 0.0, "total": 0.0})
+    functions: Dict[str, Dict[str, float]] = defaultdict(lambda: {"self": 0.0, "total": 0.0})
+    samples = profile.get("samples", [])
+    deltas = profile.get("timeDeltas", [])
+    for index, node_id in enumerate(samples):
+        ms = (deltas[index + 1] if index + 1 < len(deltas) else 0) / 1000
+        stack = []
+        while node_id is not None:
+            call_frame = nodes[node_id]["callFrame"]
+            if call_frame["functionName"] != "(root)":
+                stack.append(resolver.resolve(call_frame))
+            node_id = parents.get(node_id)
+        if not stack:
+            continue
+        module, function = stack[0]
+        modules[module]["self"] += ms
+        functions[f"{module}:{function}"]["self"] += ms
+        for module in {module for module, _ in stack}:
+            modules[module]["total"] += ms
+        for key in {f"{module}:{function}" for module, function in stack}:
+            functions[key]["total"] += ms
+    return modules, functions
+
+
+def print_table(title: str, rows: Dict[str, Dict[str, float]], top: int) -> None:
+    print(f"\n{title}")  # noqa: T201
+    print(f"{'self ms':>10} {'total ms':>10}  name")  # noqa: T201
+    ordered = sorted(rows.items(), key=lambda item: item[1]["self"], reverse=True)
+    for name, times in ordered[:top]:
+        print(f"{times['self']:>10.1f} {times['total']:>10.1f}  {name}")  # noqa: T201
+
+
+def generate_document(sections: int) -> str:
+    content = "".join(generate_section(index) for index in range(1, sections + 1))
+    return f"""<!doctype html>
+<html lang="">
+
+<head>
+  <meta charset="utf-8">
+  <title>CPU profile: {sections} sections</title>
+  <script src="{Path(PATH_TO_BUNDLE).as_uri()}" data-init="manual"></script>
+  <link rel="stylesheet" href="{Path(PATH_TO_CSS).as_uri()}">
+</head>
+
+<body>
+{content}
+</body>
+
+</html>
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="html2pdf4doc CPU profile")
+    parser.add_argument("--html", help="document to render (default: a generated one)")
+    parser.add_argument("--sections", type=int, default=100, help="sections of the generated document")
+    parser.add_argument("--interval", type=int, default=100, help="sampling interval, microseconds")
+    parser.add_argument("--top", type=int, default=25, help="functions to print")
+    parser.add_argument("--timeout", type=int, default=1800, help="seconds for the rendering")
+    parser.add_argument("--output", default=os.path.join("output", "profile"))
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args()
+
+    source_map = None
+    if os.path.isfile(PATH_TO_SOURCE_MAP):
+        source_map = SourceMap.load(PATH_TO_SOURCE_MAP)
+    else:
+        print(f"No source map at {os.path.relpath(PATH_TO_SOURCE_MAP, REPO_ROOT)}: run `invoke build`.")  # noqa: T201
+
+    Path(args.output).mkdir(parents=True, exist_ok=True)
+    path_to_html = args.html
+    if path_to_html is None:
+        path_to_html = os.path.join(args.output, f"profile_{args.sections}.html")
+        with open(path_to_html, "w", encoding="utf-8") as file:
+            file.write(generate_document(args.sections))
+    path_to_profile = os.path.join(args.output, f"{Path(path_to_html).stem}.cpuprofile")
+
+    with SB(browser="chrome", headless=not args.headed) as sb:
+        sb.open(Path(path_to_html).resolve().as_uri())
+        sb.wait_for_ready_state_complete()
+        sb.driver.execute_cdp_cmd("Profiler.enable", {})
+        sb.driver.execute_cdp_cmd("Profiler.setSamplingInterval", {"interval": args.interval})
+        sb.driver.execute_cdp_cmd("Profiler.start", {})
+        sb.execute_script("HTML2PDF4DOC.init();")
+        sb.wait_for_element_present("//html2pdf4doc-root[@success]", by="xpath", timeout=args.timeout)
+        profile = sb.driver.execute_cdp_cmd("Profiler.stop", {})["profile"]
+        sb.driver.execute_cdp_cmd("Profiler.disable", {})
+
+    with open(path_to_profile, "w", encoding="utf-8") as file:
+        json.dump(profile, file)
+    print(f"Profile: {path_to_profile}")  # noqa: T201
+
+    modules, functions = attribute(profile, Resolver(source_map))
+    print_table("Modules", modules, len(modules))
+    print_table(f"Top {args.top} functions", functions, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+import argparse
+import os
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from pagination_benchmark import PATH_TO_BUNDLE, PATH_TO_CSS, generate_section
+from seleniumbase import SB
+
+# Memory benchmark: renders generated documents with
+# data-memory-snapshots="true" and prints the snapshots taken after
+# Layout, Pages, Preview, Toc and Validator: JS heap, DOM nodes and the
+# service elements created by the pagination (word wrappers, text lines,
+# cut parts of the split elements, page chromes). After the rendering,
+# the CDP counters of the whole page are added: Memory.getDOMCounters
+# (documents, nodes, event listeners) and Performance.getMetrics
+# (JS heap after garbage collection, layout and style recalculation count).
+# Every document is rendered by default and with data-low-memory="true".
+#
+#   invoke benchmark-memory
+#   python test/benchmark/memory_benchmark.py --sections 100 1000
+
+# performance.memory is rounded without it.
+CHROMIUM_ARG = "--enable-precise-memory-info"
+
+METRICS = ["JSHeapUsedSize", "JSHeapTotalSize", "Nodes", "JSEventListeners", "LayoutCount", "RecalcStyleCount"]
+
+MODES = {
+    "default": "",
+    "low-memory": ' data-low-memory="true"',
+}
+
+SERVICES = ["words", "textLines", "complexTextBlocks", "cutParts", "pageChromes"]
+
+
+def generate_document(sections: int, mode: str) -> str:
+    content = "".join(generate_section(index) for index in range(1, sections + 1))
+    return f"""<!doctype html>
+<html lang="">
+
+<head>
+  <meta charset="utf-8">
+  <title>Memory benchmark: {sections} sections, {mode}</title>
+  <script src="{Path(PATH_TO_BUNDLE).as_uri()}" data-memory-snapshots="true"{MODES[mode]}></script>
+  <link rel="stylesheet" href="{Path(PATH_TO_CSS).as_uri()}">
+</head>
+
+<body>
+{content}
+</body>
+
+</html>
+"""
+
+
+def get_cdp_counters(sb) -> Dict[str, float]:
+    # The page must have Performance.enable.
+    sb.driver.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+    counters = dict(sb.driver.execute_cdp_cmd("Memory.getDOMCounters", {}))
+    metrics = sb.driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+    counters.update({metric["name"]: metric["value"] for metric in metrics if metric["name"] in METRICS})
+    return counters
+
+
+def render(sb, path_to_html: str, timeout: int) -> Dict:
+    sb.open(Path(path_to_html).as_uri())
+    sb.wait_for_element_present("//html2pdf4doc-root[@success]", by="xpath", timeout=timeout)
+    sb.wait_for_ready_state_complete()
+    return {
+        "pages": int(sb.execute_script("return document.querySelector('html2pdf4doc-root').getAttribute('pages');")),
+        "snapshots": sb.execute_script("return HTML2PDF4DOC.getMemorySnapshots();") or [],
+        "counters": get_cdp_counters(sb),
+    }
+
+
+def to_mb(value) -> str:
+    return f"{value / (1024 * 1024):.1f}" if value is not None else "-"
+
+
+def print_result(sections: int, mode: str, result: Dict) -> None:
+    print(f"\n{sections} sections, {mode}, {result['pages']} pages")  # noqa: T201
+    header = f"{'stage':>10} {'heap MB':>8} {'nodes':>8} {'elements':>9}"
+    header += "".join(f" {service:>17}" for service in SERVICES)
+    print(header)  # noqa: T201
+    for snapshot in result["snapshots"]:
+        line = (
+            f"{snapshot['stage']:>10} {to_mb(snapshot['jsHeapUsed']):>8} "
+            f"{snapshot['nodes']:>8} {snapshot['elements']:>9}"
+        )
+        line += "".join(f" {snapshot['services'][service]:>17}" for service in SERVICES)
+        print(line)  # noqa: T201
+    counters = result["counters"]
+    print(  # noqa: T201
+        f"{'CDP':>10} {to_mb(counters.get('JSHeapUsedSize')):>8} {counters.get('nodes', '-'):>8}"
+        f"  listeners: {counters.get('jsEventListeners', '-')}, documents: {counters.get('documents', '-')},"
+        f" layouts: {counters.get('LayoutCount', 0):.0f}, style recalcs: {counters.get('RecalcStyleCount', 0):.0f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="html2pdf4doc memory benchmark")
+    parser.add_argument("--sections", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--timeout", type=int, default=1800, help="seconds per rendering")
+    parser.add_argument("--output", default=os.path.join("output", "benchmark"))
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args()
+
+    Path(args.output).mkdir(parents=True, exist_ok=True)
+    results: List[Tuple[int, str, Dict]] = []
+    with SB(browser="chrome", headless=not args.headed, chromium_arg=CHROMIUM_ARG) as sb:
+        sb.driver.execute_cdp_cmd("Performance.enable", {})
+        for sections in args.sections:
+            for mode in MODES:
+                path_to_html = os.path.join(args.output, f"memory_{sections}_{mode}.html")
+                with open(path_to_html, "w", encoding="utf-8") as file:
+                    file.write(generate_document(sections, mode))
+                results.append((sections, mode, render(sb, path_to_html, args.timeout)))
+
+    for sections, mode, result in results:
+        print_result(sections, mode, result)
+
+
+if __name__ == "__main__":
+    main()
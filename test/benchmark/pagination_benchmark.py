@@ -0,0 +1,169 @@
+import argparse
+import os
+import statistics
+from pathlib import Path
+from typing import Dict, List
+
+from seleniumbase import SB
+
+# Pagination benchmark: renders generated documents of different length
+# with and without data-contain-finalized-pages and prints the rendering
+# time (from the bundle start to the [success] attribute of the root).
+#
+# Without the containment every measurement after a DOM write lays out the
+# whole content flow, so the time per page grows with the document length.
+# With the containment it should stay roughly constant.
+#
+# The containment detaches only the top-level children of the content flow:
+# the "nested" markup puts all sections into one wrapper (as StrictDoc does),
+# where nothing can be detached.
+#
+#   invoke benchmark
+#   PYTHONPATH=. python test/benchmark/pagination_benchmark.py --pages 100 1000 --runs 3
+
+PATH_TO_THIS_FOLDER = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.abspath(os.path.join(PATH_TO_THIS_FOLDER, "../.."))
+PATH_TO_BUNDLE = os.path.join(REPO_ROOT, "dist", "bundle.js")
+PATH_TO_CSS = os.path.join(REPO_ROOT, "test", "shared", "css", "main.css")
+
+MODES = {
+    "default": "",
+    "contained": ' data-contain-finalized-pages="true"',
+}
+
+MARKUPS = ("flat", "nested")
+
+# Started before the bundle; finished when the root gets [success].
+TIMING_SCRIPT = """
+<script>
+  window.benchmark = { start: performance.now(), end: null };
+  new MutationObserver((records, observer) => {
+    if (document.querySelector('html2pdf4doc-root[success]')) {
+      window.benchmark.end = performance.now();
+      observer.disconnect();
+    }
+  }).observe(document.documentElement, { subtree: true, attributes: true, attributeFilter: ['success'] });
+</script>
+"""
+
+PARAGRAPH = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod "
+    "tempor incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, "
+    "quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo "
+    "consequat. Duis aute irure dolor in reprehenderit in voluptate velit esse "
+    "cillum dolore eu fugiat nulla pariatur. "
+)
+
+
+def generate_section(index: int) -> str:
+    # About one A4 page: a heading, paragraphs (split by lines),
+    # a table (split by rows) and a block that is moved as a whole.
+    rows = "".join(
+        f"<tr><td>{index}.{row}</td><td>{PARAGRAPH[:60]}</td></tr>" for row in range(8)
+    )
+    return f"""
+  <h2>Section {index}</h2>
+  <p>{PARAGRAPH * 3}</p>
+  <p>{PARAGRAPH * 2}</p>
+  <table><tbody>{rows}</tbody></table>
+  <div style="height:120px;" filler></div>
+  <p>{PARAGRAPH}</p>
+"""
+
+
+def generate_document(pages: int, mode: str, markup: str = "flat") -> str:
+    sections = "".join(generate_section(index) for index in range(1, pages + 1))
+    if markup == "nested":
+        sections = f"<section>{sections}</section>"
+    return f"""<!doctype html>
+<html lang="">
+
+<head>
+  <meta charset="utf-8">
+  <title>Pagination benchmark: {pages} pages, {mode}, {markup}</title>
+  {TIMING_SCRIPT}
+  <script src="{Path(PATH_TO_BUNDLE).as_uri()}"{MODES[mode]}></script>
+  <link rel="stylesheet" href="{Path(PATH_TO_CSS).as_uri()}">
+</head>
+
+<body>
+{sections}
+</body>
+
+</html>
+"""
+
+
+def render(sb, path_to_html: str, timeout: int) -> Dict:
+    sb.open(Path(path_to_html).as_uri())
+    sb.wait_for_element_present("//html2pdf4doc-root[@success]", by="xpath", timeout=timeout)
+    sb.wait_for_ready_state_complete()
+    result = sb.execute_script(
+        "return {"
+        " ms: window.benchmark.end - window.benchmark.start,"
+        " pages: Number(document.querySelector('html2pdf4doc-root').getAttribute('pages'))"
+        "};"
+    )
+    return {"ms": float(result["ms"]), "pages": int(result["pages"])}
+
+
+def get_heap_mb(sb) -> float:
+    # JS heap used after a garbage collection (needs Performance.enable).
+    sb.driver.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+    metrics = sb.driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+    used = next(metric["value"] for metric in metrics if metric["name"] == "JSHeapUsedSize")
+    return used / (1024 * 1024)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="html2pdf4doc pagination benchmark")
+    parser.add_argument("--pages", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--markup", nargs="+", choices=MARKUPS, default=list(MARKUPS))
+    parser.add_argument("--timeout", type=int, default=1800, help="seconds per rendering")
+    parser.add_argument("--output", default=os.path.join("output", "benchmark"))
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args()
+
+    Path(args.output).mkdir(parents=True, exist_ok=True)
+    results: List[Dict] = []
+    with SB(browser="chrome", headless=not args.headed) as sb:
+        for markup in args.markup:
+            for pages in args.pages:
+                for mode in MODES:
+                    path_to_html = os.path.join(args.output, f"pages_{pages}_{mode}_{markup}.html")
+                    with open(path_to_html, "w", encoding="utf-8") as file:
+                        file.write(generate_document(pages, mode, markup))
+                    runs = [render(sb, path_to_html, args.timeout) for _ in range(args.runs)]
+                    median_ms = statistics.median(run["ms"] for run in runs)
+                    rendered_pages = runs[-1]["pages"]
+                    results.append({
+                        "markup": markup,
+                        "sections": pages,
+                        "mode": mode,
+                        "pages": rendered_pages,
+                        "ms": median_ms,
+                        "ms_per_page": median_ms / max(rendered_pages, 1),
+                    })
+
+    print(  # noqa: T201
+        f"{'markup':>7} {'sections':>8} {'mode':>10} {'pages':>6} {'median ms':>11} {'ms/page':>8}"
+    )
+    for result in results:
+        print(  # noqa: T201
+            f"{result['markup']:>7} {result['sections']:>8} {result['mode']:>10} {result['pages']:>6} "
+            f"{result['ms']:>11.0f} {result['ms_per_page']:>8.2f}"
+        )
+    if len(args.pages) > 1:
+        shortest, longest = min(args.pages), max(args.pages)
+        for markup in args.markup:
+            for mode in MODES:
+                by_size = {r["sections"]: r for r in results if r["mode"] == mode and r["markup"] == markup}
+                ratio = by_size[longest]["ms_per_page"] / by_size[shortest]["ms_per_page"]
+                print(  # noqa: T201
+                    f"{markup} {mode}: ms/page at {longest} sections is {ratio:.2f}x of {shortest} sections"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import argparse
+import os
+import statistics
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from pagination_benchmark import PATH_TO_BUNDLE, PATH_TO_CSS, generate_section, get_heap_mb
+from seleniumbase import SB
+
+from test.end2end.helpers.pdf_print import print_options_from_config, print_to_pdf_stream
+
+# Print benchmark: renders generated documents with and without
+# data-compact-dom="true" and prints the DOM size after the rendering
+# (nodes, elements, text lines), the JS heap before printing, the print
+# time (Page.printToPDF, read as a stream) and the PDF size, then the
+# difference of the compact mode per document: nodes removed, print time
+# and heap. The page count must be the same in both modes: the compaction
+# does not change the layout.
+#
+#   invoke benchmark-print
+#   PYTHONPATH=. python test/benchmark/print_benchmark.py --sections 100 1000 --runs 3
+
+MODES = {
+    "default": "",
+    "compact": ' data-compact-dom="true"',
+}
+
+DOM_SIZE_SCRIPT = """
+let nodes = 0;
+const walker = document.createTreeWalker(document, NodeFilter.SHOW_ALL);
+while (walker.nextNode()) {
+  nodes += 1;
+}
+return {
+  nodes,
+  elements: document.getElementsByTagName('*').length,
+  textLines: document.getElementsByTagName('html2pdf4doc-text-line').length,
+};
+"""
+
+
+def generate_document(sections: int, mode: str) -> str:
+    content = "".join(generate_section(index) for index in range(1, sections + 1))
+    return f"""<!doctype html>
+<html lang="">
+
+<head>
+  <meta charset="utf-8">
+  <title>Print benchmark: {sections} sections, {mode}</title>
+  <script src="{Path(PATH_TO_BUNDLE).as_uri()}"{MODES[mode]}></script>
+  <link rel="stylesheet" href="{Path(PATH_TO_CSS).as_uri()}">
+</head>
+
+<body>
+{content}
+</body>
+
+</html>
+"""
+
+
+def render_and_print(sb, path_to_html: str, path_to_pdf: str, runs: int, timeout: int) -> Dict:
+    sb.open(Path(path_to_html).as_uri())
+    sb.wait_for_element_present("//html2pdf4doc-root[@success]", by="xpath", timeout=timeout)
+    sb.wait_for_ready_state_complete()
+    print_options = print_options_from_config(sb.execute_script("return HTML2PDF4DOC.getPrintConfig();"))
+    heap_mb = get_heap_mb(sb)
+    print_times = []
+    size = 0
+    for _ in range(runs):
+        start = time.perf_counter()
+        size = print_to_pdf_stream(sb.driver, path_to_pdf, print_options)
+        print_times.append((time.perf_counter() - start) * 1000)
+    return {
+        "pages": int(sb.execute_script("return document.querySelector('html2pdf4doc-root').getAttribute('pages');")),
+        "dom": sb.execute_script(DOM_SIZE_SCRIPT),
+        "heap_mb": heap_mb,
+        "print_ms": statistics.median(print_times),
+        "pdf_bytes": size,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="html2pdf4doc print benchmark")
+    parser.add_argument("--sections", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--runs", type=int, default=3, help="prints per document")
+    parser.add_argument("--timeout", type=int, default=1800, help="seconds per rendering")
+    parser.add_argument("--output", default=os.path.join("output", "benchmark"))
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args()
+
+    Path(args.output).mkdir(parents=True, exist_ok=True)
+    results: List[Tuple[int, str, Dict]] = []
+    with SB(browser="chrome", headless=not args.headed) as sb:
+        sb.driver.execute_cdp_cmd("Performance.enable", {})
+        for sections in args.sections:
+            for mode in MODES:
+                path_to_html = os.path.join(args.output, f"print_{sections}_{mode}.html")
+                path_to_pdf = os.path.join(args.output, f"print_{sections}_{mode}.pdf")
+                with open(path_to_html, "w", encoding="utf-8") as file:
+                    file.write(generate_document(sections, mode))
+                results.append((sections, mode, render_and_print(sb, path_to_html, path_to_pdf, args.runs, args.timeout)))
+
+    print(  # noqa: T201
+        f"{'sections':>8} {'mode':>8} {'pages':>6} {'nodes':>9} {'elements':>9} {'lines':>8}"
+        f" {'heap MB':>8} {'print ms (median)':>18} {'PDF KB':>8}"
+    )
+    for sections, mode, result in results:
+        dom = result["dom"]
+        print(  # noqa: T201
+            f"{sections:>8} {mode:>8} {result['pages']:>6} {dom['nodes']:>9} {dom['elements']:>9}"
+            f" {dom['textLines']:>8} {result['heap_mb']:>8.1f} {result['print_ms']:>18.0f}"
+            f" {result['pdf_bytes'] / 1024:>8.0f}"
+        )
+    for sections in args.sections:
+        by_mode = {mode: result for size, mode, result in results if size == sections}
+        default, compact = by_mode["default"], by_mode["compact"]
+        nodes_removed = default["dom"]["nodes"] - compact["dom"]["nodes"]
+        print_ms = compact["print_ms"] - default["print_ms"]
+        print(  # noqa: T201
+            f"{sections} sections: compact removes {nodes_removed} nodes"
+            f" ({nodes_removed / max(default['dom']['nodes'], 1):.0%}),"
+            f" print {print_ms:+.0f} ms ({print_ms / max(default['print_ms'], 1):+.0%}),"
+            f" heap {compact['heap_mb'] - default['heap_mb']:+.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
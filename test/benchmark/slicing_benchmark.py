@@ -0,0 +1,101 @@
+import argparse
+import os
+import statistics
+from pathlib import Path
+from typing import Dict, List
+
+from pagination_benchmark import PARAGRAPH, PATH_TO_BUNDLE, PATH_TO_CSS, TIMING_SCRIPT, get_heap_mb, render
+from seleniumbase import SB
+
+# Slicing benchmark: renders a table with one cell that spans many pages,
+# so that the cell content is sliced into many parts at once, with the
+# single-pass slicing (data-single-pass-slicing="true") and with one clone
+# of the cell per part (default). Prints the rendering time and the
+# JS heap used after the rendering.
+#
+#   invoke benchmark-slicing
+#   python test/benchmark/slicing_benchmark.py --pages 20 100 --runs 3
+
+MODES = {
+    "single-pass": ' data-single-pass-slicing="true"',
+    "clone": "",
+}
+
+# About one A4 page of paragraphs per page of the cell.
+PARAGRAPHS_PER_PAGE = 6
+
+
+def generate_document(pages: int, mode: str) -> str:
+    paragraphs = "".join(
+        f"<p>{index}. {PARAGRAPH}</p>" for index in range(pages * PARAGRAPHS_PER_PAGE)
+    )
+    return f"""<!doctype html>
+<html lang="">
+
+<head>
+  <meta charset="utf-8">
+  <title>Slicing benchmark: {pages} pages, {mode}</title>
+  {TIMING_SCRIPT}
+  <script src="{Path(PATH_TO_BUNDLE).as_uri()}"{MODES[mode]}></script>
+  <link rel="stylesheet" href="{Path(PATH_TO_CSS).as_uri()}">
+</head>
+
+<body>
+  <table>
+    <tbody>
+      <tr><td>before</td><td>before</td></tr>
+      <tr><td>long cell</td><td>{paragraphs}</td></tr>
+      <tr><td>after</td><td>after</td></tr>
+    </tbody>
+  </table>
+</body>
+
+</html>
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="html2pdf4doc slicing benchmark")
+    parser.add_argument("--pages", type=int, nargs="+", default=[20, 100])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--timeout", type=int, default=1800, help="seconds per rendering")
+    parser.add_argument("--output", default=os.path.join("output", "benchmark"))
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args()
+
+    Path(args.output).mkdir(parents=True, exist_ok=True)
+    results: List[Dict] = []
+    with SB(browser="chrome", headless=not args.headed) as sb:
+        sb.driver.execute_cdp_cmd("Performance.enable", {})
+        for pages in args.pages:
+            for mode in MODES:
+                path_to_html = os.path.join(args.output, f"slicing_{pages}_{mode}.html")
+                with open(path_to_html, "w", encoding="utf-8") as file:
+                    file.write(generate_document(pages, mode))
+                runs = []
+                for _ in range(args.runs):
+                    run = render(sb, path_to_html, args.timeout)
+                    run["heap_mb"] = get_heap_mb(sb)
+                    runs.append(run)
+                results.append({
+                    "cell_pages": pages,
+                    "mode": mode,
+                    "pages": runs[-1]["pages"],
+                    "ms": statistics.median(run["ms"] for run in runs),
+                    "heap_mb": statistics.median(run["heap_mb"] for run in runs),
+                })
+
+    print(f"{'cell pages':>10} {'mode':>12} {'pages':>6} {'median ms':>11} {'heap MB':>8}")  # noqa: T201
+    for result in results:
+        print(  # noqa: T201
+            f"{result['cell_pages']:>10} {result['mode']:>12} {result['pages']:>6} "
+            f"{result['ms']:>11.0f} {result['heap_mb']:>8.1f}"
+        )
+    for pages in args.pages:
+        by_mode = {r["mode"]: r for r in results if r["cell_pages"] == pages}
+        ratio = by_mode["clone"]["ms"] / max(by_mode["single-pass"]["ms"], 1)
+        print(f"{pages} cell pages: clone takes {ratio:.2f}x of single-pass")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
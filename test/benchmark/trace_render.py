@@ -0,0 +1,157 @@
+import argparse
+import json
+import math
+import os
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List
+
+from pagination_benchmark import PATH_TO_BUNDLE, PATH_TO_CSS, generate_section
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Render trace: renders a document with data-user-timing="true" while
+# ChromeDriver records a CDP trace (Tracing domain, through the performance
+# log), saves the trace and prints the User Timing measures of the rendering:
+# the stages, the pages and the splitter calls (count, total, p95).
+#
+# The trace opens in the Performance panel of Chrome DevTools
+# ("Load profile..."), the measures are in its Timings track.
+#
+#   invoke trace-render
+#   python test/benchmark/trace_render.py --sections 100
+#   python test/benchmark/trace_render.py --html path/to/document.html
+#
+# A document given with --html must load the bundle with data-user-timing="true".
+
+PREFIX = "html2pdf4doc:"
+
+TRACE_CATEGORIES = ",".join([
+    "blink.user_timing",
+    "devtools.timeline",
+    "disabled-by-default-devtools.timeline",
+    "v8.execute",
+])
+
+READ_MEASURES_SCRIPT = f"""
+return performance.getEntriesByType('measure')
+  .filter(entry => entry.name.startsWith('{PREFIX}'))
+  .map(entry => ({{ name: entry.name.slice({len(PREFIX)}), ms: entry.duration }}));
+"""
+
+
+def generate_document(sections: int) -> str:
+    content = "".join(generate_section(index) for index in range(1, sections + 1))
+    return f"""<!doctype html>
+<html lang="">
+
+<head>
+  <meta charset="utf-8">
+  <title>Render trace: {sections} sections</title>
+  <script src="{Path(PATH_TO_BUNDLE).as_uri()}" data-user-timing="true"></script>
+  <link rel="stylesheet" href="{Path(PATH_TO_CSS).as_uri()}">
+</head>
+
+<body>
+{content}
+</body>
+
+</html>
+"""
+
+
+def create_driver(headed: bool) -> webdriver.Chrome:
+    options = webdriver.ChromeOptions()
+    if not headed:
+        options.add_argument("--headless=new")
+    # ChromeDriver traces the session and returns the trace events
+    # as Tracing.dataCollected messages of the performance log.
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    options.add_experimental_option("perfLoggingPrefs", {
+        "enableNetwork": False,
+        "enablePage": False,
+        "traceCategories": TRACE_CATEGORIES,
+    })
+    return webdriver.Chrome(options=options)
+
+
+def read_trace_events(driver) -> List[Dict]:
+    events = []
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+        if message["method"] == "Tracing.dataCollected":
+            events.append(message["params"])
+    return events
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    # Nearest rank.
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def summarize(measures: List[Dict]) -> Dict[str, List[float]]:
+    groups: Dict[str, List[float]] = defaultdict(list)
+    for measure in measures:
+        name = measure["name"]
+        # "page:12" -> "page"
+        group = "page" if name.startswith("page:") else name
+        groups[group].append(float(measure["ms"]))
+    return groups
+
+
+def print_summary(groups: Dict[str, List[float]]) -> None:
+    print(f"{'measure':>16} {'count':>6} {'total ms':>10} {'p95 ms':>8} {'max ms':>8}")  # noqa: T201
+    # The stages in their order, then the pages, then the splitters.
+    names = [name for name in groups if not name.startswith(("page", "split:"))]
+    names += [name for name in ["page"] if name in groups]
+    names += sorted(name for name in groups if name.startswith("split:"))
+    for name in names:
+        values = groups[name]
+        print(  # noqa: T201
+            f"{name:>16} {len(values):>6} {sum(values):>10.1f} "
+            f"{percentile(values, 0.95):>8.2f} {max(values):>8.2f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="html2pdf4doc render trace")
+    parser.add_argument("--html", help="document to render (default: a generated one)")
+    parser.add_argument("--sections", type=int, default=100, help="sections of the generated document")
+    parser.add_argument("--timeout", type=int, default=1800, help="seconds for the rendering")
+    parser.add_argument("--output", default=os.path.join("output", "trace"))
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args()
+
+    Path(args.output).mkdir(parents=True, exist_ok=True)
+    path_to_html = args.html
+    if path_to_html is None:
+        path_to_html = os.path.join(args.output, f"trace_{args.sections}.html")
+        with open(path_to_html, "w", encoding="utf-8") as file:
+            file.write(generate_document(args.sections))
+    path_to_trace = os.path.join(args.output, f"{Path(path_to_html).stem}.trace.json")
+
+    driver = create_driver(args.headed)
+    try:
+        driver.get(Path(path_to_html).resolve().as_uri())
+        WebDriverWait(driver, args.timeout).until(
+            expected_conditions.presence_of_element_located((By.XPATH, "//html2pdf4doc-root[@success]"))
+        )
+        measures = driver.execute_script(READ_MEASURES_SCRIPT)
+        events = read_trace_events(driver)
+    finally:
+        driver.quit()
+
+    with open(path_to_trace, "w", encoding="utf-8") as file:
+        json.dump({"traceEvents": events}, file)
+    print(f"Trace: {path_to_trace} ({len(events)} events)")  # noqa: T201
+
+    if not measures:
+        raise SystemExit('No User Timing measures: is the bundle loaded with data-user-timing="true"?')
+    print_summary(summarize(measures))
+
+
+if __name__ == "__main__":
+    main()
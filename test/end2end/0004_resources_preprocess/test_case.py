@@ -14,6 +14,12 @@ object_timeout = '//*[@data-testid="object_timeout"]'
 inside_img = '//*[@data-testid="inside_img"]'
 outside_img = '//*[@data-testid="outside_img"]'
 resource_issue_count = '//*[@data-testid="resource_issue_count"]'
+bg_inline = '//*[@data-testid="bg_inline"]'
+bg_media = '//*[@data-testid="bg_media"]'
+bg_var = '//*[@data-testid="bg_var"]'
+bg_shorthand_var = '//*[@data-testid="bg_shorthand_var"]'
+bg_inline_upper_case = '//*[@data-testid="bg_inline_upper_case"]'
+bg_none = '//*[@data-testid="bg_none"]'
 
 
 class Test(BaseCase):
@@ -82,3 +88,16 @@ class Test(BaseCase):
         # Resource issue event should increment the counter.
         self.helper.open_case_allow_resource_404(path_to_this_test_file_folder, 'resource_event')
         self.helper.assert_element_has_text(resource_issue_count, '2')
+
+    def test008_background_sources(self):
+        # Background images are discovered from inline styles, nested @media rules
+        # and custom properties (also in the background shorthand, and with URL( in
+        # upper case); elements without a background are not marked.
+        self.helper.open_case_allow_resource_404(path_to_this_test_file_folder, 'bg_inline_and_media')
+        for element in (bg_inline, bg_media, bg_var, bg_shorthand_var, bg_inline_upper_case):
+            self.helper.assert_element_attribute_in_direct(
+                element,
+                'html2pdf4doc-resource-status',
+                ['timeout', 'error'],
+            )
+        self.helper.assert_element_attribute_absent_direct(bg_none, 'html2pdf4doc-resource-status')
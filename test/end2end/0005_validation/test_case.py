@@ -0,0 +1,59 @@
+import os
+
+from seleniumbase import BaseCase
+
+from test.end2end.helpers.helper import Helper
+
+path_to_this_test_file_folder = os.path.dirname(os.path.abspath(__file__))
+
+root = '//html2pdf4doc-root'
+validated_root = '//html2pdf4doc-root[@html2pdf4doc-validation]'
+validation_event = '//*[@data-testid="validation_event"]'
+
+
+class Test(BaseCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = Helper(self)
+
+    def test_01_full(self):
+        # Default mode: every page is validated before [success].
+        self.helper.open_case(path_to_this_test_file_folder, 'full')
+        self.helper.assert_html2pdf4doc_success()
+        self.helper.assert_document_has_pages(5)
+        self.helper.assert_element_attribute_equals_direct(root, 'html2pdf4doc-validation', 'passed')
+        self.helper.assert_element_has_text(validation_event, 'passed:')
+
+    def test_02_sampled(self):
+        # Only the first and the last pages are validated (sample size = 2).
+        self.helper.open_case(path_to_this_test_file_folder, 'sampled')
+        self.helper.assert_html2pdf4doc_success()
+        self.helper.assert_document_has_pages(5)
+        self.helper.assert_element_attribute_equals_direct(root, 'html2pdf4doc-validation', 'passed')
+        self.helper.assert_element_has_text(validation_event, 'passed:1,5')
+
+    def test_02a_sampled_one_page(self):
+        # data-validation-sample-size="1" is converted to `true` by the config:
+        # only the first page is validated (not 0: all pages).
+        self.helper.open_case(path_to_this_test_file_folder, 'sampled_one')
+        self.helper.assert_html2pdf4doc_success()
+        self.helper.assert_document_has_pages(5)
+        self.helper.assert_element_attribute_equals_direct(root, 'html2pdf4doc-validation', 'passed')
+        self.helper.assert_element(f"{validation_event}[normalize-space(.)='passed:1']")
+
+    def test_03_deferred(self):
+        # Validation runs after [success] and reports through the attribute and the event.
+        self.helper.open_case(path_to_this_test_file_folder, 'deferred')
+        self.helper.assert_html2pdf4doc_success()
+        self.helper.wait_for(validated_root)
+        self.helper.assert_document_has_pages(5)
+        self.helper.assert_element_attribute_equals_direct(root, 'html2pdf4doc-validation', 'passed')
+        self.helper.assert_element_has_text(validation_event, 'passed:')
+
+    def test_04_off(self):
+        # No validation: neither the attribute nor the event.
+        self.helper.open_case(path_to_this_test_file_folder, 'off')
+        self.helper.assert_html2pdf4doc_success()
+        self.helper.assert_document_has_pages(5)
+        self.helper.assert_element_attribute_absent_direct(root, 'html2pdf4doc-validation')
+        self.helper.assert_element_has_text(validation_event, 'none')
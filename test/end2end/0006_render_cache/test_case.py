@@ -0,0 +1,60 @@
+import os
+import shutil
+import tempfile
+
+from pypdf import PdfReader
+from seleniumbase import BaseCase
+
+from test.end2end.helpers.helper import Helper
+from test.end2end.helpers.render_cache import RenderCache, compute_document_key
+
+path_to_this_test_file_folder = os.path.dirname(os.path.abspath(__file__))
+path_to_html = os.path.join(path_to_this_test_file_folder, "index.html")
+
+
+class Test(BaseCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = Helper(self)
+
+    def test_001(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = RenderCache(os.path.join(tmp_dir, "cache"))
+            first_pdf = os.path.join(tmp_dir, "first.pdf")
+            second_pdf = os.path.join(tmp_dir, "second.pdf")
+
+            # Miss: the document is rendered and printed.
+            page_count = self.helper.do_render_to_pdf_cached(path_to_html, first_pdf, cache)
+            assert page_count == 2, page_count
+            assert cache.stats()["misses"] == 1
+
+            # Hit: the PDF is restored from the cache.
+            page_count = self.helper.do_render_to_pdf_cached(path_to_html, second_pdf, cache)
+            assert page_count == 2, page_count
+            stats = cache.stats()
+            assert stats["hits"] == 1, stats
+            assert stats["entries"] == 1, stats
+
+            assert len(PdfReader(second_pdf).pages) == 2
+            with open(first_pdf, "rb") as first, open(second_pdf, "rb") as second:
+                assert first.read() == second.read()
+
+    def test_002_key_does_not_depend_on_the_folder(self):
+        # The same document with the same resources in two folders has the same key.
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            keys = []
+            for folder in ("first", os.path.join("second", "nested")):
+                copy_folder = os.path.join(tmp_dir, folder)
+                os.makedirs(copy_folder)
+                shutil.copy(path_to_html, copy_folder)
+                with open(os.path.join(copy_folder, "style.css"), "w", encoding="utf8") as file:
+                    file.write("p { color: black; }")
+                with open(os.path.join(copy_folder, "index.html"), "a", encoding="utf8") as file:
+                    file.write('<link rel="stylesheet" href="style.css">\n')
+                keys.append(compute_document_key(os.path.join(copy_folder, "index.html")))
+            assert keys[0] == keys[1]
+
+            # A changed resource changes the key.
+            with open(os.path.join(tmp_dir, "first", "style.css"), "w", encoding="utf8") as file:
+                file.write("p { color: red; }")
+            assert compute_document_key(os.path.join(tmp_dir, "first", "index.html")) != keys[0]
@@ -0,0 +1,60 @@
+import os
+
+from seleniumbase import BaseCase
+
+from test.end2end.helpers.helper import Helper, make_file_url
+
+path_to_this_test_file_folder = os.path.dirname(os.path.abspath(__file__))
+index_url = make_file_url(path_to_this_test_file_folder, "index.html")
+xml_invalid_url = make_file_url(path_to_this_test_file_folder, "case_xml_invalid.html")
+
+
+class Test(BaseCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = Helper(self)
+
+    def test_01_report(self):
+        self.helper.do_open(index_url)
+        self.helper.assert_html2pdf4doc_success()
+
+        report = self.helper.get_layout_report()
+        assert report.success
+        assert report.page_count == 3
+        assert [page["page"] for page in report.data["pages"]] == [1, 2, 3]
+        assert report.page(2)["start"] is not None
+        assert report.validation["status"] == "passed"
+        assert report.print_area["height"] > 0
+
+        # Page numbers of the content elements and of the page chrome.
+        assert report.page_of('//*[@data-testid="intro"]') == 1
+        assert report.page_of('//*[@data-testid="third"]') == 3
+        assert report.page_of('(//html2pdf4doc-page-body-spacer)[2]') == 2
+
+    def test_02_assertions_use_one_report(self):
+        self.helper.do_open(index_url)
+        self.helper.assert_html2pdf4doc_success()
+        report = self.helper.get_layout_report()
+
+        self.helper.assert_document_has_pages(3)
+        self.helper.assert_element_on_the_page('//*[@data-testid="first"]', 1)
+        self.helper.assert_element_on_the_page('//*[@data-testid="second"]', 2)
+        self.helper.assert_text_on_the_page('Layout report', 1)
+        self.helper.assert_elements_order('//*[@data-testid="first"]', '//*[@data-testid="third"]')
+        self.helper.assert_element_fit_height('//*[@data-testid="second"]')
+
+        # No new report was requested for the assertions above.
+        assert self.helper.get_layout_report() is report
+
+    def test_03_names_and_characters_invalid_in_xml(self):
+        self.helper.do_open(xml_invalid_url)
+        self.helper.assert_html2pdf4doc_success()
+        report = self.helper.get_layout_report()
+
+        # "o:p" is kept under a placeholder tag with the original name.
+        office_paragraph = report.find('//*[@data-original-tag="o:p"]')
+        assert report.attribute(office_paragraph, "data-testid") == "office-paragraph"
+        # The control characters are removed from the text.
+        assert report.text('//*[@data-testid="control"]') == "Verticaltab"
+        assert report.text('//*[@data-testid="nul"]') == "NULcharacter"
+        self.helper.assert_element_on_the_page('//*[@data-testid="nul"]', 1)
@@ -0,0 +1,55 @@
+import os
+from pathlib import Path
+
+import pytest
+from pypdf import PdfReader
+from seleniumbase import BaseCase
+
+from test.end2end.helpers.helper import Helper
+from test.end2end.helpers.pdf_postprocess import PageCountMismatchError, PdfBookAssembler
+
+path_to_this_test_file_folder = os.path.dirname(os.path.abspath(__file__))
+output_folder = os.path.join("output", "0008_pdf_book")
+
+
+class Test(BaseCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = Helper(self)
+
+    def _print_chapter(self, name: str):
+        self.helper.open_case(path_to_this_test_file_folder, name)
+        self.helper.assert_html2pdf4doc_success()
+        path_to_pdf = os.path.join(output_folder, f"{name}.pdf")
+        self.helper.do_print_page_to_pdf(path_to_pdf)
+        return path_to_pdf, self.helper.get_page_count(), self.helper.get_outline()
+
+    def test_01_book(self):
+        Path(output_folder).mkdir(parents=True, exist_ok=True)
+        assembler = PdfBookAssembler()
+        for name, title in (("chapter_1", "Chapter 1"), ("chapter_2", "Chapter 2")):
+            path_to_pdf, pages, outline = self._print_chapter(name)
+            assembler.append(path_to_pdf, expected_pages=pages, outline=outline, title=title)
+
+        stats = assembler.write(os.path.join(output_folder, "book.pdf"))
+        assert stats["documents"] == 2
+        assert stats["pages"] == 3
+        assert stats["pages_per_second"] > 0
+
+        reader = PdfReader(os.path.join(output_folder, "book.pdf"))
+        assert len(reader.pages) == 3
+        top_level = [item for item in reader.outline if not isinstance(item, list)]
+        assert [item.title for item in top_level] == ["Chapter 1", "Chapter 2"]
+        # Chapter 1: "Chapter one" (page 1) > "Section one" (page 2).
+        chapter_1 = reader.outline[1]
+        assert chapter_1[0].title == "Chapter one"
+        assert reader.get_destination_page_number(chapter_1[1][0]) == 1
+        assert reader.get_destination_page_number(top_level[1]) == 2
+
+    def test_02_page_count_mismatch(self):
+        Path(output_folder).mkdir(parents=True, exist_ok=True)
+        path_to_pdf, pages, _ = self._print_chapter("chapter_2")
+        assert pages == 1
+
+        with pytest.raises(PageCountMismatchError):
+            PdfBookAssembler().append(path_to_pdf, expected_pages=pages + 1)
@@ -0,0 +1,71 @@
+import json
+import os
+from pathlib import Path
+
+from seleniumbase import BaseCase
+
+from test.end2end.helpers.helper import Helper
+
+path_to_this_test_file_folder = os.path.dirname(os.path.abspath(__file__))
+output_folder = os.path.join("output", "0009_break_plan")
+
+_root_ = "//html2pdf4doc-root"
+
+
+class Test(BaseCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = Helper(self)
+
+    def _record(self):
+        self.helper.open_case(path_to_this_test_file_folder, "record")
+        self.helper.assert_html2pdf4doc_success()
+        Path(output_folder).mkdir(parents=True, exist_ok=True)
+        plan = self.helper.save_break_plan(os.path.join(output_folder, "break_plan.json"))
+        return plan, self.helper.get_page_count()
+
+    def _section_pages(self):
+        report = self.helper.get_layout_report()
+        return [report.page_of(f"//h2[@id='{section}']") for section in ("section-1", "section-2")]
+
+    def _replay(self, plan):
+        # The replay case reads the plan from the session storage of the tab.
+        self.execute_script(
+            "sessionStorage.setItem('html2pdf4doc-break-plan', arguments[0]);",
+            json.dumps(plan),
+        )
+        self.helper.open_case(path_to_this_test_file_folder, "replay")
+        self.helper.assert_html2pdf4doc_success()
+
+    def test_01_record(self):
+        plan, pages = self._record()
+        assert plan["pageCount"] == pages
+        assert pages > 1
+        # One entry per top-level child of the content flow.
+        page_starts = [entry for entry in plan["entries"] if isinstance(entry, list)]
+        assert page_starts, plan["entries"]
+
+    def test_02_replay(self):
+        plan, pages = self._record()
+        section_pages = self._section_pages()
+        self._replay(plan)
+        self.assert_attribute(_root_, "html2pdf4doc-break-plan", "replayed")
+        assert self.helper.get_page_count() == pages
+        assert self._section_pages() == section_pages
+
+    def test_03_wrong_plan_falls_back(self):
+        plan, pages = self._record()
+        for entry in plan["entries"]:
+            if isinstance(entry, list):
+                entry[0][1] += 100
+                break
+        self._replay(plan)
+        self.assert_attribute(_root_, "html2pdf4doc-break-plan", "fallback")
+        assert self.helper.get_page_count() == pages
+
+    def test_04_other_document_is_rejected(self):
+        plan, pages = self._record()
+        plan["contentHash"] = "00000000"
+        self._replay(plan)
+        self.assert_attribute(_root_, "html2pdf4doc-break-plan", "rejected")
+        assert self.helper.get_page_count() == pages
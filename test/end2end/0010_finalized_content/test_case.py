@@ -0,0 +1,50 @@
+import os
+
+from seleniumbase import BaseCase
+
+from test.end2end.helpers.helper import Helper
+
+path_to_this_test_file_folder = os.path.dirname(os.path.abspath(__file__))
+
+spacer = "//html2pdf4doc-finalized-content"
+tested_elements = "//*[starts-with(@data-testid, 'heading-') or starts-with(@data-testid, 'paragraph-')]"
+
+
+class Test(BaseCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = Helper(self)
+
+    def _render(self, case: str):
+        self.helper.open_case(path_to_this_test_file_folder, case)
+        self.helper.assert_html2pdf4doc_success()
+        report = self.helper.get_layout_report()
+        pages = {
+            report.attribute(node_id, "data-testid"): report.page_of(node_id)
+            for node_id in report.find_all(tested_elements)
+        }
+        self._stats = report.pagination_stats["finalizedContent"]
+        return report.page_count, pages
+
+    def test_01_same_pages_as_default(self):
+        default_page_count, default_pages = self._render("default")
+        assert default_page_count > 4
+        assert self._stats is None
+
+        page_count, pages = self._render("contained")
+        # The finalized content is put back before Preview.
+        self.assert_element_not_present(spacer, by="xpath")
+        assert page_count == default_page_count
+        assert pages == default_pages
+        # The containment was used, and the geometry was kept.
+        assert self._stats["batches"] > 0, self._stats
+        assert self._stats["detachedNodes"] >= 32, self._stats
+        assert not self._stats["disabled"], self._stats
+
+    def test_02_nested_content_is_not_contained(self):
+        # Only the top-level children of the content flow are detached:
+        # with one wrapper around the content, nothing is.
+        page_count, _ = self._render("contained_nested")
+        assert page_count > 4
+        assert self._stats["batches"] == 0, self._stats
+        assert self._stats["detachedNodes"] == 0, self._stats
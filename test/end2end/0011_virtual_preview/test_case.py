@@ -0,0 +1,81 @@
+import os
+
+from selenium.webdriver.common.by import By
+from seleniumbase import BaseCase
+
+from test.end2end.helpers.helper import Helper
+
+path_to_this_test_file_folder = os.path.dirname(os.path.abspath(__file__))
+
+page_chrome = "//html2pdf4doc-page-chrome"
+header = "//html2pdf4doc-page-chrome//*[@data-testid='header']"
+last_page_header = "(//html2pdf4doc-page-chrome)[last()]//*[@data-testid='header']"
+last_heading = "//*[@data-testid='heading-40']"
+
+
+class Test(BaseCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = Helper(self)
+
+    def _count(self, xpath: str) -> int:
+        return len(self.find_elements(xpath, by=By.XPATH))
+
+    def test_01_chrome_near_the_viewport(self):
+        self.helper.open_case(path_to_this_test_file_folder, "virtual")
+        self.helper.assert_html2pdf4doc_success()
+        page_count = self.helper.get_page_count()
+        assert page_count > 10
+
+        # Every page has its chrome box, only the pages near the viewport have content.
+        self.sleep(0.5)
+        assert self._count(page_chrome) == page_count
+        assert 0 < self._count(header) < page_count
+        self.assert_element_not_present(last_page_header, by=By.XPATH)
+
+        self.scroll_to(last_heading, by=By.XPATH)
+        self.wait_for_element_present(last_page_header, by=By.XPATH)
+
+    def test_02_everything_before_printing(self):
+        self.helper.open_case(path_to_this_test_file_folder, "virtual")
+        self.helper.assert_html2pdf4doc_success()
+        page_count = self.helper.get_page_count()
+
+        self.execute_script("HTML2PDF4DOC.preparePrint();")
+        assert self._count(header) == page_count
+        # The preview is not virtualized anymore.
+        self.scroll_to_top()
+        self.sleep(0.5)
+        assert self._count(header) == page_count
+
+    def test_03_report_keeps_the_virtualization(self):
+        self.helper.open_case(path_to_this_test_file_folder, "virtual")
+        self.helper.assert_html2pdf4doc_success()
+        page_count = self.helper.get_page_count()
+        self.sleep(0.5)
+        headers = self._count(header)
+
+        # The report reads the chrome of every page...
+        report = self.helper.get_layout_report()
+        assert report.page_count == page_count
+        # ...and removes the content it has created.
+        assert self._count(header) == headers
+        self.assert_element_not_present(last_page_header, by=By.XPATH)
+
+        # The preview is still virtualized.
+        self.scroll_to(last_heading, by=By.XPATH)
+        self.wait_for_element_present(last_page_header, by=By.XPATH)
+        self.scroll_to_top()
+        self.wait_for_element_not_present(last_page_header, by=By.XPATH)
+
+    def test_04_full_validation_keeps_the_chrome_bounded(self):
+        # The default validation mode checks every page: the chromes
+        # are created in batches, never for the whole document at once.
+        self.helper.open_case(path_to_this_test_file_folder, "virtual_full_validation")
+        self.helper.assert_html2pdf4doc_success()
+        page_count = self.helper.get_page_count()
+        assert page_count > 10
+
+        self.helper.assert_element_attribute_equals("//html2pdf4doc-root", "html2pdf4doc-validation", "passed")
+        max_headers = self.execute_script("return window.maxPageHeaders;")
+        assert 0 < max_headers < page_count, (max_headers, page_count)
@@ -0,0 +1,67 @@
+import os
+
+from selenium.webdriver.common.by import By
+from seleniumbase import BaseCase
+
+from test.end2end.helpers.helper import Helper
+
+path_to_this_test_file_folder = os.path.dirname(os.path.abspath(__file__))
+path_to_document = os.path.join(path_to_this_test_file_folder, "case_document.html")
+
+_root_ = "//html2pdf4doc-root"
+first_footer_page_number = "(//html2pdf4doc-page-chrome)[1]//*[@html2pdf4doc-page-number-current]"
+first_footer_page_total = "(//html2pdf4doc-page-chrome)[1]//*[@html2pdf4doc-page-number-total]"
+
+
+def heading(number: int) -> str:
+    return f"//*[@data-testid='heading-{number}']"
+
+
+class Test(BaseCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = Helper(self)
+
+    def test_01_whole_document(self):
+        self.helper.open_case(path_to_this_test_file_folder, "document")
+        self.helper.assert_document_has_pages(10)
+        self.assert_attribute_not_present(_root_, "html2pdf4doc-page-range", by=By.XPATH)
+
+    def test_02_first_pages(self):
+        self.helper.open_case(path_to_this_test_file_folder, "first_pages")
+        self.helper.assert_document_has_pages(3)
+        self.helper.assert_element_attribute_equals(_root_, "html2pdf4doc-page-range", "1-3+")
+        self.helper.assert_element_on_the_page(heading(3), 3)
+        # The pagination stopped after the range: the rest is hidden.
+        self.assert_element_not_visible(heading(4), by=By.XPATH)
+        self.assert_element_not_visible(heading(10), by=By.XPATH)
+        # The total is not known until the document is paginated to the end.
+        self.assert_exact_text("1", first_footer_page_number, by=By.XPATH)
+        self.assert_element_present(f"{first_footer_page_total}[not(normalize-space())]", by=By.XPATH)
+
+    def test_03_range_from_python(self):
+        self.helper.open_html(path_to_document, page_range="4-5")
+        self.helper.assert_document_has_pages(2)
+        self.helper.assert_element_attribute_equals(_root_, "html2pdf4doc-page-range", "4-5+")
+        self.helper.assert_element_on_the_page(heading(4), 1)
+        self.helper.assert_element_on_the_page(heading(5), 2)
+        self.assert_element_not_visible(heading(3), by=By.XPATH)
+        self.assert_element_not_visible(heading(6), by=By.XPATH)
+        # Headers and footers show the document page numbers.
+        self.assert_exact_text("4", first_footer_page_number, by=By.XPATH)
+
+    def test_04_range_to_the_end(self):
+        self.helper.open_html(path_to_document, page_range="9-")
+        self.helper.assert_document_has_pages(2)
+        self.helper.assert_element_attribute_equals(_root_, "html2pdf4doc-page-range", "9-10")
+        self.assert_exact_text("10", first_footer_page_total, by=By.XPATH)
+
+    def test_05_range_after_the_end(self):
+        self.helper.open_html(path_to_document, page_range="20-")
+        # The last page is shown, and the range is reported as empty.
+        self.helper.assert_document_has_pages(1)
+        self.helper.assert_element_attribute_equals(_root_, "html2pdf4doc-page-range", "empty")
+
+    def test_06_copy_outside_the_source_tree(self):
+        self.helper.open_html(path_to_document, page_range="4-5")
+        assert not any(".pages-" in name for name in os.listdir(path_to_this_test_file_folder))
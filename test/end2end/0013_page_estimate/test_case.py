@@ -0,0 +1,41 @@
+import os
+
+from selenium.webdriver.common.by import By
+from seleniumbase import BaseCase
+
+from test.end2end.helpers.helper import Helper
+
+path_to_this_test_file_folder = os.path.dirname(os.path.abspath(__file__))
+
+_root_ = "//html2pdf4doc-root"
+estimated_root = f"{_root_}[@html2pdf4doc-estimated-pages]"
+
+
+class Test(BaseCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = Helper(self)
+
+    def test_01_estimate_next_to_the_page_count(self):
+        self.helper.open_case(path_to_this_test_file_folder, "report")
+        self.helper.assert_html2pdf4doc_success()
+        page_count = self.helper.get_page_count()
+        estimate = self.helper.get_page_estimate()
+
+        assert estimate["actualPages"] == page_count
+        assert estimate["min"] <= estimate["pages"] <= estimate["max"]
+        assert estimate["min"] <= page_count <= estimate["max"], (estimate, page_count)
+        self.helper.assert_element_attribute_equals(
+            _root_, "html2pdf4doc-estimated-pages", str(estimate["pages"])
+        )
+
+    def test_02_estimate_only(self):
+        self.helper.open_case(path_to_this_test_file_folder, "only")
+        self.wait_for_element_present(estimated_root, by=By.XPATH)
+        estimate = self.helper.get_page_estimate()
+
+        assert estimate["pages"] > 1
+        assert estimate["actualPages"] is None
+        # Nothing is paginated.
+        self.assert_attribute_not_present(_root_, "success", by=By.XPATH)
+        self.assert_element_not_present("//html2pdf4doc-virtual-paper", by=By.XPATH)
@@ -0,0 +1,36 @@
+import os
+
+from seleniumbase import BaseCase
+
+from test.end2end.helpers.helper import Helper
+
+path_to_this_test_file_folder = os.path.dirname(os.path.abspath(__file__))
+
+# Text of the content flow with the whitespace collapsed.
+GET_TEXT_SCRIPT = """
+return document.querySelector('html2pdf4doc-content-flow')
+  .textContent.replace(/\\s+/g, ' ').trim();
+"""
+
+
+class Test(BaseCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = Helper(self)
+
+    def render(self, case: str):
+        self.helper.open_case(path_to_this_test_file_folder, case)
+        self.helper.assert_html2pdf4doc_success()
+        return self.helper.get_page_count(), self.execute_script(GET_TEXT_SCRIPT)
+
+    def test_01_long_cell_is_sliced(self):
+        page_count, _ = self.render("single_pass")
+        assert page_count > 2
+        self.helper.assert_document_has_pages(page_count)
+        self.helper.assert_element_on_the_page("//*[@data-testid='p-1']", 1)
+
+    def test_02_same_result_as_one_clone_per_part(self):
+        single_pass = self.render("single_pass")
+        clone = self.render("clone")
+
+        assert single_pass == clone
@@ -0,0 +1,68 @@
+import os
+
+from seleniumbase import BaseCase
+
+from test.end2end.helpers.helper import Helper
+
+path_to_this_test_file_folder = os.path.dirname(os.path.abspath(__file__))
+
+_paragraphs_ = [f"//*[@data-testid='p-{index}']" for index in range(1, 81)]
+_unordered_children_ = (
+    [f"//*[@data-testid='r-{index}']" for index in range(1, 31)]
+    + [f"//*[@data-testid='f-{index}']" for index in range(1, 31)]
+    + [f"//*[@data-testid='c-{index}']" for index in range(1, 41)]
+    + ["//*[@data-testid='heading-end']"]
+)
+
+
+class Test(BaseCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = Helper(self)
+
+    def get_pages_of_paragraphs(self):
+        layout_report = self.helper.get_layout_report()
+        return [layout_report.page_of(xpath) for xpath in _paragraphs_]
+
+    def test_01_fitting_siblings_are_skipped(self):
+        self.helper.open_case(path_to_this_test_file_folder, "gallop")
+        self.helper.assert_html2pdf4doc_success()
+
+        stats = self.helper.get_layout_report().pagination_stats["siblingGallop"]
+        assert stats["skipped"] > 0
+        assert stats["probes"] < stats["skipped"] * 3
+
+    def test_02_same_pages_as_one_by_one(self):
+        self.helper.open_case(path_to_this_test_file_folder, "one_by_one")
+        self.helper.assert_html2pdf4doc_success()
+        expected_page_count = self.helper.get_page_count()
+        expected_pages = self.get_pages_of_paragraphs()
+        assert self.helper.get_layout_report().pagination_stats["siblingGallop"]["skipped"] == 0
+
+        self.helper.open_case(path_to_this_test_file_folder, "gallop")
+        self.helper.assert_html2pdf4doc_success()
+        assert self.helper.get_page_count() == expected_page_count
+        assert self.get_pages_of_paragraphs() == expected_pages
+
+    def test_03_forced_break_in_a_skipped_range(self):
+        self.helper.open_case(path_to_this_test_file_folder, "gallop")
+        self.helper.assert_html2pdf4doc_success()
+        layout_report = self.helper.get_layout_report()
+
+        before_break_page = layout_report.page_of("//*[@data-testid='before-break']")
+        assert layout_report.page_of("//*[@data-testid='after-break']") == before_break_page + 1
+
+    def test_04_tops_that_go_up(self):
+        # Flex column-reverse, floats and columns: the children are not stacked
+        # in document order, and the gallop must not skip any of them.
+        self.helper.open_case(path_to_this_test_file_folder, "unordered_one_by_one")
+        self.helper.assert_html2pdf4doc_success()
+        expected_page_count = self.helper.get_page_count()
+        layout_report = self.helper.get_layout_report()
+        expected_pages = [layout_report.page_of(xpath) for xpath in _unordered_children_]
+
+        self.helper.open_case(path_to_this_test_file_folder, "unordered")
+        self.helper.assert_html2pdf4doc_success()
+        layout_report = self.helper.get_layout_report()
+        assert self.helper.get_page_count() == expected_page_count
+        assert [layout_report.page_of(xpath) for xpath in _unordered_children_] == expected_pages
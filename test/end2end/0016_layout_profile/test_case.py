@@ -0,0 +1,39 @@
+import os
+
+from seleniumbase import BaseCase
+
+from test.end2end.helpers.helper import Helper
+
+path_to_this_test_file_folder = os.path.dirname(os.path.abspath(__file__))
+
+
+class Test(BaseCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = Helper(self)
+
+    def test_01_profile_per_stage_and_caller(self):
+        self.helper.open_case(path_to_this_test_file_folder, "profile")
+        self.helper.assert_html2pdf4doc_success()
+        profile = self.helper.get_layout_profile()
+
+        totals = profile["totals"]
+        assert totals["reads"] > 0
+        assert totals["writes"] > 0
+        assert 0 < totals["forcedLayouts"] <= totals["reads"]
+        assert {"Layout", "Pages", "Preview"} <= set(profile["stages"])
+
+        # Pages measures through the Node helpers.
+        callers = [caller["caller"] for caller in profile["callers"] if caller["stage"] == "Pages"]
+        assert any(caller.startswith("Pages.") for caller in callers), callers
+        # The Node helpers are named by their alias ("Node.xY [as getTop]" in the bundle).
+        assert any(" > Node." in caller for caller in callers), callers
+        assert "Pages._parseNode > Node.getTop" in callers, callers
+        for row in profile["rows"]:
+            assert row["kind"] in ("read", "write")
+            assert row["forcedLayouts"] <= row["calls"]
+
+    def test_02_no_profile_by_default(self):
+        self.helper.open_case(path_to_this_test_file_folder, "default")
+        self.helper.assert_html2pdf4doc_success()
+        assert self.helper.get_layout_profile() is None
@@ -0,0 +1,34 @@
+import os
+
+from seleniumbase import BaseCase
+
+from test.end2end.helpers.helper import Helper
+
+path_to_this_test_file_folder = os.path.dirname(os.path.abspath(__file__))
+
+
+class Test(BaseCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = Helper(self)
+
+    def test_01_stages_pages_and_splitters(self):
+        self.helper.open_case(path_to_this_test_file_folder, "timing")
+        self.helper.assert_html2pdf4doc_success()
+        page_count = self.helper.get_page_count()
+        names = [measure["name"] for measure in self.helper.get_user_timing_measures()]
+
+        stages = [name for name in names if ":" not in name]
+        assert stages == ["Layout", "Preprocess", "Paper", "Pages", "Preview", "Toc", "Validator"], stages
+        # * One measure per registered page.
+        assert [name for name in names if name.startswith("page:")] == [
+            f"page:{page}" for page in range(1, page_count + 1)
+        ]
+        # * The long paragraphs and the table are split.
+        assert "split:Paragraph" in names
+        assert "split:Table" in names
+
+    def test_02_no_measures_by_default(self):
+        self.helper.open_case(path_to_this_test_file_folder, "default")
+        self.helper.assert_html2pdf4doc_success()
+        assert self.helper.get_user_timing_measures() == []
@@ -0,0 +1,42 @@
+import os
+
+from seleniumbase import BaseCase
+
+from test.end2end.helpers.helper import Helper
+
+path_to_this_test_file_folder = os.path.dirname(os.path.abspath(__file__))
+
+
+class Test(BaseCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = Helper(self)
+
+    def test_01_snapshot_per_stage(self):
+        self.helper.open_case(path_to_this_test_file_folder, "snapshots")
+        self.helper.assert_html2pdf4doc_success()
+        page_count = self.helper.get_page_count()
+        snapshots = self.helper.get_memory_snapshots()
+
+        assert [snapshot["stage"] for snapshot in snapshots] == ["Layout", "Pages", "Preview", "Toc", "Validator"]
+        by_stage = {snapshot["stage"]: snapshot for snapshot in snapshots}
+        for snapshot in snapshots:
+            assert 0 < snapshot["elements"] < snapshot["nodes"]
+        # * The long paragraphs are split into lines, the table into parts.
+        assert by_stage["Pages"]["services"]["textLines"] > by_stage["Layout"]["services"]["textLines"]
+        assert by_stage["Pages"]["services"]["cutParts"] > 0
+        # * The page chromes are created by Preview.
+        assert by_stage["Preview"]["services"]["pageChromes"] >= page_count
+        assert by_stage["Pages"]["services"]["pageChromes"] < by_stage["Preview"]["services"]["pageChromes"]
+
+        # * The same snapshots are in the layout report.
+        assert self.helper.get_layout_report().memory_snapshots == snapshots
+
+        counters = self.helper.get_memory_counters()
+        assert counters["nodes"] > 0
+        assert counters["jsEventListeners"] >= 0
+
+    def test_02_no_snapshots_by_default(self):
+        self.helper.open_case(path_to_this_test_file_folder, "default")
+        self.helper.assert_html2pdf4doc_success()
+        assert self.helper.get_memory_snapshots() is None
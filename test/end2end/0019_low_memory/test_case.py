@@ -0,0 +1,44 @@
+import os
+
+from seleniumbase import BaseCase
+
+from test.end2end.helpers.helper import Helper
+
+path_to_this_test_file_folder = os.path.dirname(os.path.abspath(__file__))
+
+HAS_RECORDED_PARTS = (
+    "return [...document.querySelectorAll('table')]"
+    ".some(table => table.__html2pdf4docRecordedParts !== undefined);"
+)
+
+
+def get_pages(report):
+    return [(page["page"], page["start"] is not None, page["divider"] is not None) for page in report.data["pages"]]
+
+
+class Test(BaseCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = Helper(self)
+
+    def test_01_same_layout_as_default(self):
+        self.helper.open_case(path_to_this_test_file_folder, "default")
+        self.helper.assert_html2pdf4doc_success()
+        default_page_count = self.helper.get_page_count()
+        default_pages = get_pages(self.helper.get_layout_report())
+        assert self.execute_script(HAS_RECORDED_PARTS)
+
+        self.helper.open_case(path_to_this_test_file_folder, "low_memory")
+        self.helper.assert_html2pdf4doc_success()
+        assert self.helper.get_page_count() == default_page_count
+        # * The page registries stay for the layout report.
+        assert get_pages(self.helper.get_layout_report(refresh=True)) == default_pages
+        self.helper.assert_element_on_the_page("//p[contains(., 'The end.')]", default_page_count)
+
+    def test_02_state_is_released(self):
+        self.helper.open_case(path_to_this_test_file_folder, "low_memory")
+        self.helper.assert_html2pdf4doc_success()
+        # * The table parts are not recorded.
+        assert not self.execute_script(HAS_RECORDED_PARTS)
+        stages = [snapshot["stage"] for snapshot in self.helper.get_memory_snapshots()]
+        assert stages[-1] == "Released"
@@ -0,0 +1,97 @@
+import os
+import tempfile
+from collections import defaultdict
+
+from pypdf import PdfReader
+from seleniumbase import BaseCase
+
+from test.end2end.helpers.helper import Helper
+
+path_to_this_test_file_folder = os.path.dirname(os.path.abspath(__file__))
+
+COUNT_TEXT_LINES = "return document.getElementsByTagName('html2pdf4doc-text-line').length;"
+
+
+def get_pages(report):
+    return [(page["page"], page["start"] is not None, page["divider"] is not None) for page in report.data["pages"]]
+
+
+def get_pdf_text_lines(path_to_pdf):
+    """
+    The text of every printed page as lines with their positions:
+    [[(y, x, text), ...], ...], in points rounded to 0.1. The text runs are
+    joined per baseline, so the result does not depend on how the text is
+    split into runs.
+    """
+    pages = []
+    for page in PdfReader(path_to_pdf).pages:
+        runs = defaultdict(list)
+
+        def visitor(text, cm, tm, _font_dict, _font_size, runs=runs):
+            if not text.strip():
+                return
+            x = tm[4] * cm[0] + tm[5] * cm[2] + cm[4]
+            y = tm[4] * cm[1] + tm[5] * cm[3] + cm[5]
+            runs[round(y, 1)].append((round(x, 1), text))
+
+        page.extract_text(visitor_text=visitor)
+        pages.append(
+            [
+                (y, min(x for x, _ in line), "".join(text for _, text in sorted(line)).strip())
+                for y, line in sorted(runs.items(), reverse=True)
+            ]
+        )
+    return pages
+
+
+class Test(BaseCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = Helper(self)
+
+    def test_01_same_layout_as_default(self):
+        self.helper.open_case(path_to_this_test_file_folder, "default")
+        self.helper.assert_html2pdf4doc_success()
+        default_page_count = self.helper.get_page_count()
+        default_pages = get_pages(self.helper.get_layout_report())
+        default_text_lines = self.execute_script(COUNT_TEXT_LINES)
+        assert default_text_lines > 0
+
+        self.helper.open_case(path_to_this_test_file_folder, "compact")
+        self.helper.assert_html2pdf4doc_success()
+        assert self.helper.get_page_count() == default_page_count
+        assert get_pages(self.helper.get_layout_report(refresh=True)) == default_pages
+        assert self.execute_script(COUNT_TEXT_LINES) < default_text_lines
+        self.helper.assert_element_on_the_page("//p[contains(., 'The end.')]", default_page_count)
+
+    def test_01a_same_print_as_default(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            default_pdf = os.path.join(tmp_dir, "default.pdf")
+            compact_pdf = os.path.join(tmp_dir, "compact.pdf")
+
+            self.helper.open_case(path_to_this_test_file_folder, "default")
+            self.helper.assert_html2pdf4doc_success()
+            self.helper.do_print_page_to_pdf(default_pdf)
+
+            self.helper.open_case(path_to_this_test_file_folder, "compact")
+            self.helper.assert_html2pdf4doc_success()
+            self.helper.do_print_page_to_pdf(compact_pdf)
+
+            default_lines = get_pdf_text_lines(default_pdf)
+            assert len(default_lines) > 1
+            assert any(any("The end." in text for _, _, text in page) for page in default_lines)
+            # The same text at the same positions on every page.
+            assert get_pdf_text_lines(compact_pdf) == default_lines
+
+    def test_02_stats(self):
+        self.helper.open_case(path_to_this_test_file_folder, "compact")
+        self.helper.assert_html2pdf4doc_success()
+        stats = self.helper.get_layout_report().pagination_stats["compaction"]
+        assert stats["mergedLines"] > 0
+        assert stats["nodesRemoved"] > 0
+        assert stats["nodesAfter"] == stats["nodesBefore"] - stats["nodesRemoved"]
+
+    def test_03_no_stats_by_default(self):
+        self.helper.open_case(path_to_this_test_file_folder, "default")
+        self.helper.assert_html2pdf4doc_success()
+        assert self.helper.get_layout_report().pagination_stats["compaction"] is None
@@ -0,0 +1,63 @@
+import os
+import tempfile
+
+from pypdf import PdfReader
+from seleniumbase import BaseCase
+
+from test.end2end.helpers.helper import Helper
+
+path_to_this_test_file_folder = os.path.dirname(os.path.abspath(__file__))
+path_to_html = os.path.join(path_to_this_test_file_folder, "index.html")
+
+COUNT_PAGE_CHROMES = "return document.getElementsByTagName('html2pdf4doc-page-chrome').length;"
+
+
+class Test(BaseCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = Helper(self)
+
+    def test_01_snapshot_without_scripts(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path_to_snapshot = os.path.join(tmp_dir, "snapshot.html")
+
+            self.helper.open_html(path_to_html)
+            self.helper.assert_html2pdf4doc_success()
+            page_count = self.helper.get_page_count()
+            page_chromes = self.execute_script(COUNT_PAGE_CHROMES)
+            self.helper.save_static_snapshot(path_to_snapshot)
+
+            with open(path_to_snapshot, encoding="utf-8") as file:
+                snapshot = file.read()
+            assert snapshot.startswith("<!DOCTYPE html>")
+            assert "<script" not in snapshot
+            assert "onclick" not in snapshot
+            assert 'href="#the-end"' in snapshot
+
+            # * The snapshot is the paginated document: no bundle, same pages.
+            self.helper.do_open(f"file:///{path_to_snapshot}")
+            assert self.execute_script("return typeof HTML2PDF4DOC;") == "undefined"
+            self.helper.assert_html2pdf4doc_success()
+            assert self.helper.get_page_count() == page_count
+            assert self.execute_script(COUNT_PAGE_CHROMES) == page_chromes
+            self.helper.assert_element("//html2pdf4doc-content-flow//p[@id='the-end']")
+
+    def test_02_print_and_reuse(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            snapshot_dir = os.path.join(tmp_dir, "snapshots")
+            first_pdf = os.path.join(tmp_dir, "first.pdf")
+            second_pdf = os.path.join(tmp_dir, "second.pdf")
+
+            # * No snapshot yet: the document is rendered and the snapshot is saved.
+            first = self.helper.do_render_to_pdf_via_snapshot(path_to_html, first_pdf, snapshot_dir)
+            assert not first["reused"]
+            assert first["page_count"] > 1, first
+
+            # * The same document: the snapshot is printed again without rendering.
+            second = self.helper.do_render_to_pdf_via_snapshot(path_to_html, second_pdf, snapshot_dir)
+            assert second["reused"]
+            assert second["snapshot"] == first["snapshot"]
+            assert len(os.listdir(snapshot_dir)) == 1
+
+            assert len(PdfReader(first_pdf).pages) == first["page_count"]
+            assert len(PdfReader(second_pdf).pages) == first["page_count"]
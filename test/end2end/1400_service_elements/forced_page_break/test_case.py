@@ -29,3 +29,16 @@ class Test(BaseCase):
         self.helper.assert_element_on_the_page(test_element3, 3)
         self.helper.assert_element_on_the_page(test_element4, 4)
         self.helper.assert_element_on_the_page(test_element5, 5)
+
+    def test_02_nested_in_elements_that_fit(self):
+        # The markers inside the elements that fit are taken
+        # from the forced page break index, in document order.
+        self.helper.open_case(path_to_this_test_file_folder, "nested")
+
+        self.helper.assert_document_has_pages(5)
+        for index in range(1, 5):
+            self.helper.assert_element_on_the_page(f'//*[@data-testid="nestedPoint{index}"]', index + 1)
+
+        stats = self.helper.get_layout_report().pagination_stats["forcedPageBreakIndex"]
+        assert stats["markers"] == 4
+        assert stats["rebuilds"] == 0
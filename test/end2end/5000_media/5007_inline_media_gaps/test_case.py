@@ -0,0 +1,44 @@
+import os
+
+from seleniumbase import BaseCase
+
+from test.end2end.helpers.helper import Helper
+
+path_to_this_test_file_folder = os.path.dirname(os.path.abspath(__file__))
+
+# [width, height] of the rendered images in the content flow.
+GET_IMAGE_SIZES_SCRIPT = """
+return [...document.querySelectorAll('html2pdf4doc-content-flow img')]
+  .map(img => [img.offsetWidth, img.offsetHeight]);
+"""
+
+
+class Test(BaseCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = Helper(self)
+
+    def test_001_square_images_keep_their_ratio(self):
+        self.helper.open_case(path_to_this_test_file_folder, "images")
+        self.helper.assert_html2pdf4doc_success()
+
+        stats = self.helper.get_layout_report().pagination_stats["inlineMediaGaps"]
+        assert stats["gapEstimates"] > 0
+
+        # The square images keep their aspect ratio after the fitting.
+        sizes = self.execute_script(GET_IMAGE_SIZES_SCRIPT)
+        assert len(sizes) == 6
+        for width, height in sizes:
+            assert abs(width - height) <= 1, sizes
+
+    def test_002_box_proportions_set_by_css(self):
+        # Square pictures in 600x1500 boxes (object-fit: contain): the fitting
+        # scales the box, not the natural size of the picture.
+        self.helper.open_case(path_to_this_test_file_folder, "css_box")
+        self.helper.assert_html2pdf4doc_success()
+
+        sizes = self.execute_script(GET_IMAGE_SIZES_SCRIPT)
+        assert len(sizes) == 4
+        for width, height in sizes:
+            assert height < 1500, sizes
+            assert abs(width / height - 600 / 1500) < 0.01, sizes
@@ -30,3 +30,21 @@ class Test(BaseCase):
         # 2. Check that the right parent node that contains 'admonition title' starts page "2"
         self.helper.assert_element_starts_page(primary, 2)
 
+    def test_002_chain_cache(self):
+        self.helper.open_case(path_to_this_test_file_folder, '001')
+        self.helper.assert_document_has_pages(2)
+
+        # The chain walks of findBetterPageStart are memoized during the pagination.
+        stats = self.helper.get_layout_report().pagination_stats["chainCache"]
+        assert stats["lookups"] > 0
+        assert stats["lookups"] == stats["hits"] + stats["walks"]
+        assert stats["steps"] > 0
+        # Some walks are reused: the memo saves steps.
+        assert stats["hits"] > 0, stats
+        assert stats["savedSteps"] > 0, stats
+        # Child-list writes (splits, wraps) clear the memo.
+        assert stats["invalidations"] > 0, stats
+
+        # Prepared children are computed once per unchanged child list.
+        children_stats = self.helper.get_layout_report().pagination_stats["preparedChildrenCache"]
+        assert children_stats["misses"] > 0
@@ -1,6 +1,12 @@
+import functools
+import json
 import os
 import sys
+import tempfile
+import threading
+import time
 from html.parser import HTMLParser
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 
 import pytest
 
@@ -13,18 +19,61 @@ sys.path.append(STRICTDOC_PATH)
 
 TESTS_TOTAL = 0
 
+# Set by pytest-xdist in every worker process ("gw0", "gw1", ...).
+# Empty when the tests run in a single process.
+WORKER_ID = os.getenv("PYTEST_XDIST_WORKER", "")
+
+# Base URL of the per-worker HTTP server (see the e2e_http_server fixture).
+# The helper rewrites file:/// URLs of the repository to this server.
+HTTP_BASE_URL_ENV = "HTML2PDF4DOC_E2E_BASE_URL"
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+LATEST_LOGS_DIR = os.path.join(REPO_ROOT, "latest_logs")
+
+# Recorded durations of the previous runs, used to balance parallel runs.
+DURATIONS_FILE = os.path.join(REPO_ROOT, ".e2e_durations.json")
+TEST_DURATIONS = {}
+
 
 def pytest_addoption(parser):
     # pass
     parser.addoption("--no-focus", action="store_true", help="Ignore @pytest.mark.focus")
-
-
+    parser.addoption(
+        "--strictdoc-parallelize",
+        action="store_true",
+        help="Parallel run: isolate workers and balance tests by recorded duration",
+    )
+    parser.addoption(
+        "--strictdoc-long-timeouts",
+        action="store_true",
+        help="Increase allowed test durations",
+    )
+    parser.addoption(
+        "--e2e-http-server",
+        action="store_true",
+        help="Serve test cases from a local HTTP server (one per worker) instead of file:///",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
 def pytest_configure(config):
     # pass
     config.addinivalue_line("markers", "focus: run only focused tests")
 
+    if WORKER_ID:
+        # Each worker gets its own browser profile, so that parallel Chrome
+        # instances never fight over the profile lock or share a cache.
+        option = config.option
+        if hasattr(option, "user_data_dir") and not option.user_data_dir:
+            option.user_data_dir = os.path.join(
+                tempfile.gettempdir(), f"html2pdf4doc-e2e-profile-{os.getpid()}-{WORKER_ID}"
+            )
+
 
 def pytest_collection_modifyitems(config, items):
+    if config.getoption("--strictdoc-parallelize", default=False):
+        _sort_by_recorded_duration(items)
+
     # Force ignore focus: RUN_ALL=1 or --no-focus
     if config.getoption("--no-focus", default=False) or os.getenv("RUN_ALL") == "1":
         return
@@ -37,6 +86,71 @@ def pytest_collection_modifyitems(config, items):
         config.hook.pytest_deselected(items=deselected)
 
 
+def _load_durations():
+    try:
+        with open(DURATIONS_FILE, "r", encoding="utf-8") as file:
+            durations = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    return durations if isinstance(durations, dict) else {}
+
+
+def _sort_by_recorded_duration(items):
+    # Longest tests first: the workers pick them up early and the short ones
+    # fill the gaps at the end of the run. Unknown tests are treated as slow.
+    # The order must be deterministic: every xdist worker collects on its own
+    # and the collections are compared.
+    durations = _load_durations()
+    if not durations:
+        return
+    unknown = max(durations.values())
+    items.sort(key=lambda it: (-durations.get(it.nodeid, unknown), it.nodeid))
+
+
+def pytest_runtest_logreport(report):
+    # Under xdist, the controller receives the reports of all workers.
+    if report.when == "call":
+        TEST_DURATIONS[report.nodeid] = round(report.duration, 3)
+
+
+def pytest_sessionfinish(session):
+    if hasattr(session.config, "workerinput") or not TEST_DURATIONS:
+        return
+    durations = _load_durations()
+    durations.update(TEST_DURATIONS)
+    try:
+        with open(DURATIONS_FILE, "w", encoding="utf-8") as file:
+            json.dump(durations, file, indent=2, sort_keys=True)
+    except OSError:
+        pass
+
+
+class _QuietHTTPRequestHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+@pytest.fixture(scope="session", autouse=True)
+def e2e_http_server(request):
+    if not request.config.getoption("--e2e-http-server", default=False):
+        yield None
+        return
+
+    # Port 0: every worker gets a free ephemeral port.
+    handler = functools.partial(_QuietHTTPRequestHandler, directory=REPO_ROOT)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/"
+    os.environ[HTTP_BASE_URL_ENV] = base_url
+    try:
+        yield base_url
+    finally:
+        os.environ.pop(HTTP_BASE_URL_ENV, None)
+        server.shutdown()
+        server.server_close()
+
+
 # How to get the count of tests collected?
 # https://stackoverflow.com/a/66515819/598057
 def pytest_runtestloop(session):
@@ -46,9 +160,9 @@ def pytest_runtestloop(session):
 
 TEST_COUNTER = 0
 FAILED_HTML_DUMPS_CALL_STAGE = {}
-
-REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
-LATEST_LOGS_DIR = os.path.join(REPO_ROOT, "latest_logs")
+# Start time of each test in this process: page sources in latest_logs that
+# are older than the test belong to a previous run and are not reported.
+TEST_STARTED_AT = {}
 MAX_HTML_CHARS = 8000
 HTML_FRAGMENT_MODE_DEFAULT = "body"
 HTML_FRAGMENT_MODE = os.getenv("E2E_HTML_FRAGMENT_MODE", HTML_FRAGMENT_MODE_DEFAULT)
@@ -59,10 +173,15 @@ print(f"[debug] HTML fragment mode at import: {HTML_FRAGMENT_MODE}", flush=True)
 def run_around_tests():
     global TEST_COUNTER  # pylint: disable=global-statement
     TEST_COUNTER += 1
-    print(f"-> Test {TEST_COUNTER}/{TESTS_TOTAL}")  # noqa: T201
+    worker_prefix = f"[{WORKER_ID}] " if WORKER_ID else ""
+    print(f"-> {worker_prefix}Test {TEST_COUNTER}/{TESTS_TOTAL}")  # noqa: T201
     yield
 
 
+def pytest_runtest_setup(item):
+    TEST_STARTED_AT[item.nodeid] = time.time()
+
+
 @pytest.hookimpl(hookwrapper=True, tryfirst=True)
 def pytest_runtest_call(item):
     outcome = yield
@@ -162,6 +281,9 @@ def _read_latest_logs_page_source(nodeid: str):
     html_path = os.path.join(candidate, "page_source.html")
     if not os.path.isfile(html_path):
         return None
+    started_at = TEST_STARTED_AT.get(nodeid)
+    if started_at is not None and os.path.getmtime(html_path) < started_at:
+        return None
 
     try:
         with open(html_path, "r", encoding="utf-8") as file:
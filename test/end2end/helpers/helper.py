@@ -1,10 +1,21 @@
-import base64
+import json
 import os
-from typing import List, Dict
+from typing import List, Dict, Optional
+from urllib.parse import quote
 
 from selenium.webdriver.common.by import By
 from seleniumbase import BaseCase
 
+from test.end2end.helpers.layout_report import LayoutReport
+from test.end2end.helpers.page_range import write_page_range_copy
+from test.end2end.helpers.pdf_print import print_options_from_config, print_to_pdf_stream
+from test.end2end.helpers.render_cache import RenderCache
+from test.end2end.helpers.static_snapshot import (
+    get_snapshot_print_config,
+    save_static_snapshot,
+    snapshot_path_for,
+)
+
 # Elements should appear in the DOM on success:
 # only once
 _root_ = '//html2pdf4doc-root'
@@ -28,6 +39,26 @@ _page_footer_ = _page_chrome_ + '/html2pdf4doc-page-footer'
 
 # --- Local file URL helpers ---------------------------------------------------
 
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+# Set by the e2e_http_server fixture in conftest.py (--e2e-http-server).
+HTTP_BASE_URL_ENV = "HTML2PDF4DOC_E2E_BASE_URL"
+
+
+def resolve_test_url(url: str) -> str:
+    """Map a file:/// URL inside the repository to the worker's HTTP server.
+
+    Without the server (the default), the URL is returned unchanged.
+    """
+    base_url = os.getenv(HTTP_BASE_URL_ENV)
+    if not base_url or not url.startswith("file://"):
+        return url
+    path = os.path.normpath(url[len("file://"):])
+    if os.path.commonpath([path, REPO_ROOT]) != REPO_ROOT:
+        return url
+    relative_path = os.path.relpath(path, REPO_ROOT).replace(os.sep, "/")
+    return base_url + quote(relative_path)
+
+
 def make_file_url(base_folder: str, filename: str) -> str:
     """Build a file:/// URL for a given filename residing in base_folder.
 
@@ -62,12 +93,15 @@ class Helper:
     def __init__(self, test_case: BaseCase) -> None:
         assert isinstance(test_case, BaseCase)
         self.test_case: BaseCase = test_case
+        # Fetched once per opened page, see get_layout_report().
+        self._layout_report: Optional[LayoutReport] = None
 
     def is_chrome(self) -> bool:
         return self.test_case.browser == "chrome"
 
     def do_open(self, file: str, verify_logs: bool = False) -> None:
-        self.test_case.open(file)
+        self._layout_report = None
+        self.test_case.open(resolve_test_url(file))
         self.test_case.wait_for_ready_state_complete()
         self.test_case.assert_no_404_errors()
 
@@ -115,6 +149,9 @@ class Helper:
     def do_print_page_to_pdf(self, path_to_output_pdf: str) -> None:
         """
         Uses Chrome DevTools Protocol to save the current page as PDF.
+
+        The paper size and the margins are taken from the html2pdf4doc
+        config of the document; the PDF is streamed to the file in chunks.
         """
 
         driver = self.test_case.driver
@@ -123,19 +160,170 @@ class Helper:
         if "chrome" not in driver.capabilities["browserName"].lower():
             raise RuntimeError("PDF printing only works in Chrome")
 
-        # Send command to Chrome
-        result = driver.execute_cdp_cmd("Page.printToPDF", {
-            "printBackground": True,  # Include background graphics
-            "landscape": False,  # Portrait mode
-            "paperWidth": 8.27,  # A4 width in inches
-            "paperHeight": 11.69,  # A4 height in inches
-        })
-
-        # Save PDF
-        pdf_data = base64.b64decode(result["data"])
-        with open(path_to_output_pdf, "wb") as f:
-            f.write(pdf_data)
+        # A virtualized preview (data-virtual-preview) creates the page
+        # chrome of all pages only before printing.
+        self.test_case.execute_script(
+            "(typeof HTML2PDF4DOC !== 'undefined' && HTML2PDF4DOC.preparePrint)"
+            " && HTML2PDF4DOC.preparePrint();"
+        )
+        print_options = print_options_from_config(self.get_print_config())
+        print_to_pdf_stream(driver, path_to_output_pdf, print_options)
+        print(f"PDF saved to {path_to_output_pdf}")
+
+    def get_outline(self) -> List[Dict]:
+        """
+        The outline of the rendered document (HTML2PDF4DOC.getOutline()):
+        [{id, title, level, page}], for the PDF post-processing.
+        """
+        return self.test_case.execute_script("return HTML2PDF4DOC.getOutline();") or []
+
+    def get_page_estimate(self) -> Optional[Dict]:
+        """
+        The page count estimate of data-page-estimate="true" | "only"
+        (HTML2PDF4DOC.getPageEstimate()): {pages, min, max, ms, actualPages},
+        or None.
+        """
+        return self.test_case.execute_script("return HTML2PDF4DOC.getPageEstimate();")
+
+    def get_user_timing_measures(self) -> List[Dict]:
+        """
+        The measures of data-user-timing="true" without the "html2pdf4doc:"
+        prefix: [{name, ms}] in the order of their start.
+        """
+        return self.test_case.execute_script(
+            "return performance.getEntriesByType('measure')"
+            ".filter(entry => entry.name.startsWith('html2pdf4doc:'))"
+            ".map(entry => ({ name: entry.name.slice('html2pdf4doc:'.length), ms: entry.duration }));"
+        )
+
+    def get_memory_snapshots(self) -> Optional[List[Dict]]:
+        """
+        The snapshots of data-memory-snapshots="true"
+        (HTML2PDF4DOC.getMemorySnapshots()), or None.
+        """
+        return self.test_case.execute_script("return HTML2PDF4DOC.getMemorySnapshots();")
+
+    def get_memory_counters(self) -> Dict:
+        """
+        CDP counters of the page: Memory.getDOMCounters
+        (documents, nodes, jsEventListeners).
+        """
+        return self.test_case.driver.execute_cdp_cmd("Memory.getDOMCounters", {})
+
+    def get_layout_profile(self) -> Optional[Dict]:
+        """
+        The layout profile of data-layout-profile="true"
+        (HTML2PDF4DOC.getLayoutProfile()): {totals, stages, callers, rows},
+        or None.
+        """
+        return self.test_case.execute_script("return HTML2PDF4DOC.getLayoutProfile();")
+
+    def get_break_plan(self) -> Optional[Dict]:
+        """
+        The break plan recorded with data-break-plan-record="true"
+        (HTML2PDF4DOC.getBreakPlan()), or None.
+        """
+        self.test_case.wait_for_element_present(f"{_root_}[@success]", by=By.XPATH)
+        return self.test_case.execute_script("return HTML2PDF4DOC.getBreakPlan();")
+
+    def save_break_plan(self, path_to_output_json: str) -> Dict:
+        """
+        Saves the recorded break plan, to be passed to the next rendering
+        of the same document with data-break-plan.
+        """
+        break_plan = self.get_break_plan()
+        assert break_plan, "No break plan: the document is not rendered with data-break-plan-record"
+        with open(path_to_output_json, "w", encoding="utf-8") as file:
+            json.dump(break_plan, file)
+        return break_plan
+
+    def get_print_config(self) -> Optional[Dict]:
+        """
+        The @page box of the document in CSS px (HTML2PDF4DOC.getPrintConfig()),
+        or None if the page has no html2pdf4doc.
+        """
+        return self.test_case.execute_script(
+            "return (typeof HTML2PDF4DOC !== 'undefined' && HTML2PDF4DOC.getPrintConfig)"
+            " ? HTML2PDF4DOC.getPrintConfig() : null;"
+        )
+
+    def do_render_to_pdf_cached(
+        self,
+        path_to_html: str,
+        path_to_output_pdf: str,
+        cache: RenderCache,
+        page_range: Optional[str] = None,
+    ) -> int:
+        """
+        Renders the HTML file and prints it to PDF, unless the cache already
+        has a PDF for the same document, resources and bundle version.
+        Returns the page count.
+
+        page_range: only these pages are rendered ('3', '1-10', '5-'),
+        see data-page-range.
+        """
+        key = cache.key_for(path_to_html, extra={"page_range": page_range} if page_range else None)
+        entry = cache.get(key, path_to_output_pdf)
+        if entry is not None:
+            print(f"PDF restored from cache to {path_to_output_pdf}")
+            return entry["page_count"]
+
+        self.open_html(path_to_html, page_range=page_range)
+        self.assert_html2pdf4doc_success()
+        page_count = self.get_page_count()
+        self.do_print_page_to_pdf(path_to_output_pdf)
+        cache.put(key, path_to_output_pdf, page_count=page_count)
+        return page_count
+
+    def save_static_snapshot(self, path_to_output_html: str) -> int:
+        """
+        Saves the rendered page as a script-free HTML file
+        (HTML2PDF4DOC.getStaticSnapshot()). Returns the number of bytes written.
+        """
+        self.assert_html2pdf4doc_success()
+        return save_static_snapshot(self.test_case.driver, path_to_output_html)
+
+    def do_print_static_snapshot(self, path_to_snapshot: str, path_to_output_pdf: str) -> int:
+        """
+        Opens a static snapshot and prints it to PDF with the @page box
+        saved in the snapshot; no pagination runs. Returns the page count.
+        """
+        path_to_snapshot = os.path.abspath(path_to_snapshot)
+        self.do_open(make_file_url(os.path.dirname(path_to_snapshot), os.path.basename(path_to_snapshot)))
+        self.assert_html2pdf4doc_success()
+        print_options = print_options_from_config(get_snapshot_print_config(self.test_case.driver))
+        print_to_pdf_stream(self.test_case.driver, path_to_output_pdf, print_options)
         print(f"PDF saved to {path_to_output_pdf}")
+        return self.get_page_count()
+
+    def do_render_to_pdf_via_snapshot(
+        self,
+        path_to_html: str,
+        path_to_output_pdf: str,
+        snapshot_dir: str,
+    ) -> Dict:
+        """
+        Prints the static snapshot of the HTML file to PDF. The document is
+        rendered and the snapshot is saved only if snapshot_dir has no
+        snapshot for the same document, resources and bundle version.
+        Returns { page_count, snapshot, reused }.
+        """
+        os.makedirs(snapshot_dir, exist_ok=True)
+        path_to_snapshot = snapshot_path_for(snapshot_dir, path_to_html)
+        reused = os.path.isfile(path_to_snapshot)
+        if not reused:
+            self.open_html(path_to_html)
+            self.save_static_snapshot(path_to_snapshot)
+        page_count = self.do_print_static_snapshot(path_to_snapshot, path_to_output_pdf)
+        return {"page_count": page_count, "snapshot": path_to_snapshot, "reused": reused}
+
+    def open_html(self, path_to_html: str, page_range: Optional[str] = None) -> None:
+        """
+        Opens an HTML file; with page_range, only these pages are rendered
+        ('3', '1-10', '5-'), see data-page-range.
+        """
+        path_to_html = write_page_range_copy(path_to_html, page_range)
+        self.do_open(make_file_url(os.path.dirname(os.path.abspath(path_to_html)), os.path.basename(path_to_html)))
 
     def open_case_num(self, base_folder: str, n: int, prefix: str = "case", ext: str = "html") -> None:
         """Open a numbered HTML test case from base_folder.
@@ -152,7 +340,8 @@ class Helper:
         self.do_open(case_url(base_folder, n, prefix, ext))
 
     def open_case_allow_resource_404(self, base_folder: str, n: str, prefix: str = "case", ext: str = "html") -> None:
-        self.test_case.open(case_url(base_folder, n, prefix, ext))
+        self._layout_report = None
+        self.test_case.open(resolve_test_url(case_url(base_folder, n, prefix, ext)))
         self.test_case.wait_for_ready_state_complete()
 
     # html2pdf4doc elements
@@ -181,6 +370,32 @@ class Helper:
     def assert_html2pdf4doc_success(self) -> None:
         self.test_case.assert_attribute(_root_, 'success')
 
+    def get_page_count(self) -> Optional[int]:
+        # The [pages] attribute is set on the root together with [success].
+        pages = self.test_case.get_attribute(_root_, 'pages', by=By.XPATH)
+        return int(pages) if pages else None
+
+    def get_layout_report(self, refresh: bool = False) -> LayoutReport:
+        """
+        Layout report of the current page (HTML2PDF4DOC.getLayoutReport()).
+
+        The report is fetched in one round-trip once the rendering is
+        completed and is reused by all the layout assertions of the test.
+        """
+        if self._layout_report is not None and not refresh:
+            return self._layout_report
+        self.test_case.wait_for_element_present(f"{_root_}[@success]", by=By.XPATH)
+        report_json = self.test_case.execute_script(
+            "return JSON.stringify(HTML2PDF4DOC.getLayoutReport());"
+        )
+        assert report_json and report_json != "null", "The layout report is not available"
+        report = LayoutReport.from_json(report_json)
+        validation = report.validation
+        # A deferred validation may still be running: do not keep the report.
+        if validation is None or validation["status"] is not None or validation["mode"] == "off":
+            self._layout_report = report
+        return report
+
     #
     # Console logs
     #
@@ -213,33 +428,18 @@ class Helper:
     # Pages & Paper
 
     def get_print_area_height(self) -> int:
-        paper_body = self.test_case.find_element(
-            f'{_page_body_}',
-            by=By.XPATH,
-        )
-        return paper_body.size['height']
+        report = self.get_layout_report()
+        return report.node(_page_body_)['height']
 
     def get_print_area_width(self) -> int:
-        paper_body = self.test_case.find_elements(
-            f'{_page_body_}',
-            by=By.XPATH,
-            limit=1
-        )
-        return paper_body.size['width']
+        report = self.get_layout_report()
+        return report.node(_page_body_)['width']
 
     def _get_amount_of_virtual_paper(self) -> int:
-        all_papers = self.test_case.find_elements(
-            f'{_paper_}',
-            by=By.XPATH,
-        )
-        return len(all_papers)
+        return len(self.get_layout_report().find_all(_paper_))
 
     def _get_amount_of_virtual_pages(self) -> int:
-        all_pages = self.test_case.find_elements(
-            f'{_page_start_}',
-            by=By.XPATH,
-        )
-        return len(all_pages)
+        return len(self.get_layout_report().find_all(_page_start_))
 
     def assert_document_has_pages(
         self,
@@ -397,19 +597,17 @@ class Helper:
                 )
 
     def assert_element_starts_page(self, element_xpath: str, page_number: int, element_order: int = 1) -> None:
-        attr_value = self.test_case.get_attribute(
+        attr_value = self.get_layout_report().attribute(
             f'({_content_flow_}{element_xpath})[{element_order}]',
             'html2pdf4doc-page-start',
-            by=By.XPATH
         )
         expected = str(page_number)
         assert attr_value == expected, f"Expected html2pdf4doc-page-start='{expected}', got '{attr_value}'"
 
     def assert_element_ends_page(self, element_xpath: str, page_number: int, element_order: int = 1) -> None:
-        attr_value = self.test_case.get_attribute(
+        attr_value = self.get_layout_report().attribute(
             f'({_content_flow_}{element_xpath})[{element_order}]',
             'html2pdf4doc-page-end',
-            by=By.XPATH
         )
         expected = str(page_number)
         assert attr_value == expected, f"Expected html2pdf4doc-page-end='{expected}', got '{attr_value}'"
@@ -422,10 +620,7 @@ class Helper:
         *,
         report: bool = False,
     ) -> None:
-        element = self.test_case.find_element(
-            f'({_content_flow_}{element_xpath})[{element_order}]',
-            by=By.XPATH,
-        )
+        element = self.get_layout_report().find(f'({_content_flow_}{element_xpath})[{element_order}]')
         self._assert_element_position_on_page(element, page_number, report=report)
 
     def assert_text_on_the_page(
@@ -436,76 +631,40 @@ class Helper:
         element_order: int = 1,
         report: bool = False
     ) -> None:
-        element = self.test_case.find_element(
-            f"({_content_flow_}//*[contains(., {self._xpath_literal(text)})])[{element_order}]",
-            by=By.XPATH,
+        element = self.get_layout_report().find(
+            f"({_content_flow_}//*[contains(., {self._xpath_literal(text)})])[{element_order}]"
         )
         self._assert_element_position_on_page(element, page_number, report=report)
 
     def assert_elements_order(self, element1_xpath, element2_xpath) -> None:
-        element1 = self.test_case.find_element(
-            f'{_content_flow_}{element1_xpath}',
-            by=By.XPATH,
-        )
-        element1_y = element1.location["y"]
-        element2 = self.test_case.find_element(
-            f'{_content_flow_}{element2_xpath}',
-            by=By.XPATH,
-        )
-        element2_y = element2.location["y"]
+        layout_report = self.get_layout_report()
+        element1_y = round(layout_report.node(f'{_content_flow_}{element1_xpath}')["top"])
+        element2_y = round(layout_report.node(f'{_content_flow_}{element2_xpath}')["top"])
         assert element1_y < element2_y
 
     def _assert_element_position_on_page(
         self,
-        element,
+        element: int,
         page_number: int,
         report: bool = False
     ) -> None:
         # Check that the object is shifted to the specific page.
-        # That is, it is lower than the top of the specific page.
-        element_y = element.location["y"]
-
-        # pages
-        pages = self._get_amount_of_virtual_pages()
-
-        # page_anchor
-        if page_number == 1:
-            page_anchor = self.test_case.find_element(
-                f'{_page_start_}[@page="{page_number}"]',
-                by=By.XPATH,
-            )
-        else:
-            page_anchor = self.test_case.find_element(
-                f'{_page_start_}[@page="{page_number}"]/html2pdf4doc-virtual-paper-gap',
-                by=By.XPATH,
-            )
-        page_y = page_anchor.location["y"]
-
-        # next_page_anchor
-        if page_number < pages:
-            next_page_anchor = self.test_case.find_element(
-                f'{_page_start_}[@page="{page_number + 1}"]/html2pdf4doc-virtual-paper-gap',
-                by=By.XPATH,
-            )
-            next_page_y = next_page_anchor.location["y"]
-        else:
-            next_page_y = None
-
-        if next_page_y is not None:
-            cond1 = page_y < element_y
-            cond2 = next_page_y > element_y
-            if report:
-                print('-> page_y: ', page_y)
-                print('-> element_y: ', element_y)
-                print('-> next_page_y: ', next_page_y)
-            assert cond1 & cond2
-        else:
-            # The last page
-            cond1 = page_y < element_y
-            if report:
-                print('-> page_y: ', page_y)
-                print('-> element_y: ', element_y)
-            assert cond1
+        # That is, it is lower than the top of the specific page
+        # and higher than the top of the next one.
+        # The page is computed by the layout report from the page anchors:
+        # html2pdf4doc-page for the first page and its
+        # html2pdf4doc-virtual-paper-gap for the others.
+        layout_report = self.get_layout_report()
+        element_page = layout_report.page_of(element)
+        if report:
+            node = layout_report.node(element)
+            print('-> element: ', layout_report.describe(element))
+            print('-> element_y: ', round(node["top"]))
+            print('-> element_page: ', element_page)
+            if 1 <= page_number <= layout_report.page_count:
+                print('-> page_y: ', layout_report.page(page_number)["top"])
+        assert element_page == page_number, \
+            f"Expected {layout_report.describe(element)} on page {page_number}, got page {element_page}"
 
     def _xpath_literal(self, text: str) -> str:
         if "'" not in text:
@@ -555,10 +714,7 @@ class Helper:
 
     def assert_element_fit_height(self, element_xpath) -> None:
         # Check if the element fits in the printable area in height
-        element = self.test_case.find_element(
-            f'{_content_flow_}{element_xpath}',
-            by=By.XPATH,
-        )
+        element = self.get_layout_report().node(f'{_content_flow_}{element_xpath}')
         printAreaHeight = self.get_print_area_height()
         print('printAreaHeight', printAreaHeight)
         elementHeight = self._get_element_height(element)
@@ -567,19 +723,16 @@ class Helper:
 
     def assert_element_fit_width(self, element_xpath) -> None:
         # Check if the element fits in the printable area by width
-        element = self.test_case.find_element(
-            f'{_content_flow_}{element_xpath}',
-            by=By.XPATH,
-        )
+        element = self.get_layout_report().node(f'{_content_flow_}{element_xpath}')
         printAreaWidth = self.get_print_area_width()
         elementWidth = self._get_element_width(element)
         assert elementWidth < printAreaWidth
 
-    def _get_element_width(self, element) -> int:
-        return element.size['width']
+    def _get_element_width(self, element: Dict) -> int:
+        return element['width']
 
-    def _get_element_height(self, element) -> int:
-        return element.size['height']
+    def _get_element_height(self, element: Dict) -> int:
+        return element['height']
 
         # /*[@data-content-flow-end]
         # /html2pdf4doc-content-flow-end
@@ -0,0 +1,141 @@
+import json
+import re
+from typing import Dict, List, Optional, Union
+
+from lxml import etree
+
+# Local view of HTML2PDF4DOC.getLayoutReport().
+#
+# The report is fetched from the browser once and contains every element of
+# the document (tag, attributes, text, box, page number), the registered
+# page starts/ends and the validation findings. The elements are rebuilt
+# into an lxml tree, so the same XPath expressions that the tests pass to
+# WebDriver are answered locally, without a round-trip per assertion.
+#
+# HTML allows what XML does not: tag names such as "o:p" (Word export) are
+# kept as <html2pdf4doc-invalid-xml-name> with the original name in an
+# attribute, and the characters that XML forbids (control characters,
+# NUL) are removed from the text and the attribute values.
+
+INVALID_NAME_TAG = "html2pdf4doc-invalid-xml-name"
+INVALID_NAME_ATTRIBUTE = "data-original-tag"
+
+_XML_INVALID_CHARS_RE = re.compile("[^\u0009\u000A\u000D\u0020-\uD7FF\uE000-\uFFFD\U00010000-\U0010FFFF]")
+
+
+def _xml_text(text: str) -> str:
+    return _XML_INVALID_CHARS_RE.sub("", text)
+
+
+def _create_element(tag: str) -> etree._Element:
+    try:
+        return etree.Element(tag)
+    except ValueError:
+        element = etree.Element(INVALID_NAME_TAG)
+        element.set(INVALID_NAME_ATTRIBUTE, _xml_text(tag))
+        return element
+
+
+class LayoutReport:
+    def __init__(self, data: Dict) -> None:
+        self.data = data
+        self.nodes: List[Dict] = data["nodes"]
+        self._elements: List[etree._Element] = []
+        self._ids: Dict[etree._Element, int] = {}
+        self._tree = etree.ElementTree(self._build_tree())
+
+    @classmethod
+    def from_json(cls, text: str) -> "LayoutReport":
+        return cls(json.loads(text))
+
+    def _build_tree(self) -> etree._Element:
+        for node_id, node in enumerate(self.nodes):
+            element = _create_element(node["tag"])
+            for name, value in node["attrs"].items():
+                try:
+                    element.set(name, _xml_text(value))
+                except ValueError:
+                    # Names that are valid in HTML but not in XML
+                    # (e.g. "xlink:href" without a namespace) are skipped.
+                    pass
+            self._elements.append(element)
+            self._ids[element] = node_id
+
+        for node_id, node in enumerate(self.nodes):
+            element = self._elements[node_id]
+            last_child = None
+            for item in node["content"]:
+                if isinstance(item, str):
+                    item = _xml_text(item)
+                    if last_child is None:
+                        element.text = (element.text or "") + item
+                    else:
+                        last_child.tail = (last_child.tail or "") + item
+                else:
+                    last_child = self._elements[item]
+                    element.append(last_child)
+        return self._elements[0]
+
+    # Pages
+
+    @property
+    def success(self) -> bool:
+        return bool(self.data["success"])
+
+    @property
+    def page_count(self) -> int:
+        return self.data["pageCount"]
+
+    @property
+    def print_area(self) -> Optional[Dict]:
+        return self.data["printArea"]
+
+    @property
+    def validation(self) -> Optional[Dict]:
+        return self.data["validation"]
+
+    @property
+    def pagination_stats(self) -> Optional[Dict]:
+        return self.data.get("paginationStats")
+
+    @property
+    def memory_snapshots(self) -> Optional[List[Dict]]:
+        return self.data.get("memorySnapshots")
+
+    def page(self, page_number: int) -> Dict:
+        return self.data["pages"][page_number - 1]
+
+    # Elements
+
+    def find_all(self, xpath: str) -> List[int]:
+        """Node ids of the elements matching the XPath, in document order."""
+        result = self._tree.xpath(xpath)
+        if not isinstance(result, list):
+            raise AssertionError(f"XPath does not select elements: {xpath}")
+        return [self._ids[item] for item in result if item in self._ids]
+
+    def find(self, xpath: str) -> int:
+        found = self.find_all(xpath)
+        assert found, f"Element not found in the layout report: {xpath}"
+        return found[0]
+
+    def node(self, node_or_xpath: Union[int, str]) -> Dict:
+        if isinstance(node_or_xpath, str):
+            node_or_xpath = self.find(node_or_xpath)
+        return self.nodes[node_or_xpath]
+
+    def attribute(self, node_or_xpath: Union[int, str], name: str) -> Optional[str]:
+        return self.node(node_or_xpath)["attrs"].get(name)
+
+    def page_of(self, node_or_xpath: Union[int, str]) -> Optional[int]:
+        return self.node(node_or_xpath)["page"]
+
+    def text(self, node_or_xpath: Union[int, str]) -> str:
+        if isinstance(node_or_xpath, str):
+            node_or_xpath = self.find(node_or_xpath)
+        return "".join(self._elements[node_or_xpath].itertext())
+
+    def describe(self, node_or_xpath: Union[int, str]) -> str:
+        node = self.node(node_or_xpath)
+        attrs = " ".join(f'{name}="{value}"' for name, value in node["attrs"].items())
+        return f"<{node['tag']}{(' ' + attrs) if attrs else ''}>"
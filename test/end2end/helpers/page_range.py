@@ -0,0 +1,73 @@
+import hashlib
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+# data-page-range for documents rendered from Python.
+#
+# The config of html2pdf4doc is read from the data-* attributes of its
+# <script> tag when the page loads, so the range is written into a copy
+# of the document. The copies are written to a temporary folder of the
+# process (removed on exit), never next to the original: the source tree
+# stays clean and parallel workers do not share files. A <base> tag that
+# points to the folder of the original keeps the relative resources.
+
+PAGE_RANGE_RE = re.compile(r"^\d+(-\d*)?$")
+_BUNDLE_SCRIPT_RE = re.compile(
+    r"<script\b(?P<attrs>[^>]*\bsrc=(['\"])[^'\"]*bundle\.js\2[^>]*)>",
+    re.IGNORECASE,
+)
+_PAGE_RANGE_ATTR_RE = re.compile(r"\s+data-page-range=(['\"]).*?\1", re.IGNORECASE)
+_HEAD_RE = re.compile(r"<head\b[^>]*>", re.IGNORECASE)
+_BASE_RE = re.compile(r"<base\b", re.IGNORECASE)
+
+_COPIES_DIR = tempfile.TemporaryDirectory(prefix="html2pdf4doc-page-range-")
+
+
+def validate_page_range(page_range: str) -> str:
+    """'3', '1-10' or '5-' (to the end of the document)."""
+    page_range = page_range.replace(" ", "")
+    if not PAGE_RANGE_RE.match(page_range):
+        raise ValueError(f"Invalid page range: {page_range!r}, expected e.g. '3', '1-10' or '5-'")
+    return page_range
+
+
+def _add_base(html: str, path_to_html: str) -> str:
+    if _BASE_RE.search(html):
+        # The document resolves its resources itself.
+        return html
+    base = f'<base href="{Path(os.path.dirname(os.path.abspath(path_to_html))).as_uri()}/">'
+    html, count = _HEAD_RE.subn(lambda match: f"{match.group(0)}\n{base}", html, count=1)
+    return html if count else base + html
+
+
+def write_page_range_copy(path_to_html: str, page_range: Optional[str]) -> str:
+    """
+    Returns the path to a temporary copy of the document with data-page-range
+    set on the html2pdf4doc <script> tag, or path_to_html if no range is given.
+    """
+    if not page_range:
+        return path_to_html
+    page_range = validate_page_range(page_range)
+    with open(path_to_html, "r", encoding="utf-8") as file:
+        html = file.read()
+
+    def add_attribute(match: "re.Match") -> str:
+        attrs = _PAGE_RANGE_ATTR_RE.sub("", match.group("attrs"))
+        return f'<script{attrs} data-page-range="{page_range}">'
+
+    html, count = _BUNDLE_SCRIPT_RE.subn(add_attribute, html, count=1)
+    if count == 0:
+        raise ValueError(f"{path_to_html}: the html2pdf4doc <script> tag is not found")
+    html = _add_base(html, path_to_html)
+
+    # The documents with the same name in different folders get different copies.
+    folder = hashlib.sha256(os.path.abspath(path_to_html).encode("utf-8")).hexdigest()[:16]
+    stem, ext = os.path.splitext(os.path.basename(path_to_html))
+    path_to_copy = os.path.join(_COPIES_DIR.name, folder, f"{stem}.pages-{page_range}{ext}")
+    os.makedirs(os.path.dirname(path_to_copy), exist_ok=True)
+    with open(path_to_copy, "w", encoding="utf-8") as file:
+        file.write(html)
+    return path_to_copy
@@ -0,0 +1,189 @@
+import hashlib
+import time
+from typing import Dict, List, Optional
+
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import IndirectObject, NameObject
+
+# Post-processing of PDFs printed from html2pdf4doc documents:
+# assembling a book from many rendered documents.
+#
+# - Documents are appended one by one: only one source PDF is open at a time
+#   and its file is closed as soon as its pages are copied to the writer.
+# - Embedded font files that are byte-identical across the documents
+#   (e.g. the same font subset printed by Chrome for every chapter) are
+#   stored once.
+# - The bookmark outline is built from HTML2PDF4DOC.getOutline():
+#   TOC targets (or headings) with the page numbers html2pdf4doc computed.
+# - The page count of every PDF is checked against the [pages] attribute
+#   of the html2pdf4doc root.
+
+FONT_FILE_KEYS = ("/FontFile", "/FontFile2", "/FontFile3")
+
+
+class PageCountMismatchError(Exception):
+    pass
+
+
+def verify_page_count(path_to_pdf: str, page_count: int, expected_pages: Optional[int]) -> None:
+    """
+    Raises PageCountMismatchError if the PDF does not have the number
+    of pages html2pdf4doc rendered (the root's [pages] attribute).
+    """
+    if expected_pages is not None and page_count != expected_pages:
+        raise PageCountMismatchError(
+            f"{path_to_pdf}: the PDF has {page_count} pages, "
+            f"html2pdf4doc rendered {expected_pages}"
+        )
+
+
+def read_page_count(path_to_pdf: str) -> int:
+    with open(path_to_pdf, "rb") as file:
+        return len(PdfReader(file).pages)
+
+
+class PdfBookAssembler:
+    def __init__(self) -> None:
+        self.writer = PdfWriter()
+        self.documents: List[Dict] = []
+        self.elapsed_seconds = 0.0
+        self.deduplicated_fonts = 0
+        self.deduplicated_bytes = 0
+        # Digest of the font file content -> the first stream in the writer.
+        self._font_streams: Dict[str, IndirectObject] = {}
+
+    @property
+    def page_count(self) -> int:
+        return len(self.writer.pages)
+
+    def append(
+        self,
+        path_to_pdf: str,
+        expected_pages: Optional[int] = None,
+        outline: Optional[List[Dict]] = None,
+        title: Optional[str] = None,
+    ) -> int:
+        """
+        Appends a rendered PDF to the book and returns its page count.
+
+        expected_pages: the [pages] attribute of the document (checked).
+        outline: HTML2PDF4DOC.getOutline() of the document.
+        title: top-level bookmark of the document; the document outline
+            is nested under it.
+        """
+        started = time.perf_counter()
+        first_page_index = self.page_count
+        with open(path_to_pdf, "rb") as file:
+            reader = PdfReader(file)
+            page_count = len(reader.pages)
+            verify_page_count(path_to_pdf, page_count, expected_pages)
+            self.writer.append(reader, import_outline=False)
+            self._deduplicate_fonts(self.writer.pages[first_page_index:])
+        self._add_outline(title, outline or [], first_page_index, page_count)
+        elapsed = time.perf_counter() - started
+        self.elapsed_seconds += elapsed
+        self.documents.append({
+            "path": path_to_pdf,
+            "pages": page_count,
+            "first_page": first_page_index + 1,
+            "seconds": elapsed,
+        })
+        return page_count
+
+    def _deduplicate_fonts(self, pages) -> None:
+        for page in pages:
+            resources = page.get("/Resources")
+            fonts = resources.get_object().get("/Font") if resources is not None else None
+            if fonts is None:
+                continue
+            for font in fonts.get_object().values():
+                for descriptor in self._font_descriptors(font.get_object()):
+                    self._deduplicate_font_files(descriptor)
+
+    @staticmethod
+    def _font_descriptors(font) -> List:
+        descriptors = []
+        if "/FontDescriptor" in font:
+            descriptors.append(font["/FontDescriptor"].get_object())
+        for descendant in font.get("/DescendantFonts", []):
+            descendant = descendant.get_object()
+            if "/FontDescriptor" in descendant:
+                descriptors.append(descendant["/FontDescriptor"].get_object())
+        return descriptors
+
+    def _deduplicate_font_files(self, descriptor) -> None:
+        for key in FONT_FILE_KEYS:
+            if key not in descriptor:
+                continue
+            reference = descriptor.raw_get(key)
+            if not isinstance(reference, IndirectObject):
+                continue
+            stream = reference.get_object()
+            data = stream.get_data()
+            digest = hashlib.sha256(key.encode("ascii") + data).hexdigest()
+            known = self._font_streams.get(digest)
+            if known is None:
+                self._font_streams[digest] = reference
+            elif known.idnum != reference.idnum:
+                descriptor[NameObject(key)] = known
+                self.deduplicated_fonts += 1
+                self.deduplicated_bytes += len(data)
+
+    def _add_outline(
+        self,
+        title: Optional[str],
+        outline: List[Dict],
+        first_page_index: int,
+        page_count: int,
+    ) -> None:
+        document_item = (
+            self.writer.add_outline_item(title, first_page_index) if title else None
+        )
+        last_page_index = first_page_index + page_count - 1
+        # (level, outline item) of the open branches.
+        stack: List = []
+        for entry in outline:
+            level = int(entry.get("level") or 1)
+            page_index = first_page_index + int(entry.get("page") or 1) - 1
+            page_index = max(first_page_index, min(page_index, last_page_index))
+            while stack and stack[-1][0] >= level:
+                stack.pop()
+            parent = stack[-1][1] if stack else document_item
+            item = self.writer.add_outline_item(
+                entry.get("title") or f"Page {page_index - first_page_index + 1}",
+                page_index,
+                parent=parent,
+            )
+            stack.append((level, item))
+
+    def write(self, path_to_output_pdf: str) -> Dict:
+        """
+        Writes the book and returns the statistics (see stats()).
+        """
+        started = time.perf_counter()
+        if self.deduplicated_fonts:
+            # The replaced font streams are no longer referenced.
+            self.writer.compress_identical_objects(remove_identicals=False, remove_orphans=True)
+        with open(path_to_output_pdf, "wb") as file:
+            self.writer.write(file)
+        self.elapsed_seconds += time.perf_counter() - started
+        stats = self.stats()
+        print(  # noqa: T201
+            f"PDF book saved to {path_to_output_pdf}: "
+            f"{stats['documents']} documents, {stats['pages']} pages, "
+            f"{stats['pages_per_second']:.1f} pages/s, "
+            f"{stats['deduplicated_fonts']} duplicate font files removed"
+        )
+        return stats
+
+    def stats(self) -> Dict:
+        return {
+            "documents": len(self.documents),
+            "pages": self.page_count,
+            "seconds": self.elapsed_seconds,
+            "pages_per_second": (
+                self.page_count / self.elapsed_seconds if self.elapsed_seconds else 0.0
+            ),
+            "deduplicated_fonts": self.deduplicated_fonts,
+            "deduplicated_bytes": self.deduplicated_bytes,
+        }
@@ -0,0 +1,79 @@
+import base64
+from typing import Dict, Optional
+
+# Printing through the Chrome DevTools Protocol.
+#
+# Page.printToPDF is called with transferMode "ReturnAsStream": Chrome keeps
+# the PDF on its side and returns an IO stream handle, which is read in
+# chunks (IO.read) and written straight to the output file. The whole
+# document is never held in memory as one base64 string.
+
+CSS_PX_PER_INCH = 96
+
+# IO.read chunk size, bytes.
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Used when the page has no html2pdf4doc config (A4, as before).
+DEFAULT_PRINT_OPTIONS = {
+    "paperWidth": 8.27,
+    "paperHeight": 11.69,
+}
+
+
+def print_options_from_config(print_config: Optional[Dict]) -> Dict:
+    """
+    Converts HTML2PDF4DOC.getPrintConfig() (the @page box in CSS px)
+    to the Page.printToPDF paper size and margins (inches).
+    """
+    if not print_config:
+        return dict(DEFAULT_PRINT_OPTIONS)
+
+    def inches(key: str) -> float:
+        return float(print_config.get(key) or 0) / CSS_PX_PER_INCH
+
+    return {
+        "paperWidth": inches("width"),
+        "paperHeight": inches("height"),
+        "marginTop": inches("marginTop"),
+        "marginRight": inches("marginRight"),
+        "marginBottom": inches("marginBottom"),
+        "marginLeft": inches("marginLeft"),
+    }
+
+
+def print_to_pdf_stream(
+    driver,
+    path_to_output_pdf: str,
+    print_options: Dict,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Prints the current page to path_to_output_pdf, reading the PDF from
+    a CDP IO stream chunk by chunk. Returns the number of bytes written.
+    """
+    result = driver.execute_cdp_cmd("Page.printToPDF", {
+        "printBackground": True,  # Include background graphics
+        "landscape": False,  # Portrait mode
+        **print_options,
+        "transferMode": "ReturnAsStream",
+    })
+    handle = result["stream"]
+    written = 0
+    try:
+        with open(path_to_output_pdf, "wb") as file:
+            while True:
+                chunk = driver.execute_cdp_cmd("IO.read", {"handle": handle, "size": chunk_size})
+                data = chunk.get("data", "")
+                if data:
+                    content = (
+                        base64.b64decode(data)
+                        if chunk.get("base64Encoded")
+                        else data.encode("latin-1")
+                    )
+                    file.write(content)
+                    written += len(content)
+                if chunk.get("eof"):
+                    break
+    finally:
+        driver.execute_cdp_cmd("IO.close", {"handle": handle})
+    return written
@@ -0,0 +1,283 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import time
+from html.parser import HTMLParser
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import unquote, urlparse
+
+# Content-addressed cache for rendered PDFs.
+#
+# The key is a hash of:
+# - the HTML document itself (this includes the data-* config attributes
+#   of the html2pdf4doc <script> tag),
+# - every local resource referenced by the document (scripts, stylesheets,
+#   images, objects, CSS url()/@import targets, recursively for local CSS),
+# - src/version.js (the bundle version),
+# - optional extra parameters passed by the caller (e.g. print options).
+#
+# Entries are stored as "<key>.pdf" + "<key>.json" (metadata) in the cache
+# folder. The folder is kept under `max_size_bytes` by evicting the least
+# recently used entries.
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+VERSION_FILE = os.path.join(REPO_ROOT, "src", "version.js")
+
+DEFAULT_MAX_SIZE_BYTES = 512 * 1024 * 1024
+
+_CSS_URL_RE = re.compile(r"""url\(\s*(['"]?)(.*?)\1\s*\)""", re.IGNORECASE)
+_CSS_IMPORT_RE = re.compile(r"""@import\s+(['"])(.*?)\1""", re.IGNORECASE)
+_RESOURCE_ATTRIBUTES = ("src", "href", "xlink:href", "data", "poster")
+
+
+class _ResourceCollector(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__()
+        self.references: List[str] = []
+        self._in_style = False
+
+    def handle_starttag(self, tag, attrs):
+        self._in_style = tag == "style"
+        for name, value in attrs:
+            if not value:
+                continue
+            name = (name or "").lower()
+            if name in _RESOURCE_ATTRIBUTES:
+                # <a href> does not affect rendering.
+                if tag != "a":
+                    self.references.append(value)
+            elif name in ("srcset", "data-srcset"):
+                for candidate in value.split(","):
+                    parts = candidate.strip().split()
+                    if parts:
+                        self.references.append(parts[0])
+            elif name == "style":
+                self.references.extend(_css_references(value))
+
+    def handle_endtag(self, tag):
+        if tag == "style":
+            self._in_style = False
+
+    def handle_data(self, data):
+        if self._in_style:
+            self.references.extend(_css_references(data))
+
+
+def _css_references(css: str) -> List[str]:
+    references = [match[1] for match in _CSS_URL_RE.findall(css)]
+    references.extend(match[1] for match in _CSS_IMPORT_RE.findall(css))
+    return references
+
+
+def _resolve_local_path(reference: str, base_folder: str) -> Optional[str]:
+    reference = reference.strip()
+    if not reference or reference.startswith(("#", "data:", "about:", "javascript:")):
+        return None
+    parsed = urlparse(reference)
+    if parsed.scheme in ("http", "https", "blob"):
+        # Remote resources are not part of the key.
+        return None
+    if parsed.scheme == "file":
+        return os.path.normpath(unquote(parsed.path))
+    if parsed.scheme and len(parsed.scheme) > 1:
+        return None
+    path = unquote(parsed.path)
+    if not path:
+        return None
+    return os.path.normpath(os.path.join(base_folder, path))
+
+
+def _hash_file(hasher, path: str) -> bytes:
+    with open(path, "rb") as file:
+        content = file.read()
+    hasher.update(content)
+    return content
+
+
+def _relative_path(path: str, folder: str) -> str:
+    try:
+        return os.path.relpath(path, folder).replace(os.sep, "/")
+    except ValueError:
+        # Windows: another drive.
+        return path
+
+
+def compute_document_key(
+    html_path: str,
+    extra: Optional[Dict] = None,
+    version_file: str = VERSION_FILE,
+) -> str:
+    """
+    Returns the content hash of the document, its local resources,
+    the bundle version and the optional extra parameters.
+    """
+    hasher = hashlib.sha256()
+    visited = set()
+    document_folder = os.path.dirname(os.path.abspath(html_path))
+
+    def visit(path: str, kind: str) -> None:
+        path = os.path.abspath(path)
+        if path in visited:
+            return
+        visited.add(path)
+        # The paths of the resources are hashed relative to the document,
+        # so the key does not change when the checkout (or a copy of the
+        # document with its resources) is in another folder. The document
+        # and the version file are identified by their content only.
+        name = _relative_path(path, document_folder) if kind == "resource" else ""
+        hasher.update(f"\0{kind}:{name}\0".encode("utf-8"))
+        if not os.path.isfile(path):
+            hasher.update(b"<missing>")
+            return
+        content = _hash_file(hasher, path)
+        base_folder = os.path.dirname(path)
+        references: Iterable[str] = ()
+        if kind == "html":
+            collector = _ResourceCollector()
+            collector.feed(content.decode("utf-8", errors="replace"))
+            references = collector.references
+        elif path.lower().endswith(".css"):
+            references = _css_references(content.decode("utf-8", errors="replace"))
+        for reference in references:
+            local_path = _resolve_local_path(reference, base_folder)
+            if local_path is not None:
+                visit(local_path, "resource")
+
+    visit(html_path, "html")
+    visit(version_file, "version")
+    if extra:
+        hasher.update(json.dumps(extra, sort_keys=True, default=str).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+class RenderCache:
+    def __init__(
+        self,
+        cache_dir: str,
+        max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES,
+        version_file: str = VERSION_FILE,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.max_size_bytes = max_size_bytes
+        self.version_file = version_file
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key_for(self, html_path: str, extra: Optional[Dict] = None) -> str:
+        return compute_document_key(html_path, extra=extra, version_file=self.version_file)
+
+    def _pdf_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pdf")
+
+    def _meta_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str, path_to_output_pdf: Optional[str] = None) -> Optional[Dict]:
+        """
+        Returns the metadata of a cached entry (and copies the PDF to
+        path_to_output_pdf if given), or None on a miss.
+        """
+        pdf_path = self._pdf_path(key)
+        meta_path = self._meta_path(key)
+        if not (os.path.isfile(pdf_path) and os.path.isfile(meta_path)):
+            self.misses += 1
+            return None
+        try:
+            with open(meta_path, "r", encoding="utf-8") as file:
+                meta = json.load(file)
+        except (OSError, ValueError):
+            # A broken entry is treated as a miss and dropped.
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        # Touch both files: the access time drives the LRU eviction.
+        now = time.time()
+        for path in (pdf_path, meta_path):
+            os.utime(path, (now, now))
+        if path_to_output_pdf is not None:
+            shutil.copyfile(pdf_path, path_to_output_pdf)
+        self.hits += 1
+        meta["pdf_path"] = pdf_path
+        return meta
+
+    def put(self, key: str, path_to_pdf: str, page_count: Optional[int] = None, **meta) -> Dict:
+        """
+        Stores a rendered PDF with its page count and evicts old entries
+        if the cache grows over max_size_bytes.
+        """
+        pdf_path = self._pdf_path(key)
+        tmp_path = f"{pdf_path}.tmp"
+        shutil.copyfile(path_to_pdf, tmp_path)
+        os.replace(tmp_path, pdf_path)
+        entry = {
+            "key": key,
+            "page_count": page_count,
+            "size": os.path.getsize(pdf_path),
+            "created": time.time(),
+            **meta,
+        }
+        with open(self._meta_path(key), "w", encoding="utf-8") as file:
+            json.dump(entry, file)
+        self._evict(keep=key)
+        return entry
+
+    def _entries(self) -> List[Dict]:
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".pdf"):
+                continue
+            key = name[:-len(".pdf")]
+            pdf_path = self._pdf_path(key)
+            meta_path = self._meta_path(key)
+            try:
+                size = os.path.getsize(pdf_path)
+                if os.path.isfile(meta_path):
+                    size += os.path.getsize(meta_path)
+                last_access = os.path.getmtime(pdf_path)
+            except OSError:
+                continue
+            entries.append({"key": key, "size": size, "last_access": last_access})
+        return entries
+
+    def size_bytes(self) -> int:
+        return sum(entry["size"] for entry in self._entries())
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        entries = sorted(self._entries(), key=lambda entry: entry["last_access"])
+        total = sum(entry["size"] for entry in entries)
+        for entry in entries:
+            if total <= self.max_size_bytes:
+                break
+            if entry["key"] == keep:
+                continue
+            self._remove(entry["key"])
+            total -= entry["size"]
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        for path in (self._pdf_path(key), self._meta_path(key)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def clear(self) -> None:
+        for entry in self._entries():
+            self._remove(entry["key"])
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            "entries": len(self._entries()),
+            "size_bytes": self.size_bytes(),
+            "max_size_bytes": self.max_size_bytes,
+        }
@@ -0,0 +1,59 @@
+import json
+import os
+from typing import Dict, Optional
+
+from test.end2end.helpers.render_cache import VERSION_FILE, compute_document_key
+
+# Static snapshots (HTML2PDF4DOC.getStaticSnapshot(), see src/snapshot.js).
+#
+# A snapshot is the rendered document serialized without scripts: printing
+# it does not run the pagination again. Snapshots are stored as
+# "<key>.html" in a folder, where the key is the content hash of the source
+# document, its local resources and the bundle version (see render_cache.py).
+# A snapshot is reused until one of them changes; the snapshots of old
+# versions are not removed.
+
+# The meta tags written by src/snapshot.js.
+SNAPSHOT_META = "html2pdf4doc-snapshot"
+PRINT_CONFIG_META = "html2pdf4doc-print-config"
+
+
+def snapshot_path_for(
+    snapshot_dir: str,
+    path_to_html: str,
+    extra: Optional[Dict] = None,
+    version_file: str = VERSION_FILE,
+) -> str:
+    key = compute_document_key(path_to_html, extra=extra, version_file=version_file)
+    return os.path.join(snapshot_dir, f"{key}.html")
+
+
+def save_static_snapshot(driver, path_to_output_html: str) -> int:
+    """
+    Writes the snapshot of the rendered page to path_to_output_html.
+    Returns the number of bytes written.
+    """
+    snapshot = driver.execute_script(
+        "return (typeof HTML2PDF4DOC !== 'undefined' && HTML2PDF4DOC.getStaticSnapshot)"
+        " ? HTML2PDF4DOC.getStaticSnapshot() : null;"
+    )
+    if snapshot is None:
+        raise RuntimeError("No static snapshot: the page is not rendered by html2pdf4doc")
+    content = snapshot.encode("utf-8")
+    tmp_path = f"{path_to_output_html}.tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(content)
+    os.replace(tmp_path, path_to_output_html)
+    return len(content)
+
+
+def get_snapshot_print_config(driver) -> Optional[Dict]:
+    """
+    The @page box saved in the snapshot opened in the driver
+    (the same as HTML2PDF4DOC.getPrintConfig() of the rendered page).
+    """
+    content = driver.execute_script(
+        f"const meta = document.querySelector('meta[name=\"{PRINT_CONFIG_META}\"]');"
+        " return meta ? meta.getAttribute('content') : null;"
+    )
+    return json.loads(content) if content else None
@@ -0,0 +1,86 @@
+import { expect } from 'chai';
+import { JSDOM } from 'jsdom';
+import DocumentObjectModel from '../../src/DOM.js';
+import {
+  cloneAndCleanOutsideRange,
+  cloneSlicesBySplitPoints,
+} from '../../src/node/modules/slicers.js';
+
+// * cloneSlicesBySplitPoints() walks the root once (data-single-pass-slicing);
+// * every slice must be the same as cloneAndCleanOutsideRange() for its range.
+
+const FIXTURES = {
+  'flat children': `
+    <p id="a">A</p> <p id="b">B</p> text <p id="c">C</p><p id="d">D</p>`,
+  'nested split points': `
+    <div id="a">before
+      <section id="b"><p id="c">C</p> between <p id="d">D</p><!-- comment --></section>
+      after <p id="e">E</p>
+    </div>
+    tail <p id="f">F</p>`,
+  'points at different depths': `
+    <ul id="a"><li id="b"><span id="c">C</span><span id="d">D</span></li><li id="e">E</li></ul>
+    <div id="f"><div id="g"><div id="h"><b id="i">I</b> deep</div></div> text <i id="j">J</i></div>
+    <p id="k">K</p>`,
+};
+
+const POINTS = {
+  'flat children': [['b'], ['b', 'c'], ['a', 'b', 'c', 'd'], ['d']],
+  'nested split points': [['c'], ['d'], ['c', 'd'], ['b', 'd', 'e'], ['d', 'f'], ['e', 'f']],
+  'points at different depths': [['c', 'd'], ['d', 'e', 'i'], ['b', 'g', 'j'], ['i', 'k'], ['h', 'j', 'k']],
+};
+
+describe('cloneSlicesBySplitPoints', () => {
+  let dom;
+  let context;
+
+  beforeEach(() => {
+    dom = new JSDOM(`<!DOCTYPE html><html><body></body></html>`);
+    global.window = dom.window;
+    global.document = dom.window.document;
+    global.Node = dom.window.Node;
+    context = {
+      _config: { singlePassSlicing: true },
+      _debug: {},
+      _DOM: new DocumentObjectModel({ DOM: dom.window.document, config: {} }),
+    };
+  });
+
+  afterEach(() => {
+    delete global.window;
+    delete global.document;
+    delete global.Node;
+  });
+
+  const createRoot = (html) => {
+    const root = document.createElement('td');
+    root.innerHTML = html;
+    document.body.appendChild(root);
+    return root;
+  };
+
+  const cloneEachRange = (root, points) => points
+    .concat(null)
+    .map((point, i) => cloneAndCleanOutsideRange(root, points[i - 1] ?? null, point));
+
+  for (const [name, html] of Object.entries(FIXTURES)) {
+    for (const ids of POINTS[name]) {
+      it(`matches one clone per range: ${name}, split at ${ids.join(', ')}`, () => {
+        const root = createRoot(html);
+        const points = ids.map(id => root.querySelector(`#${id}`));
+        const rootBefore = root.outerHTML;
+
+        const expected = cloneEachRange(root, points).map(clone => clone.outerHTML);
+        // * The single pass does not fall back to the clone per range.
+        context.cloneAndCleanOutsideRange = () => {
+          throw new Error('cloneAndCleanOutsideRange() is not expected');
+        };
+        const slices = cloneSlicesBySplitPoints.call(context, root, points);
+
+        expect(slices.map(slice => slice.outerHTML)).to.deep.equal(expected);
+        expect(root.outerHTML).to.equal(rootBefore);
+      });
+    }
+  }
+
+});
@@ -33,6 +33,11 @@ export default {
     minimizer: [
       new TerserPlugin({
         extractComments: false,
+        terserOptions: {
+          // * Class names appear in the stack frames read by the layout profile
+          // * (src/layoutProfiler.js).
+          keep_classnames: true,
+        },
       }),
     ],
   },
@@ -5,6 +5,9 @@ import packageJson from './package.json' with { type: "json" };
 
 export default merge(common, {
   mode: 'production',
+  // * dist/bundle.js.map: CPU profiles of the minified bundle are attributed
+  // * to the src/ modules with it (see test/benchmark/cpu_profile.py).
+  devtool: 'source-map',
   plugins: [
     new webpack.BannerPlugin({
       banner: `/*! Version: ${packageJson.version} */`,